@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
 import logging
 import os
 import time
+from typing import Any, Callable
 
 from bot.config import load_config
 from bot.discord_api import app_commands, discord
@@ -19,7 +20,14 @@ from features.runtime_mixins import (
 )
 from services.leveling_service import LevelingService
 from services.persistence_service import RepositoryPersistence
-from discord.task_registry import DebouncedGuildUpdater, SingletonTaskRegistry
+from utils.due_queue import DueQueue
+from utils.metrics import DurationMetrics
+from discord.channel_cache import ChannelResolutionCache
+from discord.member_names import MemberNameCache
+from discord.message_handles import MessageHandleCache
+from discord.role_sync import RoleSyncEngine
+from discord.scheduler import PeriodicScheduler
+from discord.task_registry import CoalescingTaskQueue, DebouncedGuildUpdater, KeyedDebouncer, SingletonTaskRegistry
 from utils.runtime_helpers import *  # noqa: F401,F403
 
 
@@ -41,10 +49,18 @@ class RewriteDiscordBot(
         self.persistence = RepositoryPersistence(config)
         self.tree = app_commands.CommandTree(self)
         self.task_registry = SingletonTaskRegistry()
+        self.scheduler = PeriodicScheduler(registry=self.task_registry)
         self.raidlist_updater = DebouncedGuildUpdater(
             self._refresh_raidlist_for_guild_persisted,
             debounce_seconds=1.5,
             cooldown_seconds=0.8,
+            max_wait_seconds=RAIDLIST_MAX_WAIT_SECONDS,
+            max_concurrency=RAIDLIST_UPDATE_CONCURRENCY,
+        )
+        self.raid_ui_updater = KeyedDebouncer(
+            self._run_raid_ui_update,
+            debounce_seconds=RAID_UI_DEBOUNCE_SECONDS,
+            max_wait_seconds=RAID_UI_MAX_WAIT_SECONDS,
         )
         self.leveling_service = LevelingService()
 
@@ -68,6 +84,26 @@ class RewriteDiscordBot(
         self._guild_feature_settings: dict[int, GuildFeatureSettings] = {}
         self._acked_interactions: set[int] = set()
         self._raidlist_hash_by_guild: dict[int, str] = {}
+        self._raid_calendar_hash_by_guild: dict[int, str] = {}
+        self._raid_calendar_month_key_by_guild: dict[int, int] = {}
+        # guild_id -> (month key, calendar version, today, guild name) -> rendered calendar.
+        self._raid_calendar_renders: dict[int, OrderedDict[tuple[Any, ...], tuple[Any, str, list[str]]]] = {}
+        self._planner_renders: dict[int, PlannerRender] = {}
+        self._raidlist_fields: dict[int, tuple[tuple[int, str], RaidlistFieldRender]] = {}
+        # guild_id -> (version vector, valid until, payload hash, debug payload) of the last render.
+        self._raidlist_render_state: dict[int, tuple[tuple[Any, ...], float | None, str, Callable[[], str]]] = {}
+        self._message_handles = MessageHandleCache()
+        self._member_names = MemberNameCache()
+        self._channel_cache = ChannelResolutionCache()
+        self._role_sync = RoleSyncEngine()
+        self._metrics = DurationMetrics()
+        self._vote_ui_pipeline = CoalescingTaskQueue()
+        self._vote_ui_waiters: dict[int, list[tuple[object, float]]] = {}
+        self._purge_semaphores: dict[int, asyncio.Semaphore] = {}
+        self._reminder_queue: DueQueue[int] = DueQueue()
+        self._reminder_wakeup = asyncio.Event()
+        # Seeded from the repository on first use, after persisted state is loaded.
+        self._stale_raid_expiry: DueQueue[int] | None = None
         self._username_sync_next_run_by_guild: dict[int, float] = {}
         self._level_state_dirty = False
         self._last_level_persist_monotonic = time.monotonic()
@@ -81,6 +117,21 @@ class RewriteDiscordBot(
         register_runtime_commands(self)
 
     async def close(self) -> None:
+        try:
+            # Let acked votes reach Discord and the DB before shutting down.
+            if not await self._vote_ui_pipeline.drain(timeout=10):
+                log.warning("Pending vote UI updates did not settle before shutdown.")
+            await self._vote_ui_pipeline.cancel_all()
+        except Exception:
+            log.exception("Failed to drain vote UI pipeline during shutdown.")
+        try:
+            await self.raid_ui_updater.shutdown(flush=True, timeout=10)
+        except Exception:
+            log.exception("Failed to flush debounced raid UI updates during shutdown.")
+        try:
+            await self.raidlist_updater.cancel_all()
+        except Exception:
+            log.exception("Failed to cancel pending raidlist refreshes during shutdown.")
         try:
             async with self._state_lock:
                 await self._flush_level_state_if_due(force=True)
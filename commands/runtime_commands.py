@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import logging
 import random
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from utils.localization import get_lang, get_string
 from utils.runtime_helpers import (
     DEFAULT_PRIVILEGED_USER_ID,
+    PURGE_PROGRESS_INTERVAL_SECONDS,
     _admin_or_privileged_check,
     _on_off,
+    _safe_edit_original_response,
     _safe_followup,
     _safe_send_initial,
     _settings_embed,
@@ -243,6 +246,7 @@ def register_runtime_commands(bot: "RewriteDiscordBot") -> None:
             self_test_ok=self_test_ok,
             self_test_err=self_test_err,
             language=language,
+            worker_status=bot.task_registry.status(),
         )
         
         sent = await _safe_send_initial(interaction, None, ephemeral=True, embed=embed)
@@ -479,36 +483,44 @@ def register_runtime_commands(bot: "RewriteDiscordBot") -> None:
                 if channel.permissions_for(me).read_message_history
             ]
 
-        total_deleted = 0
-        touched_channels = 0
         scan_history = scope == "channel"
         scan_limit = limit if scan_history else min(limit, 150)
+        sweep_channels: list[Any] = []
         for channel in channels:
             try:
                 perms = channel.permissions_for(me)
-                if not (perms.read_message_history and perms.manage_messages):
-                    continue
-                deleted_here = await bot._delete_bot_messages_in_channel(
-                    channel,
-                    history_limit=scan_limit,
-                    scan_history=scan_history,
-                )
-                if deleted_here > 0:
-                    total_deleted += deleted_here
-                    touched_channels += 1
             except Exception:
-                log.exception(
-                    "purgebot failed for channel_id=%s guild_id=%s",
-                    getattr(channel, "id", None),
-                    getattr(interaction.guild, "id", None),
-                )
+                log.exception("purgebot permission check failed for channel_id=%s", getattr(channel, "id", None))
                 continue
+            if perms.read_message_history and perms.manage_messages:
+                sweep_channels.append(channel)
+
+        last_progress_at = time.monotonic()
+
+        async def _report_progress(finished: int, total: int, deleted: int) -> None:
+            nonlocal last_progress_at
+            now = time.monotonic()
+            if finished >= total or now - last_progress_at < PURGE_PROGRESS_INTERVAL_SECONDS:
+                return
+            last_progress_at = now
+            await _safe_edit_original_response(
+                interaction,
+                content=f"Bereinigung laeuft: {finished}/{total} Channel(s), {deleted} Bot-Nachrichten zum Loeschen angefragt ...",
+            )
+
+        total_deleted, touched_channels = await bot._purge_bot_messages_in_channels(
+            int(interaction.guild.id),
+            sweep_channels,
+            history_limit=scan_limit,
+            scan_history=scan_history,
+            on_progress=_report_progress if len(sweep_channels) > 1 else None,
+        )
 
         where = "aktueller Channel" if scope == "channel" else f"{touched_channels} Channel(s)"
         await _safe_followup(
             interaction,
             (
-                f"{total_deleted} Bot-Nachrichten geloescht ({where}, "
+                f"{total_deleted} Bot-Nachrichten zum Loeschen angefragt ({where}, "
                 f"Limit je Channel: {scan_limit}, History-Scan: {'an' if scan_history else 'reduziert'})."
             ),
             ephemeral=True,
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, Iterable, List, Optional, Tuple
 
+from utils.slot_times import SlotTimeTable
+from utils.slots import QualifiedSlotIndex, SlotDelta
+
 
 @dataclass(slots=True)
 class DungeonRecord:
@@ -128,6 +131,20 @@ class InMemoryRepository:
         self._debug_cache_keys_by_kind: Dict[str, set[str]] = {}
         self._debug_cache_keys_by_kind_guild: Dict[Tuple[str, int], set[str]] = {}
         self._debug_cache_keys_by_kind_guild_raid: Dict[Tuple[str, int, int | None], set[str]] = {}
+        # Per-raid render version; values come from one sequence that survives reset() so a
+        # reloaded raid never reuses a version a render cache may still hold.
+        self._raid_versions: Dict[int, int] = {}
+        self._raid_version_seq = 0
+        # raid_id -> (raid version it is current for, incrementally maintained qualified slots).
+        self._slot_indexes: Dict[int, Tuple[int, QualifiedSlotIndex]] = {}
+        # raid_id -> slot deltas not yet consumed; None means they are incomplete and a full sync is due.
+        self._slot_deltas: Dict[int, Dict[Tuple[str, str], SlotDelta] | None] = {}
+        # raid_id -> parsed day/time labels and slot start instants; rebuilt when options are added.
+        self._slot_times: Dict[int, SlotTimeTable] = {}
+        # guild_id -> calendar date -> raids with a day option on that date; kept in step with options.
+        self._calendar_index: Dict[int, Dict[date, set[int]]] = {}
+        # guild_id -> calendar version, drawn from the raid version sequence.
+        self._calendar_versions: Dict[int, int] = {}
 
         self._raid_id = 1
         self._option_id = 1
@@ -152,6 +169,12 @@ class InMemoryRepository:
         self._debug_cache_keys_by_kind.clear()
         self._debug_cache_keys_by_kind_guild.clear()
         self._debug_cache_keys_by_kind_guild_raid.clear()
+        self._raid_versions.clear()
+        self._slot_indexes.clear()
+        self._slot_deltas.clear()
+        self._slot_times.clear()
+        self._calendar_index.clear()
+        self._calendar_versions.clear()
 
         self._raid_id = 1
         self._option_id = 1
@@ -177,6 +200,63 @@ class InMemoryRepository:
             )
         self._rebuild_vote_index()
         self._rebuild_debug_cache_indices()
+        self._raid_versions.clear()
+        for raid_id in self.raids:
+            self.bump_raid_version(raid_id)
+        self._slot_times.clear()
+        self._calendar_index.clear()
+        for raid_id in self.raids:
+            self._index_raid_dates(raid_id)
+
+    def raid_version(self, raid_id: int) -> int:
+        return self._raid_versions.get(int(raid_id), 0)
+
+    def bump_raid_version(self, raid_id: int) -> int:
+        """Mark a raid's votes, options or message reference as changed."""
+        self._raid_version_seq += 1
+        self._raid_versions[int(raid_id)] = self._raid_version_seq
+        return self._raid_version_seq
+
+    def calendar_version(self, guild_id: int) -> int:
+        return self._calendar_versions.get(int(guild_id), 0)
+
+    def _bump_calendar_version(self, guild_id: int) -> None:
+        self._raid_version_seq += 1
+        self._calendar_versions[int(guild_id)] = self._raid_version_seq
+
+    def _index_raid_dates(self, raid_id: int) -> None:
+        raid = self.raids.get(raid_id)
+        if raid is None:
+            return
+        by_date = self._calendar_index.setdefault(raid.guild_id, {})
+        for parsed_date in self.slot_times(raid_id).day_dates.values():
+            if parsed_date is not None:
+                by_date.setdefault(parsed_date, set()).add(raid_id)
+        self._bump_calendar_version(raid.guild_id)
+
+    def _unindex_raid_dates(self, guild_id: int, raid_id: int) -> None:
+        by_date = self._calendar_index.get(guild_id)
+        if by_date:
+            for parsed_date, raid_ids in list(by_date.items()):
+                raid_ids.discard(raid_id)
+                if not raid_ids:
+                    del by_date[parsed_date]
+        self._bump_calendar_version(guild_id)
+
+    def raid_ids_by_date(self, guild_id: int, *, start: date, end: date) -> Dict[date, List[int]]:
+        """Open raids of ``guild_id`` per day option date within ``start``..``end`` (inclusive)."""
+        result: Dict[date, List[int]] = {}
+        for parsed_date, raid_ids in self._calendar_index.get(int(guild_id), {}).items():
+            if parsed_date < start or parsed_date > end:
+                continue
+            open_ids = sorted(
+                raid_id
+                for raid_id in raid_ids
+                if (raid := self.raids.get(raid_id)) is not None and raid.status == "open"
+            )
+            if open_ids:
+                result[parsed_date] = open_ids
+        return result
 
     @staticmethod
     def _vote_key(*, raid_id: int, kind: str, option_label: str, user_id: int) -> Tuple[int, str, str, int]:
@@ -308,11 +388,14 @@ class InMemoryRepository:
         )
         self.raids[row.id] = row
         self._raid_id += 1
+        self.bump_raid_version(row.id)
+        self._bump_calendar_version(row.guild_id)
         return row
 
     def set_raid_message_id(self, raid_id: int, message_id: int) -> None:
         raid = self.raids[raid_id]
         raid.message_id = message_id
+        self.bump_raid_version(raid_id)
 
     def get_raid(self, raid_id: int) -> RaidRecord | None:
         return self.raids.get(raid_id)
@@ -331,6 +414,17 @@ class InMemoryRepository:
         for time_label in times:
             self.raid_options[self._option_id] = RaidOptionRecord(id=self._option_id, raid_id=raid_id, kind="time", label=time_label)
             self._option_id += 1
+        self.bump_raid_version(raid_id)
+        self._slot_times[raid_id] = SlotTimeTable.build(*self.list_raid_options(raid_id))
+        self._index_raid_dates(raid_id)
+
+    def slot_times(self, raid_id: int) -> SlotTimeTable:
+        """Parsed option labels of ``raid_id`` with the UTC start of each day/time slot."""
+        table = self._slot_times.get(raid_id)
+        if table is None:
+            table = SlotTimeTable.build(*self.list_raid_options(raid_id))
+            self._slot_times[raid_id] = table
+        return table
 
     def list_raid_options(self, raid_id: int) -> tuple[List[str], List[str]]:
         days = [row.label for row in self.raid_options.values() if row.raid_id == raid_id and row.kind == "day"]
@@ -340,6 +434,15 @@ class InMemoryRepository:
     def toggle_vote(self, *, raid_id: int, kind: str, option_label: str, user_id: int) -> None:
         vote_key = self._vote_key(raid_id=raid_id, kind=kind, option_label=option_label, user_id=user_id)
         existing_id = self._vote_id_by_key.get(vote_key)
+        previous_version = self.raid_version(raid_id)
+        self._apply_vote_to_slot_index(
+            raid_id,
+            previous_version=previous_version,
+            kind=kind,
+            option_label=option_label,
+            user_id=user_id,
+            added=existing_id is None,
+        )
         if existing_id is not None:
             self.raid_votes.pop(existing_id, None)
             self._vote_id_by_key.pop(vote_key, None)
@@ -374,6 +477,83 @@ class InMemoryRepository:
             users.add(row.user_id)
         return day_users, time_users
 
+    def _apply_vote_to_slot_index(
+        self,
+        raid_id: int,
+        *,
+        previous_version: int,
+        kind: str,
+        option_label: str,
+        user_id: int,
+        added: bool,
+    ) -> None:
+        version = self.bump_raid_version(raid_id)
+        entry = self._slot_indexes.get(raid_id)
+        if entry is None or entry[0] != previous_version:
+            self._slot_indexes.pop(raid_id, None)
+            self._slot_deltas[raid_id] = None
+            return
+        index = entry[1]
+        deltas = index.toggle(kind=str(kind), label=str(option_label), user_id=int(user_id), added=added)
+        self._slot_indexes[raid_id] = (version, index)
+        if raid_id in self._slot_deltas and self._slot_deltas[raid_id] is None:
+            return
+        pending = self._slot_deltas.get(raid_id)
+        if pending is None:
+            pending = {}
+            self._slot_deltas[raid_id] = pending
+        for delta in deltas:
+            previous = pending.get((delta.day, delta.time))
+            if previous is not None and previous.change == "qualified" and delta.change == "changed":
+                delta.change = "qualified"
+            pending[(delta.day, delta.time)] = delta
+
+    def take_slot_deltas(self, raid_id: int) -> List[SlotDelta] | None:
+        """Pop the slot changes since the last call; ``None`` when only a full sync is reliable."""
+        if raid_id not in self._slot_deltas:
+            return []
+        pending = self._slot_deltas.pop(raid_id)
+        return list(pending.values()) if pending is not None else None
+
+    def restore_slot_deltas(self, raid_id: int, deltas: Iterable[SlotDelta]) -> None:
+        """Put back deltas a sync could not apply; newer pending changes for the same slot win."""
+        if raid_id in self._slot_deltas and self._slot_deltas[raid_id] is None:
+            return
+        pending = self._slot_deltas.get(raid_id)
+        if pending is None:
+            pending = {}
+            self._slot_deltas[raid_id] = pending
+        for delta in deltas:
+            pending.setdefault((delta.day, delta.time), delta)
+
+    def qualified_slot_users(
+        self,
+        raid_id: int,
+        *,
+        threshold: int,
+    ) -> tuple[Dict[Tuple[str, str], List[int]], set[int]]:
+        """Qualified day/time slots of ``raid_id``; rebuilt only when toggles could not keep them current."""
+        version = self.raid_version(raid_id)
+        entry = self._slot_indexes.get(raid_id)
+        if entry is None or entry[0] != version or entry[1].threshold != int(threshold):
+            days, times = self.list_raid_options(raid_id)
+            day_users, time_users = self.vote_user_sets(raid_id)
+            entry = (
+                version,
+                QualifiedSlotIndex(
+                    days=days,
+                    times=times,
+                    day_users=day_users,
+                    time_users=time_users,
+                    threshold=threshold,
+                ),
+            )
+            self._slot_indexes[raid_id] = entry
+            if raid_id in self._slot_deltas:
+                self._slot_deltas[raid_id] = None
+        qualified, users = entry[1].snapshot()
+        return dict(qualified), set(users)
+
     def list_posted_slots(self, raid_id: int) -> Dict[Tuple[str, str], RaidPostedSlotRecord]:
         out: Dict[Tuple[str, str], RaidPostedSlotRecord] = {}
         for row in self.raid_posted_slots.values():
@@ -497,7 +677,13 @@ class InMemoryRepository:
             return
 
         for raid_id in raid_ids:
-            self.raids.pop(raid_id, None)
+            raid = self.raids.pop(raid_id, None)
+            if raid is not None:
+                self._unindex_raid_dates(raid.guild_id, raid_id)
+            self._raid_versions.pop(raid_id, None)
+            self._slot_indexes.pop(raid_id, None)
+            self._slot_deltas.pop(raid_id, None)
+            self._slot_times.pop(raid_id, None)
 
         if self.raid_options:
             self.raid_options = {k: v for k, v in self.raid_options.items() if v.raid_id not in raid_ids}
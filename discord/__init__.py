@@ -7,7 +7,16 @@ from discord.safety import (
     safe_followup,
     safe_send_initial,
 )
-from discord.task_registry import DebouncedGuildUpdater, SingletonTaskRegistry
+from discord.channel_cache import ChannelResolutionCache
+from discord.member_names import MemberNameCache
+from discord.message_handles import MessageHandleCache
+from discord.role_sync import RoleSyncEngine
+from discord.task_registry import (
+    CoalescingTaskQueue,
+    DebouncedGuildUpdater,
+    KeyedDebouncer,
+    SingletonTaskRegistry,
+)
 
 __all__ = [
     "InteractionAcker",
@@ -17,6 +26,12 @@ __all__ = [
     "safe_edit_message",
     "safe_followup",
     "safe_send_initial",
+    "ChannelResolutionCache",
+    "CoalescingTaskQueue",
     "DebouncedGuildUpdater",
+    "KeyedDebouncer",
+    "MemberNameCache",
+    "MessageHandleCache",
+    "RoleSyncEngine",
     "SingletonTaskRegistry",
 ]
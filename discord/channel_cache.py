@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import Any, Callable
+
+
+class ChannelResolutionCache:
+    """TTL cache for channels resolved via REST, including negative entries.
+
+    Only covers the ``fetch_channel`` fallback; channels in the gateway cache are
+    always looked up live. Negative entries expire sooner so a channel that becomes
+    accessible again is picked up without an invalidation event.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 60.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.negative_ttl_seconds = max(0.0, float(negative_ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[float, Any | None]] = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, channel_id: int) -> tuple[bool, Any | None]:
+        key = int(channel_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        expires_at, channel = entry
+        if self._clock() >= expires_at:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        if channel is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, channel
+
+    def store(self, channel_id: int, channel: Any) -> None:
+        self._put(int(channel_id), channel, self.ttl_seconds)
+
+    def store_missing(self, channel_id: int) -> None:
+        self._put(int(channel_id), None, self.negative_ttl_seconds)
+
+    def _put(self, key: int, channel: Any | None, ttl: float) -> None:
+        if key <= 0 or ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, channel)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, channel_id: int) -> None:
+        if self._entries.pop(int(channel_id), None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable
+
+
+class MemberNameCache:
+    """Per-guild display names with pre-computed casefold sort keys.
+
+    Rendered name lists are memoised per guild by the caller's key (typically a
+    frozen set of user ids). Renaming a known member drops that guild's memo and
+    bumps its generation, so callers caching whole embeds can key them on it.
+    """
+
+    def __init__(self, *, max_renders_per_guild: int = 256) -> None:
+        self.max_renders_per_guild = max(1, int(max_renders_per_guild))
+        self._names: dict[int, dict[int, tuple[str, str]]] = {}
+        self._renders: dict[int, OrderedDict[Hashable, str]] = {}
+        self._generations: dict[int, int] = {}
+
+    def generation(self, guild_id: int) -> int:
+        return self._generations.get(int(guild_id), 0)
+
+    def _invalidate_guild(self, guild_id: int) -> None:
+        self._renders.pop(int(guild_id), None)
+        self._generations[int(guild_id)] = self.generation(guild_id) + 1
+
+    def label(self, guild_id: int, user_id: int) -> tuple[str, str] | None:
+        """Return ``(display_name, casefold_key)`` or ``None`` when unknown."""
+        names = self._names.get(int(guild_id))
+        return names.get(int(user_id)) if names is not None else None
+
+    def set_name(self, guild_id: int, user_id: int, name: str | None) -> bool:
+        normalized = (name or "").strip()
+        if not normalized:
+            return False
+        names = self._names.setdefault(int(guild_id), {})
+        previous = names.get(int(user_id))
+        if previous is not None and previous[0] == normalized:
+            return False
+        names[int(user_id)] = (normalized, normalized.casefold())
+        if previous is not None:
+            self._invalidate_guild(guild_id)
+        return True
+
+    def rendered(self, guild_id: int, key: Hashable) -> str | None:
+        renders = self._renders.get(int(guild_id))
+        if renders is None:
+            return None
+        text = renders.get(key)
+        if text is not None:
+            renders.move_to_end(key)
+        return text
+
+    def remember_rendered(self, guild_id: int, key: Hashable, text: str) -> None:
+        renders = self._renders.setdefault(int(guild_id), OrderedDict())
+        renders[key] = text
+        renders.move_to_end(key)
+        while len(renders) > self.max_renders_per_guild:
+            renders.popitem(last=False)
+
+    def forget_guild(self, guild_id: int) -> None:
+        self._names.pop(int(guild_id), None)
+        self._invalidate_guild(guild_id)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "guilds": len(self._names),
+            "names": sum(len(names) for names in self._names.values()),
+            "renders": sum(len(renders) for renders in self._renders.values()),
+        }
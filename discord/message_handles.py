@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+
+MessageKey = tuple[int, int]
+
+
+class MessageHandleCache:
+    """LRU of message handles known to exist, keyed by ``(channel_id, message_id)``.
+
+    Handles are either partial messages or full messages returned by a send/edit.
+    Both support ``edit``/``delete`` without a prior ``fetch_message`` round trip.
+    """
+
+    def __init__(self, *, max_entries: int = 2048) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._handles: OrderedDict[MessageKey, Any] = OrderedDict()
+
+    @staticmethod
+    def _key(channel_id: int, message_id: int) -> MessageKey:
+        return (int(channel_id), int(message_id))
+
+    def get(self, channel_id: int, message_id: int) -> Any | None:
+        key = self._key(channel_id, message_id)
+        handle = self._handles.get(key)
+        if handle is not None:
+            self._handles.move_to_end(key)
+        return handle
+
+    def remember(self, channel_id: int, message_id: int, handle: Any) -> None:
+        if int(channel_id) <= 0 or int(message_id) <= 0 or handle is None:
+            return
+        key = self._key(channel_id, message_id)
+        self._handles[key] = handle
+        self._handles.move_to_end(key)
+        while len(self._handles) > self.max_entries:
+            self._handles.popitem(last=False)
+
+    def forget(self, channel_id: int, message_id: int) -> None:
+        self._handles.pop(self._key(channel_id, message_id), None)
+
+    def forget_message(self, message_id: int) -> None:
+        normalized = int(message_id)
+        for key in [key for key in self._handles if key[1] == normalized]:
+            self._handles.pop(key, None)
+
+    def forget_channel(self, channel_id: int) -> None:
+        normalized = int(channel_id)
+        for key in [key for key in self._handles if key[0] == normalized]:
+            self._handles.pop(key, None)
+
+    def clear(self) -> None:
+        self._handles.clear()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handles
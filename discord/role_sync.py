@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Iterable
+
+
+log = logging.getLogger("dmw.runtime")
+
+RoleTarget = tuple[Any, Iterable[int]]
+
+
+@dataclass(slots=True)
+class MemberRoleDiff:
+    member: Any
+    add: list[Any] = field(default_factory=list)
+    remove: list[Any] = field(default_factory=list)
+
+    @property
+    def change_count(self) -> int:
+        return len(self.add) + len(self.remove)
+
+
+@dataclass(slots=True)
+class RoleSyncResult:
+    members_changed: int = 0
+    api_calls: int = 0
+    failed: int = 0
+
+
+def _role_id(role: Any) -> int:
+    return int(getattr(role, "id", 0) or 0)
+
+
+def _role_member_ids(role: Any) -> set[int]:
+    ids = {int(getattr(member, "id", 0) or 0) for member in list(getattr(role, "members", []) or [])}
+    ids.discard(0)
+    return ids
+
+
+def plan_role_sync(guild: Any, targets: Iterable[RoleTarget]) -> dict[int, MemberRoleDiff]:
+    """Diff desired role holders against the cached role members, grouped per member.
+
+    Bots are never given roles but are still stripped of roles they should not hold.
+    """
+    diffs: dict[int, MemberRoleDiff] = {}
+    for role, user_ids in targets:
+        if role is None:
+            continue
+        desired_ids = {int(user_id) for user_id in user_ids if int(user_id) > 0}
+        current_ids = _role_member_ids(role)
+
+        for member_id in sorted(desired_ids - current_ids):
+            member = guild.get_member(member_id)
+            if member is None or getattr(member, "bot", False):
+                continue
+            diffs.setdefault(member_id, MemberRoleDiff(member=member)).add.append(role)
+
+        for member_id in sorted(current_ids - desired_ids):
+            member = guild.get_member(member_id)
+            if member is None:
+                continue
+            diffs.setdefault(member_id, MemberRoleDiff(member=member)).remove.append(role)
+    return diffs
+
+
+def _combined_roles(member: Any, diff: MemberRoleDiff) -> list[Any] | None:
+    current_roles = getattr(member, "roles", None)
+    if current_roles is None:
+        return None
+    remove_ids = {_role_id(role) for role in diff.remove}
+    roles: list[Any] = []
+    seen: set[int] = set()
+    for role in list(current_roles):
+        role_id = _role_id(role)
+        is_default = getattr(role, "is_default", None)
+        if (callable(is_default) and is_default()) or role_id in remove_ids or role_id in seen:
+            continue
+        roles.append(role)
+        seen.add(role_id)
+    for role in diff.add:
+        if _role_id(role) not in seen:
+            roles.append(role)
+            seen.add(_role_id(role))
+    return roles
+
+
+class RoleSyncEngine:
+    """Applies slot-role membership with as few Discord calls as possible.
+
+    A member whose diff touches more than one role gets a single ``member.edit(roles=...)``;
+    single changes keep using ``add_roles``/``remove_roles``. Members are processed
+    concurrently, bounded by a semaphore shared across all syncs of the bot.
+    """
+
+    def __init__(self, *, max_concurrency: int = 4) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _limiter(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def sync(self, guild: Any, targets: Iterable[RoleTarget], *, reason: str) -> RoleSyncResult:
+        return await self._apply_all(plan_role_sync(guild, targets).values(), reason=reason)
+
+    async def strip(self, roles: Iterable[Any], *, reason: str) -> RoleSyncResult:
+        """Remove the given roles from everyone currently holding them."""
+        diffs: dict[int, MemberRoleDiff] = {}
+        for role in roles:
+            for member in list(getattr(role, "members", []) or []):
+                member_id = int(getattr(member, "id", 0) or 0)
+                if member_id <= 0:
+                    continue
+                diffs.setdefault(member_id, MemberRoleDiff(member=member)).remove.append(role)
+        return await self._apply_all(diffs.values(), reason=reason)
+
+    async def _apply_all(self, planned: Iterable[MemberRoleDiff], *, reason: str) -> RoleSyncResult:
+        diffs = [diff for diff in planned if diff.change_count > 0]
+        result = RoleSyncResult()
+        if not diffs:
+            return result
+        outcomes = await asyncio.gather(*(self._apply(diff, reason=reason) for diff in diffs))
+        for calls, ok in outcomes:
+            result.api_calls += calls
+            if ok:
+                result.members_changed += 1
+            else:
+                result.failed += 1
+        return result
+
+    async def _apply(self, diff: MemberRoleDiff, *, reason: str) -> tuple[int, bool]:
+        member = diff.member
+        async with self._limiter():
+            try:
+                if diff.change_count > 1:
+                    roles = _combined_roles(member, diff)
+                    edit = getattr(member, "edit", None)
+                    if roles is not None and callable(edit):
+                        await _maybe_await(edit(roles=roles, reason=reason))
+                        return 1, True
+
+                calls = 0
+                if diff.add:
+                    await _maybe_await(member.add_roles(*diff.add, reason=reason))
+                    calls += len(diff.add)
+                if diff.remove:
+                    await _maybe_await(member.remove_roles(*diff.remove, reason=reason))
+                    calls += len(diff.remove)
+                return calls, True
+            except Exception:
+                log.debug(
+                    "Role sync failed for member_id=%s",
+                    getattr(member, "id", None),
+                    exc_info=True,
+                )
+                return 1, False
+
+
+async def _maybe_await(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        return await result
+    return result
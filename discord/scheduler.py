@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import heapq
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Sequence
+
+from discord.task_registry import SingletonTaskRegistry
+
+
+log = logging.getLogger("dmw.runtime")
+
+
+@dataclass(slots=True)
+class _Job:
+    name: str
+    fn: Callable[..., Awaitable[Any]]
+    interval: float
+    jitter_ratio: float
+    keys_fn: Callable[[], Sequence[Any]] | None = None
+    base_due: float = 0.0
+    cursor: int = 0
+    runs: int = 0
+    skipped: int = 0
+    task: asyncio.Task[None] | None = None
+    token: int = 0
+
+
+class PeriodicScheduler:
+    """Single heap-driven loop that fires periodic jobs at a fixed cadence.
+
+    Each fire is offset by up to ``jitter_ratio * interval`` so jobs with equal
+    intervals do not wake together. A fire that finds the previous run still busy
+    is skipped rather than queued. Spread jobs run ``fn(key)`` for one key per fire,
+    cycling through ``keys_fn()`` so per-guild work is spaced evenly over the interval.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry: SingletonTaskRegistry | None = None,
+        jitter_ratio: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        self.registry = registry
+        self.jitter_ratio = min(0.5, max(0.0, float(jitter_ratio)))
+        self._clock = clock
+        self._rng = rng
+        self._jobs: dict[str, _Job] = {}
+        self._heap: list[tuple[float, int, str, int]] = []
+        self._seq = 0
+        self._wakeup: asyncio.Event | None = None
+
+    def add_job(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        interval_seconds: float,
+        initial_delay: float | None = None,
+        jitter_ratio: float | None = None,
+    ) -> None:
+        self._add(name, fn, interval_seconds, initial_delay, jitter_ratio, keys_fn=None)
+
+    def add_spread_job(
+        self,
+        name: str,
+        fn: Callable[[Any], Awaitable[Any]],
+        keys_fn: Callable[[], Sequence[Any]],
+        *,
+        interval_seconds: float,
+        initial_delay: float | None = None,
+    ) -> None:
+        self._add(name, fn, interval_seconds, initial_delay, 0.0, keys_fn=keys_fn)
+
+    def _add(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        interval_seconds: float,
+        initial_delay: float | None,
+        jitter_ratio: float | None,
+        *,
+        keys_fn: Callable[[], Sequence[Any]] | None,
+    ) -> None:
+        existing = self._jobs.get(name)
+        if existing is not None:
+            existing.fn = fn
+            existing.keys_fn = keys_fn
+            existing.interval = max(0.001, float(interval_seconds))
+            return
+        job = _Job(
+            name=name,
+            fn=fn,
+            interval=max(0.001, float(interval_seconds)),
+            jitter_ratio=self.jitter_ratio if jitter_ratio is None else min(0.5, max(0.0, float(jitter_ratio))),
+            keys_fn=keys_fn,
+        )
+        self._jobs[name] = job
+        job.base_due = self._clock() + (job.interval if initial_delay is None else max(0.0, float(initial_delay)))
+        jitter = job.interval * job.jitter_ratio
+        self._push(job, job.base_due + (self._rng(0.0, jitter) if jitter > 0 else 0.0))
+
+    def has_job(self, name: str) -> bool:
+        return name in self._jobs
+
+    def _push(self, job: _Job, due: float) -> None:
+        self._seq += 1
+        job.token = self._seq
+        heapq.heappush(self._heap, (due, self._seq, job.name, job.token))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_delay(self, job: _Job) -> float:
+        if job.keys_fn is None:
+            return job.interval
+        return job.interval / max(1, len(job.keys_fn()))
+
+    def _reschedule(self, job: _Job, now: float) -> None:
+        job.base_due += self._next_delay(job)
+        if job.base_due <= now:
+            # Fell behind (overrun or suspended loop): resume the cadence from now, no catch-up burst.
+            job.base_due = now + self._next_delay(job)
+        jitter = job.interval * job.jitter_ratio
+        due = job.base_due + (self._rng(-jitter, jitter) if jitter > 0 else 0.0)
+        self._push(job, max(now, due))
+
+    async def run(self) -> None:
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                now = self._clock()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, name, token = heapq.heappop(self._heap)
+                    job = self._jobs.get(name)
+                    if job is None or job.token != token:
+                        continue
+                    self._fire(job)
+                    self._reschedule(job, now)
+                self._wakeup.clear()
+                delay = self._heap[0][0] - now if self._heap else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+            tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _fire(self, job: _Job) -> None:
+        if job.task is not None and not job.task.done():
+            job.skipped += 1
+            log.debug("Skipping scheduled job %s; previous run still active", job.name)
+            return
+        if job.keys_fn is not None:
+            keys = list(job.keys_fn())
+            if not keys:
+                return
+            key = keys[job.cursor % len(keys)]
+            job.cursor = (job.cursor + 1) % len(keys)
+            job.task = asyncio.create_task(self._execute(job, key, has_key=True))
+        else:
+            job.task = asyncio.create_task(self._execute(job, None, has_key=False))
+
+    async def _execute(self, job: _Job, key: Any, *, has_key: bool) -> None:
+        job.runs += 1
+        try:
+            if self.registry is not None:
+                with self.registry.track_iteration(job.name, interval_seconds=self._next_delay(job)):
+                    await (job.fn(key) if has_key else job.fn())
+            else:
+                await (job.fn(key) if has_key else job.fn())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("Scheduled job %s failed", job.name)
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        now = self._clock()
+        return {
+            name: {
+                "interval": job.interval,
+                "next_in": round(max(0.0, job.base_due - now), 3),
+                "runs": job.runs,
+                "skipped": job.skipped,
+                "running": job.task is not None and not job.task.done(),
+            }
+            for name, job in sorted(self._jobs.items())
+        }
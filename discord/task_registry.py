@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Coroutine
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, Hashable, Iterator
 
+from utils.metrics import DurationHistogram
+
+
+log = logging.getLogger("dmw.runtime")
 
 UpdateFn = Callable[[int], Awaitable[None]]
 TaskFactory = Callable[[], Coroutine[Any, Any, None]]
@@ -17,21 +23,138 @@ class TaskHandle:
     task: asyncio.Task[None]
 
 
+@dataclass(slots=True)
+class WorkerHealth:
+    supervised: bool = False
+    restarts: int = 0
+    consecutive_failures: int = 0
+    last_error: str | None = None
+    last_crash_at: float | None = None
+    last_run_at: float | None = None
+    backoff_until: float | None = None
+    interval_seconds: float | None = None
+    overruns: int = 0
+    durations: DurationHistogram = field(default_factory=DurationHistogram)
+
+
 class SingletonTaskRegistry:
-    def __init__(self) -> None:
+    """Named singleton tasks; supervised ones are restarted with exponential backoff.
+
+    Workers report loop iterations via ``track_iteration`` so ``status()`` can show
+    the last run, a duration histogram and how often an iteration overran its interval.
+    """
+
+    def __init__(
+        self,
+        *,
+        restart_base_delay: float = 1.0,
+        restart_max_delay: float = 300.0,
+        healthy_run_seconds: float = 60.0,
+    ) -> None:
         self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._health: dict[str, WorkerHealth] = {}
+        self.restart_base_delay = max(0.0, float(restart_base_delay))
+        self.restart_max_delay = max(self.restart_base_delay, float(restart_max_delay))
+        self.healthy_run_seconds = float(healthy_run_seconds)
 
-    def start_once(self, name: str, factory: TaskFactory) -> asyncio.Task[None]:
+    def start_once(
+        self,
+        name: str,
+        factory: TaskFactory,
+        *,
+        supervise: bool = False,
+        interval_seconds: float | None = None,
+    ) -> asyncio.Task[None]:
         task = self._tasks.get(name)
         if task and not task.done():
             return task
-        task = asyncio.create_task(factory())
+        health = self._health.setdefault(name, WorkerHealth())
+        health.supervised = supervise
+        if interval_seconds is not None:
+            health.interval_seconds = float(interval_seconds)
+        task = asyncio.create_task(self._supervise(name, factory, health) if supervise else factory())
         self._tasks[name] = task
         return task
 
     def get(self, name: str) -> asyncio.Task[None] | None:
         return self._tasks.get(name)
 
+    def restart_delay(self, failures: int) -> float:
+        if failures <= 0:
+            return 0.0
+        return min(self.restart_max_delay, self.restart_base_delay * (2 ** (failures - 1)))
+
+    async def _supervise(self, name: str, factory: TaskFactory, health: WorkerHealth) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await factory()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if time.monotonic() - started >= self.healthy_run_seconds:
+                    health.consecutive_failures = 0
+                health.consecutive_failures += 1
+                health.restarts += 1
+                health.last_error = f"{type(exc).__name__}: {exc}"
+                health.last_crash_at = time.time()
+                delay = self.restart_delay(health.consecutive_failures)
+                log.exception("Worker %s crashed; restarting in %.1fs", name, delay)
+            health.backoff_until = time.time() + delay
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                health.backoff_until = None
+
+    @contextmanager
+    def track_iteration(self, name: str, *, interval_seconds: float | None = None) -> Iterator[None]:
+        """Time one worker loop iteration and flag it when it outruns its interval."""
+        health = self._health.setdefault(name, WorkerHealth())
+        if interval_seconds is not None:
+            health.interval_seconds = float(interval_seconds)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - started
+            health.durations.observe(duration)
+            health.last_run_at = time.time()
+            if health.interval_seconds is not None and duration > health.interval_seconds:
+                health.overruns += 1
+                log.warning(
+                    "Worker %s iteration took %.2fs (interval %.2fs)",
+                    name,
+                    duration,
+                    health.interval_seconds,
+                )
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = {}
+        for name in sorted(set(self._tasks) | set(self._health)):
+            task = self._tasks.get(name)
+            health = self._health.get(name) or WorkerHealth()
+            if task is None:
+                state = "idle"
+            elif not task.done():
+                state = "backoff" if health.backoff_until is not None else "running"
+            elif task.cancelled():
+                state = "cancelled"
+            elif task.exception() is not None:
+                state = "crashed"
+            else:
+                state = "stopped"
+            result[name] = {
+                "state": state,
+                "supervised": health.supervised,
+                "restarts": health.restarts,
+                "last_error": health.last_error,
+                "last_run_at": health.last_run_at,
+                "overruns": health.overruns,
+                "durations": health.durations.snapshot(),
+            }
+        return result
+
     async def cancel_all(self) -> None:
         tasks = [task for task in self._tasks.values() if not task.done()]
         for task in tasks:
@@ -40,34 +163,175 @@ class SingletonTaskRegistry:
             await asyncio.gather(*tasks, return_exceptions=True)
 
 
+@dataclass(slots=True)
+class _DebounceState:
+    first_dirty_at: float | None = None
+    last_dirty_at: float = 0.0
+    task: asyncio.Task[None] | None = None
+    inflight: asyncio.Task[None] | None = None
+
+
+class KeyedDebouncer:
+    """Trailing debounce per key with a max-wait deadline.
+
+    ``mark_dirty`` pushes the run back by ``debounce_seconds`` but never past
+    ``max_wait_seconds`` after the first unprocessed mark, so a steady stream of
+    marks still produces one run per window. Runs for one key never overlap.
+    """
+
+    def __init__(
+        self,
+        update_fn: Callable[[Hashable], Awaitable[None]],
+        *,
+        debounce_seconds: float = 1.0,
+        max_wait_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.update_fn = update_fn
+        self.debounce = max(0.0, float(debounce_seconds))
+        self.max_wait = max(self.debounce, float(max_wait_seconds))
+        self._clock = clock
+        self._states: dict[Hashable, _DebounceState] = {}
+        self._closed = False
+
+    def mark_dirty(self, key: Hashable) -> None:
+        if self._closed:
+            return
+        state = self._states.setdefault(key, _DebounceState())
+        now = self._clock()
+        if state.first_dirty_at is None:
+            state.first_dirty_at = now
+        state.last_dirty_at = now
+        if state.task is None or state.task.done():
+            state.task = asyncio.create_task(self._worker(key, state))
+
+    def clear_dirty(self, key: Hashable) -> bool:
+        """Drop a pending run for ``key`` (the caller runs it now); returns whether one was pending."""
+        state = self._states.get(key)
+        if state is None or state.first_dirty_at is None:
+            return False
+        state.first_dirty_at = None
+        return True
+
+    def pending_ages(self) -> dict[Hashable, float]:
+        """Seconds each dirty key has been waiting since its first unprocessed mark."""
+        now = self._clock()
+        return {
+            key: round(max(0.0, now - state.first_dirty_at), 3)
+            for key, state in self._states.items()
+            if state.first_dirty_at is not None
+        }
+
+    def is_pending(self, key: Hashable) -> bool:
+        state = self._states.get(key)
+        return state is not None and state.task is not None and not state.task.done()
+
+    def pending_keys(self) -> list[Hashable]:
+        return [key for key in self._states if self.is_pending(key)]
+
+    async def wait_idle(self, key: Hashable) -> None:
+        state = self._states.get(key)
+        while state is not None and state.task is not None and not state.task.done():
+            await asyncio.wait({state.task})
+
+    async def _worker(self, key: Hashable, state: _DebounceState) -> None:
+        try:
+            while state.first_dirty_at is not None:
+                deadline = min(state.last_dirty_at + self.debounce, state.first_dirty_at + self.max_wait)
+                delay = deadline - self._clock()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+                await self._run_once(key, state)
+        finally:
+            if state.task is asyncio.current_task():
+                state.task = None
+            if state.first_dirty_at is None and state.task is None:
+                self._states.pop(key, None)
+
+    async def _run_once(self, key: Hashable, state: _DebounceState) -> None:
+        state.first_dirty_at = None
+        # Shielded: cancelling the worker must not abort a half-applied Discord update.
+        state.inflight = asyncio.create_task(self._invoke(key))
+        try:
+            await asyncio.shield(state.inflight)
+        finally:
+            if state.inflight.done():
+                state.inflight = None
+
+    async def _invoke(self, key: Hashable) -> None:
+        try:
+            await self.update_fn(key)
+        except Exception:
+            log.exception("Debounced update failed for key=%s", key)
+
+    async def shutdown(self, *, flush: bool = True, timeout: float | None = None) -> None:
+        """Stop scheduling; optionally run still-dirty keys once, then wait for in-flight runs."""
+        self._closed = True
+        states = list(self._states.items())
+        for _, state in states:
+            if state.task is not None and not state.task.done():
+                state.task.cancel()
+        await asyncio.gather(*(state.task for _, state in states if state.task is not None), return_exceptions=True)
+
+        pending: list[asyncio.Task[None]] = [
+            state.inflight for _, state in states if state.inflight is not None and not state.inflight.done()
+        ]
+        if flush:
+            for key, state in states:
+                if state.first_dirty_at is not None:
+                    state.first_dirty_at = None
+                    pending.append(asyncio.create_task(self._invoke(key)))
+        if pending:
+            _, still_running = await asyncio.wait(pending, timeout=timeout)
+            for task in still_running:
+                task.cancel()
+        self._states.clear()
+
+
 class DebouncedGuildUpdater:
-    def __init__(self, update_fn: UpdateFn, *, debounce_seconds: float = 1.5, cooldown_seconds: float = 0.8):
+    """Guild-keyed ``KeyedDebouncer`` with a per-guild cooldown and a global run cap.
+
+    At most ``max_concurrency`` ``update_fn`` calls run at once, and runs for one
+    guild are spaced by at least ``cooldown_seconds``.
+    """
+
+    def __init__(
+        self,
+        update_fn: UpdateFn,
+        *,
+        debounce_seconds: float = 1.5,
+        cooldown_seconds: float = 0.8,
+        max_wait_seconds: float = 6.0,
+        max_concurrency: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.update_fn = update_fn
-        self.debounce = float(debounce_seconds)
         self.cooldown = float(cooldown_seconds)
-        self._dirty = defaultdict(lambda: False)
-        self._generation = defaultdict(lambda: 0)
-        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._debouncer = KeyedDebouncer(
+            self._run,
+            debounce_seconds=debounce_seconds,
+            max_wait_seconds=max_wait_seconds,
+            clock=clock,
+        )
         self._locks = defaultdict(asyncio.Lock)
         self._last_run = defaultdict(lambda: 0.0)
+        self._running: dict[int, float] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+        self.run_durations = DurationHistogram()
+
+    def _limiter(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
 
     async def mark_dirty(self, guild_id: int) -> None:
-        self._dirty[guild_id] = True
-        self._generation[guild_id] += 1
-        generation = self._generation[guild_id]
-        running = self._tasks.get(guild_id)
-        if running is None or running.done():
-            self._tasks[guild_id] = asyncio.create_task(self._debounced(guild_id, generation))
+        self._debouncer.mark_dirty(guild_id)
 
     async def force_update(self, guild_id: int) -> None:
-        self._dirty[guild_id] = True
-        await self._run(guild_id)
-
-    async def _debounced(self, guild_id: int, generation: int) -> None:
-        await asyncio.sleep(self.debounce)
-        if self._generation[guild_id] != generation:
-            self._tasks[guild_id] = asyncio.create_task(self._debounced(guild_id, self._generation[guild_id]))
-            return
+        # A forced run covers any pending debounced one.
+        self._debouncer.clear_dirty(guild_id)
         await self._run(guild_id)
 
     async def _run(self, guild_id: int) -> None:
@@ -76,13 +340,77 @@ class DebouncedGuildUpdater:
             if elapsed < self.cooldown:
                 await asyncio.sleep(self.cooldown - elapsed)
 
-            if not self._dirty[guild_id]:
-                return
+            async with self._limiter():
+                started = time.monotonic()
+                self._running[guild_id] = started
+                try:
+                    await self.update_fn(guild_id)
+                finally:
+                    self._running.pop(guild_id, None)
+                    finished = time.monotonic()
+                    self.run_durations.observe(finished - started)
+                    self._last_run[guild_id] = finished
+
+    def pending_guilds(self) -> dict[int, float]:
+        """Seconds each dirty guild has been waiting since its first unprocessed mark."""
+        return {int(guild_id): age for guild_id, age in self._debouncer.pending_ages().items()}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": self.pending_guilds(),
+            "running": sorted(self._running),
+            "runs": self.run_durations.snapshot(),
+        }
+
+    async def cancel_all(self) -> None:
+        await self._debouncer.shutdown(flush=False, timeout=0)
+
 
-            self._dirty[guild_id] = False
-            before = self._generation[guild_id]
-            await self.update_fn(guild_id)
-            self._last_run[guild_id] = time.monotonic()
+class CoalescingTaskQueue:
+    """Runs at most one job per key; submissions during a run collapse into one rerun."""
 
-            if self._generation[guild_id] != before:
-                self._tasks[guild_id] = asyncio.create_task(self._debounced(guild_id, self._generation[guild_id]))
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task[None]] = {}
+        self._pending: dict[Hashable, TaskFactory] = {}
+
+    def submit(self, key: Hashable, factory: TaskFactory) -> asyncio.Task[None]:
+        self._pending[key] = factory
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._run_key(key))
+            self._tasks[key] = task
+        return task
+
+    async def _run_key(self, key: Hashable) -> None:
+        try:
+            while True:
+                factory = self._pending.pop(key, None)
+                if factory is None:
+                    return
+                try:
+                    await factory()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    log.exception("Background job failed for key=%s", key)
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                self._tasks.pop(key, None)
+
+    def pending_keys(self) -> list[Hashable]:
+        return [key for key, task in self._tasks.items() if not task.done()]
+
+    async def drain(self, *, timeout: float | None = None) -> bool:
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        if not tasks:
+            return True
+        _, still_running = await asyncio.wait(tasks, timeout=timeout)
+        return not still_running
+
+    async def cancel_all(self) -> None:
+        self._pending.clear()
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
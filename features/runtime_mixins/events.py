@@ -7,26 +7,27 @@ import inspect
 import logging
 from pathlib import Path
 import time
-from typing import Any, AsyncIterable, Awaitable, TYPE_CHECKING, cast
+from typing import Any, AsyncIterable, Awaitable
 
 from bot.discord_api import app_commands, discord
 from db.repository import RaidPostedSlotRecord, RaidRecord, UserLevelRecord
 from db.schema_guard import ensure_required_schema, validate_required_tables
+from discord.scheduler import PeriodicScheduler
 from features.runtime_mixins._typing import RuntimeMixinBase
 from services.admin_service import cancel_all_open_raids
 from services.backup_service import export_rows_to_sql
 from services.raid_service import finish_raid, planner_counts
 from utils.hashing import sha256_text
+from utils.localization import validate_catalog
 from utils.runtime_helpers import *  # noqa: F401,F403
 from utils.slots import compute_qualified_slot_users, memberlist_target_label, memberlist_threshold
 from utils.text import contains_approved_keyword, contains_nanomon_keyword
 
-if TYPE_CHECKING:
-    from bot.runtime import RewriteDiscordBot
-
 
 class RuntimeEventsMixin(RuntimeMixinBase):
     async def setup_hook(self) -> None:
+        for problem in validate_catalog():
+            log.warning("Localization catalog: %s", problem)
         if not self._state_loaded:
             await self._bootstrap_repository()
             self._state_loaded = True
@@ -36,6 +37,7 @@ class RuntimeEventsMixin(RuntimeMixinBase):
             self._commands_registered = True
         if not self._views_restored:
             self._restore_persistent_vote_views()
+            self._restore_persistent_raid_calendar_views()
             self._views_restored = True
 
     async def _bootstrap_repository(self) -> None:
@@ -57,8 +59,6 @@ class RuntimeEventsMixin(RuntimeMixinBase):
             await self.persistence.flush(self.repo)
 
     def _restore_persistent_vote_views(self) -> None:
-        from views.raid_views import RaidVoteView
-
         restored = 0
         for raid in self.repo.list_open_raids():
             if not raid.message_id:
@@ -66,10 +66,7 @@ class RuntimeEventsMixin(RuntimeMixinBase):
             days, times = self.repo.list_raid_options(raid.id)
             if not days or not times:
                 continue
-            self.add_view(
-                RaidVoteView(cast("RewriteDiscordBot", self), raid.id, days, times),
-                message_id=raid.message_id,
-            )
+            self.add_view(self._planner_vote_view(raid.id, days, times).view, message_id=raid.message_id)
             restored += 1
         if restored:
             log.info("Restored %s persistent raid vote views", restored)
@@ -119,6 +116,7 @@ class RuntimeEventsMixin(RuntimeMixinBase):
             await self._refresh_planner_message(raid.id)
             await self._sync_memberlist_messages_for_raid(raid.id, recreate_existing=True)
         await self._refresh_raidlists_for_all_guilds(force=True)
+        await self._refresh_raid_calendars_for_all_guilds(force=True)
         await self._persist()
 
     def _sync_connected_guild_settings(self) -> bool:
@@ -132,21 +130,51 @@ class RuntimeEventsMixin(RuntimeMixinBase):
                 changed = True
         return changed
 
+    def _background_scheduler(self) -> PeriodicScheduler:
+        scheduler = getattr(self, "scheduler", None)
+        if scheduler is None:
+            scheduler = PeriodicScheduler(registry=self.task_registry)
+            self.scheduler = scheduler
+        return scheduler
+
     def _start_background_loops(self) -> None:
-        self.task_registry.start_once("stale_raid_worker", self._stale_raid_worker)
-        self.task_registry.start_once("raid_reminder_worker", self._raid_reminder_worker)
-        self.task_registry.start_once("integrity_cleanup_worker", self._integrity_cleanup_worker)
-        self.task_registry.start_once("voice_xp_worker", self._voice_xp_worker)
-        self.task_registry.start_once("level_persist_worker", self._level_persist_worker)
-        self.task_registry.start_once("username_sync_worker", self._username_sync_worker)
-        self.task_registry.start_once("self_test_worker", self._self_test_worker)
-        self.task_registry.start_once("backup_worker", self._backup_worker)
-        self.task_registry.start_once("log_forwarder_worker", self._log_forwarder_worker)
+        self._seed_voice_sessions(self.guilds)
+        scheduler = self._background_scheduler()
+        # First runs happen right away (as the old per-worker loops did), staggered by jitter.
+        periodic_jobs = (
+            ("stale_raid", self._stale_raid_job, STALE_RAID_CHECK_SECONDS),
+            ("integrity_cleanup", self._integrity_cleanup_job, INTEGRITY_CLEANUP_SLEEP_SECONDS),
+            ("voice_xp", self._voice_xp_job, VOICE_XP_CHECK_SECONDS),
+            ("level_persist", self._level_persist_job, LEVEL_PERSIST_WORKER_POLL_SECONDS),
+            ("self_test", self._self_test_job, max(30, int(self.config.self_test_interval_seconds))),
+            ("backup", self._backup_job, max(300, int(self.config.backup_interval_seconds))),
+        )
+        for name, job, interval_seconds in periodic_jobs:
+            initial_delay = LEVEL_PERSIST_WORKER_POLL_SECONDS if name == "level_persist" else 0.0
+            scheduler.add_job(name, job, interval_seconds=interval_seconds, initial_delay=initial_delay)
+        scheduler.add_spread_job(
+            "username_sync",
+            self._username_sync_guild_job,
+            lambda: list(self.guilds),
+            interval_seconds=USERNAME_SYNC_WORKER_SLEEP_SECONDS,
+            initial_delay=0.0,
+        )
+        scheduler.add_spread_job(
+            "integrity_guild_roles",
+            self._integrity_cleanup_guild_job,
+            lambda: list(self.guilds),
+            interval_seconds=INTEGRITY_CLEANUP_SLEEP_SECONDS,
+            initial_delay=0.0,
+        )
+        self.task_registry.start_once("background_scheduler", scheduler.run, supervise=True)
+        self.task_registry.start_once("raid_reminder_worker", self._raid_reminder_worker, supervise=True)
+        self.task_registry.start_once("log_forwarder_worker", self._log_forwarder_worker, supervise=True)
 
     async def on_guild_join(self, guild) -> None:
         async with self._state_lock:
             self.repo.ensure_settings(guild.id, guild.name)
             self._username_sync_next_run_by_guild[int(guild.id)] = 0.0
+            self._seed_voice_sessions([guild])
             await self._force_raidlist_refresh(guild.id)
             await self._persist(dirty_tables={"settings", "debug_cache"})
 
@@ -164,8 +192,18 @@ class RuntimeEventsMixin(RuntimeMixinBase):
         async with self._state_lock:
             self._guild_feature_settings.pop(int(guild.id), None)
             self._username_sync_next_run_by_guild.pop(int(guild.id), None)
+            self._member_names.forget_guild(int(guild.id))
             self.repo.purge_guild_data(guild.id)
             await self._persist()
+        for channel in list(getattr(guild, "channels", []) or []):
+            self._invalidate_channel_caches(int(getattr(channel, "id", 0) or 0))
+
+    async def on_guild_channel_delete(self, channel) -> None:
+        self._invalidate_channel_caches(int(getattr(channel, "id", 0) or 0))
+
+    async def on_guild_channel_update(self, before, after) -> None:
+        # Message handles stay valid across renames/permission edits; only the resolved channel is stale.
+        self._channel_cache.invalidate(int(getattr(after, "id", 0) or 0))
 
     async def on_member_join(self, member) -> None:
         if getattr(member, "bot", False):
@@ -229,7 +267,18 @@ class RuntimeEventsMixin(RuntimeMixinBase):
         if guild_feature_settings is not None:
             now = datetime.now(UTC)
             is_command_message = self._is_registered_command_message(getattr(message, "content", None))
-            if guild_feature_settings.leveling_enabled and not is_command_message:
+            min_award_interval = timedelta(seconds=max(1, int(guild_feature_settings.message_xp_interval_seconds)))
+            if (
+                guild_feature_settings.leveling_enabled
+                and not is_command_message
+                # Cooldown hits change nothing; keep them off the state lock and the repository.
+                and not self.leveling_service.message_xp_on_cooldown(
+                    guild_id=message.guild.id,
+                    user_id=message.author.id,
+                    now=now,
+                    min_award_interval=min_award_interval,
+                )
+            ):
                 async with self._state_lock:
                     result = self.leveling_service.update_message_xp(
                         self.repo,
@@ -237,9 +286,7 @@ class RuntimeEventsMixin(RuntimeMixinBase):
                         user_id=message.author.id,
                         username=_member_name(message.author),
                         now=now,
-                        min_award_interval=timedelta(
-                            seconds=max(1, int(guild_feature_settings.message_xp_interval_seconds))
-                        ),
+                        min_award_interval=min_award_interval,
                     )
                     if result.xp_awarded:
                         self._level_state_dirty = True
@@ -299,6 +346,16 @@ class RuntimeEventsMixin(RuntimeMixinBase):
             return
 
         if getattr(after, "channel", None) is None:
+            if self.leveling_service.has_voice_session(guild.id, member.id):
+                async with self._state_lock:
+                    if self._accrue_voice_session(
+                        guild.id,
+                        member.id,
+                        now=datetime.now(UTC),
+                        member=member,
+                        ending=True,
+                    ):
+                        self._level_state_dirty = True
             self.leveling_service.on_voice_disconnect(guild.id, member.id)
         elif getattr(before, "channel", None) is None:
             self.leveling_service.on_voice_connect(guild.id, member.id, datetime.now(UTC))
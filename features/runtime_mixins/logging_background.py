@@ -7,8 +7,7 @@ import inspect
 import logging
 from pathlib import Path
 import time
-from typing import Any, AsyncIterable, Awaitable, cast
-from zoneinfo import ZoneInfo
+from typing import Any, AsyncIterable, Awaitable, Collection, cast
 
 from bot.discord_api import app_commands, discord
 from db.repository import RaidPostedSlotRecord, RaidRecord, UserLevelRecord
@@ -18,9 +17,10 @@ from services.admin_service import cancel_all_open_raids
 from services.backup_service import export_rows_to_sql
 from services.raid_service import finish_raid, planner_counts
 from services.startup_service import EXPECTED_SLASH_COMMANDS
+from utils.due_queue import DueQueue
 from utils.hashing import sha256_text
 from utils.runtime_helpers import *  # noqa: F401,F403
-from utils.slots import compute_qualified_slot_users, memberlist_target_label, memberlist_threshold
+from utils.slots import memberlist_target_label, memberlist_threshold
 from utils.text import contains_approved_keyword, contains_nanomon_keyword
 from utils.runtime_helpers import (
     AUTO_REMINDER_ADVANCE_SECONDS,
@@ -256,16 +256,22 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
             log.warning("Unexpected extra commands registered: %s", ", ".join(unexpected))
         self.last_self_test_ok_at = datetime.now(UTC)
         self.last_self_test_error = None
-
-    async def _self_test_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
-            try:
-                await self._run_self_tests_once()
-            except Exception as exc:
-                self.last_self_test_error = str(exc)
-                log.exception("Background self-test failed")
-            await asyncio.sleep(max(30, int(self.config.self_test_interval_seconds)))
+        log.debug("Channel resolution cache stats: %s", self._channel_cache.stats())
+        log.debug("Latency metrics: %s", self._metrics.snapshot())
+        log.debug("Worker status: %s", self.task_registry.status())
+        log.debug("Scheduler status: %s", self._background_scheduler().status())
+        raidlist_updater = getattr(self, "raidlist_updater", None)
+        if raidlist_updater is not None:
+            log.debug("Raidlist updater: %s", raidlist_updater.stats())
+        log.debug("Leveling state: %s", self.leveling_service.state_sizes())
+        log.debug("Member name cache: %s", self._member_names.stats())
+
+    async def _self_test_job(self) -> None:
+        try:
+            await self._run_self_tests_once()
+        except Exception as exc:
+            self.last_self_test_error = str(exc)
+            log.exception("Background self-test failed")
 
     def _snapshot_rows_by_table(self) -> dict[str, list[dict[str, object]]]:
         return {
@@ -288,15 +294,9 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
         log.info("Automatic backup completed: %s", path.as_posix())
         return path
 
-    async def _backup_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
-            try:
-                async with self._state_lock:
-                    await self._run_backup_once()
-            except Exception:
-                log.exception("Background backup failed")
-            await asyncio.sleep(max(300, int(self.config.backup_interval_seconds)))
+    async def _backup_job(self) -> None:
+        async with self._state_lock:
+            await self._run_backup_once()
 
     @staticmethod
     def _slot_cache_suffix(day_label: str, time_label: str) -> str:
@@ -316,55 +316,66 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
         return f"{RAID_START_CACHE_PREFIX}:{int(raid_id)}:{cls._slot_cache_suffix(day_label, time_label)}"
 
     @staticmethod
-    def _parse_slot_start_at_utc(
+    def _slot_fill_percent(filled_slots: int, total_slots: int) -> float:
+        return (filled_slots / total_slots * 100) if total_slots > 0 else 0
+
+    def _slot_reminder_windows(
+        self,
+        raid: RaidRecord,
+        feature_settings: GuildFeatureSettings,
+        *,
         day_label: str,
         time_label: str,
-        *,
-        timezone_name: str = DEFAULT_TIMEZONE_NAME,
-    ) -> datetime | None:
-        parsed_date = _parse_raid_date_from_label(day_label)
-        parsed_time = _parse_raid_time_label(time_label)
-        if parsed_date is None or parsed_time is None:
-            return None
-        timezone = _zoneinfo_for_name(timezone_name)
-        try:
-            local_start = datetime(
-                parsed_date.year,
-                parsed_date.month,
-                parsed_date.day,
-                parsed_time[0],
-                parsed_time[1],
-                tzinfo=timezone,
+        start_at: datetime,
+        fill_percent: float,
+    ) -> dict[str, tuple[float, float, str]]:
+        """Reminder windows of one slot as ``kind -> (opens_at, closes_at, cache_key)``.
+
+        Bounds are inclusive epoch seconds. The reminder runners and ``_next_reminder_wake``
+        both read them from here, so a window is only ever defined once.
+        """
+        start_ts = start_at.timestamp()
+        windows: dict[str, tuple[float, float, str]] = {}
+        if feature_settings.raid_reminder_enabled:
+            windows[RAID_REMINDER_KIND] = (
+                start_ts - RAID_REMINDER_ADVANCE_SECONDS,
+                start_ts,
+                self._raid_reminder_cache_key(raid.id, day_label, time_label),
             )
-            return local_start.astimezone(UTC)
-        except ValueError:
-            return None
-
-    @staticmethod
-    def _parse_slot_start_at_berlin(day_label: str, time_label: str) -> datetime | None:
-        parsed_date = _parse_raid_date_from_label(day_label)
-        parsed_time = _parse_raid_time_label(time_label)
-        if parsed_date is None or parsed_time is None:
-            return None
-        berlin_tz = ZoneInfo("Europe/Berlin")
-        try:
-            return datetime(
-                parsed_date.year,
-                parsed_date.month,
-                parsed_date.day,
-                parsed_time[0],
-                parsed_time[1],
-                tzinfo=berlin_tz,
+            windows[RAID_START_KIND] = (
+                start_ts,
+                start_ts + RAID_START_TOLERANCE_SECONDS,
+                self._raid_start_cache_key(raid.id, day_label, time_label),
             )
-        except ValueError:
-            return None
+        if feature_settings.auto_reminder_enabled and fill_percent < AUTO_REMINDER_MIN_FILL_PERCENT:
+            windows[AUTO_REMINDER_KIND] = (
+                start_ts - AUTO_REMINDER_ADVANCE_SECONDS,
+                start_ts,
+                self._auto_reminder_cache_key(raid.id, day_label, time_label),
+            )
+        return windows
+
+    def _open_raids_for_reminders(self, raid_ids: Collection[int] | None) -> list[RaidRecord]:
+        if raid_ids is None:
+            return list(self.repo.list_open_raids())
+        raids = []
+        for raid_id in sorted({int(raid_id) for raid_id in raid_ids}):
+            raid = self.repo.get_raid(raid_id)
+            if raid is not None and raid.status == "open":
+                raids.append(raid)
+        return raids
 
-    async def _run_raid_reminders_once(self, *, now_utc: datetime | None = None) -> int:
-        berlin_tz = ZoneInfo("Europe/Berlin")
+    async def _run_raid_reminders_once(
+        self,
+        *,
+        now_utc: datetime | None = None,
+        raid_ids: Collection[int] | None = None,
+    ) -> int:
+        berlin_tz = _zoneinfo_for_name(DEFAULT_TIMEZONE_NAME)
         current_berlin = now_utc.astimezone(berlin_tz) if now_utc else datetime.now(berlin_tz)
         sent = 0
         participants_channel_by_id: dict[int, Any | None] = {}
-        for raid in self.repo.list_open_raids():
+        for raid in self._open_raids_for_reminders(raid_ids):
             feature_settings = self._get_guild_feature_settings(raid.guild_id)
             if not feature_settings.raid_reminder_enabled:
                 continue
@@ -382,24 +393,30 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
                 continue
 
             days, times = self.repo.list_raid_options(raid.id)
-            day_users, time_users = self.repo.vote_user_sets(raid.id)
-            threshold = memberlist_threshold(raid.min_players)
-            qualified_slots, _ = compute_qualified_slot_users(
-                days=days,
-                times=times,
-                day_users=day_users,
-                time_users=time_users,
-                threshold=threshold,
+            qualified_slots, _ = self.repo.qualified_slot_users(
+                raid.id,
+                threshold=memberlist_threshold(raid.min_players),
             )
+            slot_times = self.repo.slot_times(raid.id)
+            now_ts = current_berlin.timestamp()
             for (day_label, time_label), users in qualified_slots.items():
-                start_at = self._parse_slot_start_at_berlin(day_label, time_label)
+                start_at = slot_times.start_utc(day_label, time_label)
                 if start_at is None:
                     continue
-                delta_seconds = (start_at - current_berlin).total_seconds()
-                
+                windows = self._slot_reminder_windows(
+                    raid,
+                    feature_settings,
+                    day_label=day_label,
+                    time_label=time_label,
+                    start_at=start_at,
+                    fill_percent=self._slot_fill_percent(len(users), len(days) * len(times)),
+                )
+                reminder_window = windows[RAID_REMINDER_KIND]
+                start_window = windows[RAID_START_KIND]
+
                 # Raid Reminder (10 Minuten vor Start)
-                if 0 <= delta_seconds <= RAID_REMINDER_ADVANCE_SECONDS:
-                    reminder_cache_key = self._raid_reminder_cache_key(raid.id, day_label, time_label)
+                if reminder_window[0] <= now_ts <= reminder_window[1]:
+                    reminder_cache_key = reminder_window[2]
                     if self.repo.get_debug_cache(reminder_cache_key) is not None:
                         continue
 
@@ -433,8 +450,8 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
                     sent += 1
                 
                 # Raid Start Nachricht (zum Startzeitpunkt)
-                elif -RAID_START_TOLERANCE_SECONDS <= delta_seconds < 0:
-                    start_cache_key = self._raid_start_cache_key(raid.id, day_label, time_label)
+                elif start_window[0] <= now_ts <= start_window[1]:
+                    start_cache_key = start_window[2]
                     if self.repo.get_debug_cache(start_cache_key) is not None:
                         continue
 
@@ -467,27 +484,101 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
                     sent += 1
         return sent
 
-    async def _raid_reminder_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
+    def _mark_raid_reminders_dirty(self, raid_id: int) -> None:
+        """Re-evaluate one raid's reminders now (its options, votes or settings changed)."""
+        self._reminder_queue.schedule_earliest(int(raid_id), time.time())
+        self._reminder_wakeup.set()
+
+    def _next_reminder_wake(self, raid: RaidRecord, *, now_utc: datetime, attempted: bool) -> float | None:
+        """Epoch time of the raid's next reminder window that still lacks its sent marker.
+
+        A window that is already open counts as due now, or after the retry delay when
+        this pass just tried it (no participants channel, role or send failed).
+        """
+        feature_settings = self._get_guild_feature_settings(raid.guild_id)
+        if not (feature_settings.raid_reminder_enabled or feature_settings.auto_reminder_enabled):
+            return None
+        days, times = self.repo.list_raid_options(raid.id)
+        qualified_slots, _ = self.repo.qualified_slot_users(raid.id, threshold=memberlist_threshold(raid.min_players))
+        total_slots = len(days) * len(times)
+        now_ts = now_utc.timestamp()
+        candidates: list[float] = []
+        slot_times = self.repo.slot_times(raid.id)
+        for (day_label, time_label), users in qualified_slots.items():
+            start_at = slot_times.start_utc(day_label, time_label)
+            if start_at is None:
+                continue
+            windows = self._slot_reminder_windows(
+                raid,
+                feature_settings,
+                day_label=day_label,
+                time_label=time_label,
+                start_at=start_at,
+                fill_percent=self._slot_fill_percent(len(users), total_slots),
+            )
+            for opens_at, closes_at, cache_key in windows.values():
+                if now_ts > closes_at or self.repo.get_debug_cache(cache_key) is not None:
+                    continue
+                if now_ts < opens_at:
+                    candidates.append(opens_at + RAID_REMINDER_WAKE_SLACK_SECONDS)
+                elif attempted:
+                    candidates.append(min(closes_at, now_ts + RAID_REMINDER_WORKER_SLEEP_SECONDS))
+                else:
+                    candidates.append(now_ts)
+        return min(candidates, default=None)
+
+    async def _run_due_raid_reminders(self, raid_ids: Collection[int]) -> int:
+        sent = 0
+        async with self._state_lock:
             try:
-                async with self._state_lock:
-                    sent = await self._run_raid_reminders_once()
-                    auto_sent = await self._run_auto_reminders_once()
-                    if sent > 0 or auto_sent > 0:
-                        await self._persist(dirty_tables={"debug_cache"})
+                sent = await self._run_raid_reminders_once(raid_ids=raid_ids)
+                sent += await self._run_auto_reminders_once(raid_ids=raid_ids)
+                if sent > 0:
+                    await self._persist(dirty_tables={"debug_cache"})
             except Exception:
                 log.exception("Raid reminder worker failed")
-            await asyncio.sleep(RAID_REMINDER_WORKER_SLEEP_SECONDS)
+            now_utc = datetime.now(UTC)
+            queue = self._reminder_queue
+            for raid in self._open_raids_for_reminders(raid_ids):
+                wake_at = self._next_reminder_wake(raid, now_utc=now_utc, attempted=True)
+                if wake_at is not None:
+                    queue.schedule_earliest(int(raid.id), wake_at)
+        return sent
+
+    async def _raid_reminder_worker(self) -> None:
+        queue = self._reminder_queue
+        wakeup = self._reminder_wakeup
+        for raid in self.repo.list_open_raids():
+            queue.schedule_earliest(int(raid.id), time.time())
+        while not self.is_closed():
+            wakeup.clear()
+            due_raid_ids = queue.pop_due(time.time())
+            if due_raid_ids:
+                with self.task_registry.track_iteration("raid_reminder_worker"):
+                    await self._run_due_raid_reminders(due_raid_ids)
+                continue
+            next_due = queue.next_due()
+            delay = RAID_REMINDER_MAX_IDLE_SECONDS
+            if next_due is not None:
+                delay = min(delay, max(0.0, next_due - time.time()))
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
 
-    async def _run_auto_reminders_once(self, *, now_utc: datetime | None = None) -> int:
+    async def _run_auto_reminders_once(
+        self,
+        *,
+        now_utc: datetime | None = None,
+        raid_ids: Collection[int] | None = None,
+    ) -> int:
         """Send auto-reminders 2h before raid if slots < 50% filled."""
-        berlin_tz = ZoneInfo("Europe/Berlin")
+        berlin_tz = _zoneinfo_for_name(DEFAULT_TIMEZONE_NAME)
         current_berlin = now_utc.astimezone(berlin_tz) if now_utc else datetime.now(berlin_tz)
         sent = 0
         participants_channel_by_id: dict[int, Any | None] = {}
         
-        for raid in self.repo.list_open_raids():
+        for raid in self._open_raids_for_reminders(raid_ids):
             feature_settings = self._get_guild_feature_settings(raid.guild_id)
             if not feature_settings.auto_reminder_enabled:
                 continue
@@ -505,72 +596,74 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
                 continue
 
             days, times = self.repo.list_raid_options(raid.id)
-            day_users, time_users = self.repo.vote_user_sets(raid.id)
-            threshold = memberlist_threshold(raid.min_players)
-            qualified_slots, _ = compute_qualified_slot_users(
-                days=days,
-                times=times,
-                day_users=day_users,
-                time_users=time_users,
-                threshold=threshold,
+            qualified_slots, _ = self.repo.qualified_slot_users(
+                raid.id,
+                threshold=memberlist_threshold(raid.min_players),
             )
             
+            slot_times = self.repo.slot_times(raid.id)
+            now_ts = current_berlin.timestamp()
             for (day_label, time_label), users in qualified_slots.items():
-                start_at = self._parse_slot_start_at_berlin(day_label, time_label)
+                start_at = slot_times.start_utc(day_label, time_label)
                 if start_at is None:
                     continue
-                
-                delta_seconds = (start_at - current_berlin).total_seconds()
-                
+
+                # Calculate fill percentage
+                total_slots = len(days) * len(times)
+                filled_slots = len(users)
+                fill_percent = self._slot_fill_percent(filled_slots, total_slots)
+                auto_window = self._slot_reminder_windows(
+                    raid,
+                    feature_settings,
+                    day_label=day_label,
+                    time_label=time_label,
+                    start_at=start_at,
+                    fill_percent=fill_percent,
+                ).get(AUTO_REMINDER_KIND)
+
                 # Auto Reminder: 2h before start if < 50% filled
-                if 0 <= delta_seconds <= AUTO_REMINDER_ADVANCE_SECONDS:
+                if auto_window is not None and auto_window[0] <= now_ts <= auto_window[1]:
                     # Check if already reminded
-                    reminder_cache_key = self._auto_reminder_cache_key(raid.id, day_label, time_label)
+                    reminder_cache_key = auto_window[2]
                     if self.repo.get_debug_cache(reminder_cache_key) is not None:
                         continue
+
+                    # Build link to original raid message
+                    raid_link = ""
+                    if raid.message_id and raid.channel_id:
+                        raid_link = f"\n🔗 [Zur Abstimmung](https://discord.com/channels/{raid.guild_id}/{raid.channel_id}/{raid.message_id})"
                     
-                    # Calculate fill percentage
-                    total_slots = len(days) * len(times)
-                    filled_slots = len(users)
-                    fill_percent = (filled_slots / total_slots * 100) if total_slots > 0 else 0
-                    
-                    if fill_percent < AUTO_REMINDER_MIN_FILL_PERCENT:
-                        # Build link to original raid message
-                        raid_link = ""
-                        if raid.message_id and raid.channel_id:
-                            raid_link = f"\n🔗 [Zur Abstimmung](https://discord.com/channels/{raid.guild_id}/{raid.channel_id}/{raid.message_id})"
-                        
-                        content = (
-                            f"📢 **Noch Plätze frei!**\n"
-                            f"🎮 **{raid.dungeon}** startet in 2 Stunden\n"
-                            f"🆔 Raid `{raid.display_id}`\n"
-                            f"📅 {day_label} um {time_label}\n"
-                            f"👥 Belegt: {filled_slots}/{total_slots} ({fill_percent:.0f}%)\n"
-                            f"➡️ Melde dich jetzt an!"
-                            f"{raid_link}"
-                        )
-                        posted = await self._send_channel_message(
-                            participants_channel,
-                            content=content,
-                        )
-                        if posted is None:
-                            continue
-                        self.repo.upsert_debug_cache(
-                            cache_key=reminder_cache_key,
-                            kind=AUTO_REMINDER_KIND,
-                            guild_id=raid.guild_id,
-                            raid_id=raid.id,
-                            message_id=posted.id,
-                            payload_hash=sha256_text(content),
-                        )
-                        sent += 1
+                    content = (
+                        f"📢 **Noch Plätze frei!**\n"
+                        f"🎮 **{raid.dungeon}** startet in 2 Stunden\n"
+                        f"🆔 Raid `{raid.display_id}`\n"
+                        f"📅 {day_label} um {time_label}\n"
+                        f"👥 Belegt: {filled_slots}/{total_slots} ({fill_percent:.0f}%)\n"
+                        f"➡️ Melde dich jetzt an!"
+                        f"{raid_link}"
+                    )
+                    posted = await self._send_channel_message(
+                        participants_channel,
+                        content=content,
+                    )
+                    if posted is None:
+                        continue
+                    self.repo.upsert_debug_cache(
+                        cache_key=reminder_cache_key,
+                        kind=AUTO_REMINDER_KIND,
+                        guild_id=raid.guild_id,
+                        raid_id=raid.id,
+                        message_id=posted.id,
+                        payload_hash=sha256_text(content),
+                    )
+                    sent += 1
         return sent
 
     @classmethod
     def _auto_reminder_cache_key(cls, raid_id: int, day_label: str, time_label: str) -> str:
         return f"{AUTO_REMINDER_CACHE_PREFIX}:{int(raid_id)}:{day_label}:{time_label}"
 
-    async def _run_integrity_cleanup_once(self) -> int:
+    async def _run_integrity_cleanup_once(self, *, include_guild_roles: bool = True) -> int:
         open_raids_by_id = {int(raid.id): raid for raid in self.repo.list_open_raids()}
         removed_rows = 0
 
@@ -604,63 +697,96 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
             self.repo.delete_debug_cache(row.cache_key)
             removed_rows += 1
 
-        for guild in list(getattr(self, "guilds", []) or []):
-            open_display_ids = {
-                int(raid.display_id)
-                for raid in self.repo.list_open_raids(guild.id)
-                if int(raid.display_id or 0) > 0
-            }
-            for role in list(getattr(guild, "roles", []) or []):
-                role_name = str(getattr(role, "name", "") or "")
-                if not role_name.startswith("DMW Raid "):
-                    continue
-                match = _SLOT_ROLE_NAME_PATTERN.match(role_name)
-                if match is None:
-                    continue
-                display_id = int(match.group("display_id"))
-                if display_id in open_display_ids:
-                    continue
-                await self._cleanup_role_members_and_delete(role, reason="DMW orphan cleanup")
+        if include_guild_roles:
+            for guild in list(getattr(self, "guilds", []) or []):
+                await self._cleanup_orphan_slot_roles_for_guild(guild)
 
         return removed_rows
 
-    async def _integrity_cleanup_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
-            try:
-                async with self._state_lock:
-                    removed_rows = await self._run_integrity_cleanup_once()
-                    if removed_rows > 0:
-                        await self._persist(dirty_tables={"debug_cache"})
-            except Exception:
-                log.exception("Integrity cleanup worker failed")
-            await asyncio.sleep(INTEGRITY_CLEANUP_SLEEP_SECONDS)
+    async def _cleanup_orphan_slot_roles_for_guild(self, guild: Any) -> int:
+        open_display_ids = {
+            int(raid.display_id)
+            for raid in self.repo.list_open_raids(guild.id)
+            if int(raid.display_id or 0) > 0
+        }
+        orphan_roles = []
+        for role in list(getattr(guild, "roles", []) or []):
+            role_name = str(getattr(role, "name", "") or "")
+            if not role_name.startswith("DMW Raid "):
+                continue
+            match = _SLOT_ROLE_NAME_PATTERN.match(role_name)
+            if match is None:
+                continue
+            display_id = int(match.group("display_id"))
+            if display_id in open_display_ids:
+                continue
+            orphan_roles.append(role)
+        for role in orphan_roles:
+            await self._cleanup_role_members_and_delete(role, reason="DMW orphan cleanup")
+        return len(orphan_roles)
+
+    async def _integrity_cleanup_job(self) -> None:
+        async with self._state_lock:
+            removed_rows = await self._run_integrity_cleanup_once(include_guild_roles=False)
+            if removed_rows > 0:
+                await self._persist(dirty_tables={"debug_cache"})
+
+    async def _integrity_cleanup_guild_job(self, guild: Any) -> None:
+        async with self._state_lock:
+            await self._cleanup_orphan_slot_roles_for_guild(guild)
+
+    def _seed_voice_sessions(self, guilds: Any) -> int:
+        """Open sessions for members already in voice (startup, guild join); events take over after."""
+        now = datetime.now(UTC)
+        seeded = 0
+        for guild in list(guilds or []):
+            for voice_channel in list(getattr(guild, "voice_channels", []) or []):
+                for member in list(getattr(voice_channel, "members", []) or []):
+                    if getattr(member, "bot", False):
+                        continue
+                    if self.leveling_service.has_voice_session(guild.id, member.id):
+                        continue
+                    self.leveling_service.on_voice_connect(guild.id, member.id, now)
+                    seeded += 1
+        return seeded
+
+    def _accrue_voice_session(
+        self,
+        guild_id: int,
+        user_id: int,
+        *,
+        now: datetime,
+        member: Any | None = None,
+        ending: bool = False,
+    ) -> bool:
+        if member is None:
+            guild = self._safe_get_guild(guild_id)
+            member = guild.get_member(user_id) if guild is not None else None
+        if not ending and getattr(getattr(member, "voice", None), "channel", None) is None:
+            # Missed the leave event (or the member is gone): close the session without credit.
+            self.leveling_service.on_voice_disconnect(guild_id, user_id)
+            return False
+        awarded = self.leveling_service.accrue_voice_xp(
+            self.repo,
+            now=now,
+            guild_id=guild_id,
+            user_id=user_id,
+            username=_member_name(member) if member is not None else None,
+            award=self._get_guild_feature_settings(guild_id).leveling_enabled,
+        )
+        return awarded > 0
 
-    async def _voice_xp_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
+    async def _voice_xp_job(self) -> None:
+        now = datetime.now(UTC)
+        due_sessions = self.leveling_service.due_voice_sessions(now)
+        if not due_sessions:
+            return
+        async with self._state_lock:
             changed = False
-            now = datetime.now(UTC)
-            async with self._state_lock:
-                for guild in self.guilds:
-                    feature_settings = self._get_guild_feature_settings(guild.id)
-                    if not feature_settings.leveling_enabled:
-                        continue
-                    for voice_channel in guild.voice_channels:
-                        for member in voice_channel.members:
-                            if member.bot:
-                                continue
-                            awarded = self.leveling_service.award_voice_xp_once(
-                                self.repo,
-                                now=now,
-                                guild_id=guild.id,
-                                user_id=member.id,
-                                username=_member_name(member),
-                            )
-                            changed = changed or awarded
-                if changed:
-                    self._level_state_dirty = True
-            await asyncio.sleep(VOICE_XP_CHECK_SECONDS)
+            for guild_id, user_id in due_sessions:
+                changed = self._accrue_voice_session(guild_id, user_id, now=now) or changed
+            if changed:
+                self._level_state_dirty = True
 
     async def _flush_level_state_if_due(self, *, force: bool = False) -> bool:
         if not self._level_state_dirty:
@@ -677,53 +803,45 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
             return True
         return False
 
-    async def _level_persist_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
-            await asyncio.sleep(LEVEL_PERSIST_WORKER_POLL_SECONDS)
-            async with self._state_lock:
-                await self._flush_level_state_if_due()
-
-    async def _username_sync_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
-            total_scanned = 0
-            total_changed = 0
-            for guild in list(self.guilds):
-                scanned, changed = await self._sync_guild_usernames(guild)
-                total_scanned += scanned
-                total_changed += changed
-                await asyncio.sleep(0)
-
-            if total_changed > 0:
-                log.info(
-                    "Username sync updated rows=%s scanned_members=%s guilds=%s",
-                    total_changed,
-                    total_scanned,
-                    len(self.guilds),
-                )
-            await asyncio.sleep(USERNAME_SYNC_WORKER_SLEEP_SECONDS)
-
-    async def _cleanup_stale_raids_once(self) -> int:
-        cutoff_hours = STALE_RAID_HOURS
-
-        stale_ids: list[int] = []
-        for raid in self.repo.list_open_raids():
-            created_at = raid.created_at
-            if created_at.tzinfo is None:
-                created_utc = created_at.replace(tzinfo=UTC)
-            else:
-                created_utc = created_at.astimezone(UTC)
-            now = datetime.now(UTC)
-            age_seconds = (now - created_utc).total_seconds()
-            if age_seconds >= cutoff_hours * 3600:
-                stale_ids.append(raid.id)
+    async def _level_persist_job(self) -> None:
+        async with self._state_lock:
+            await self._flush_level_state_if_due()
+
+    async def _username_sync_guild_job(self, guild: Any) -> None:
+        scanned, changed = await self._sync_guild_usernames(guild)
+        if changed > 0:
+            log.info(
+                "Username sync updated rows=%s scanned_members=%s guild_id=%s",
+                changed,
+                scanned,
+                getattr(guild, "id", None),
+            )
 
-        removed = 0
-        for raid_id in stale_ids:
-            raid = self.repo.get_raid(raid_id)
-            if raid is None:
-                continue
+    @staticmethod
+    def _raid_expires_at(raid: RaidRecord) -> float:
+        created_at = raid.created_at
+        if created_at.tzinfo is None:
+            created_utc = created_at.replace(tzinfo=UTC)
+        else:
+            created_utc = created_at.astimezone(UTC)
+        return created_utc.timestamp() + STALE_RAID_HOURS * 3600
+
+    def _stale_raid_expiry_queue(self) -> DueQueue[int]:
+        queue = self._stale_raid_expiry
+        if queue is None:
+            queue = DueQueue()
+            for raid in self.repo.list_open_raids():
+                queue.schedule(int(raid.id), self._raid_expires_at(raid))
+            self._stale_raid_expiry = queue
+        return queue
+
+    def _track_raid_expiry(self, raid: RaidRecord) -> None:
+        queue = self._stale_raid_expiry_queue()
+        if int(raid.id) not in queue:
+            queue.schedule(int(raid.id), self._raid_expires_at(raid))
+
+    async def _cleanup_stale_raid_messages(self, raid: RaidRecord, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
             slot_rows = list(self.repo.list_posted_slots(raid.id).values())
             await self._close_planner_message(
                 guild_id=raid.guild_id,
@@ -734,23 +852,48 @@ class RuntimeLoggingBackgroundMixin(RuntimeMixinBase):
             await self._cleanup_temp_role(raid)
             for row in slot_rows:
                 await self._delete_slot_message(row)
+
+    async def _cleanup_stale_raids_once(self) -> int:
+        queue = self._stale_raid_expiry_queue()
+        now_ts = time.time()
+        stale_raids: list[RaidRecord] = []
+        for raid_id in queue.pop_due(now_ts):
+            raid = self.repo.get_raid(raid_id)
+            if raid is None or raid.status != "open":
+                continue
+            expires_at = self._raid_expires_at(raid)
+            if expires_at > now_ts:
+                queue.schedule(raid.id, expires_at)
+                continue
+            stale_raids.append(raid)
+        if not stale_raids:
+            return 0
+
+        semaphore = asyncio.Semaphore(STALE_RAID_CLEANUP_CONCURRENCY)
+        outcomes = await asyncio.gather(
+            *(self._cleanup_stale_raid_messages(raid, semaphore) for raid in stale_raids),
+            return_exceptions=True,
+        )
+        removed = 0
+        affected_guild_ids: set[int] = set()
+        for raid, outcome in zip(stale_raids, outcomes):
+            if isinstance(outcome, BaseException):
+                log.error("Stale raid cleanup failed for raid_id=%s", raid.id, exc_info=outcome)
+                queue.schedule(raid.id, now_ts + STALE_RAID_CHECK_SECONDS)
+                continue
             self.repo.delete_raid_cascade(raid.id)
-            await self._refresh_raidlist_for_guild(raid.guild_id, force=True)
+            affected_guild_ids.add(int(raid.guild_id))
             removed += 1
 
+        for guild_id in sorted(affected_guild_ids):
+            await self._refresh_raidlist_for_guild(guild_id, force=True)
         if removed:
             await self._persist()
         return removed
 
-    async def _stale_raid_worker(self) -> None:
-        await self.wait_until_ready()
-        while not self.is_closed():
-            try:
-                async with self._state_lock:
-                    await self._cleanup_stale_raids_once()
-            except Exception:
-                log.exception("Stale raid cleanup failed")
-            await asyncio.sleep(STALE_RAID_CHECK_SECONDS)
+    async def _stale_raid_job(self) -> None:
+        async with self._state_lock:
+            await self._cleanup_stale_raids_once()
 
     def _seed_default_dungeons(self) -> None:
         self.repo.add_dungeon(name="Nanos", short_code="NAN", sort_order=1)
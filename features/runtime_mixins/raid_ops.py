@@ -3,12 +3,13 @@ from __future__ import annotations
 import asyncio
 from dataclasses import asdict
 from datetime import UTC, date, datetime, timedelta
+from functools import partial
 import inspect
 import logging
 from pathlib import Path
 import re
 import time
-from typing import Any, AsyncIterable, Awaitable, TYPE_CHECKING, cast
+from typing import Any, AsyncIterable, Awaitable, Callable, TYPE_CHECKING, cast
 
 from bot.discord_api import app_commands, discord
 from db.repository import RaidPostedSlotRecord, RaidRecord, UserLevelRecord
@@ -18,9 +19,9 @@ from services.admin_service import cancel_all_open_raids
 from services.backup_service import export_rows_to_sql
 from services.raid_service import finish_raid, planner_counts
 from utils.hashing import sha256_text
-from utils.localization import get_string
+from utils.localization import get_string, render_raidlist_field
 from utils.runtime_helpers import *  # noqa: F401,F403
-from utils.slots import compute_qualified_slot_users, memberlist_target_label, memberlist_threshold
+from utils.slots import SlotDelta, memberlist_target_label, memberlist_threshold
 from utils.text import contains_approved_keyword, contains_nanomon_keyword
 
 if TYPE_CHECKING:
@@ -84,6 +85,7 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         normalized = (username or "").strip()
         if not normalized:
             return False
+        self._member_names.set_name(guild_id, user_id, normalized)
 
         key = (int(guild_id), int(user_id))
         row = self.repo.user_levels.get(key)
@@ -228,8 +230,60 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         posted = await _runtime_mod()._safe_send_channel_message(channel, **kwargs)
         if posted is not None:
             self._track_bot_message(posted)
+            self._message_handles.remember(
+                int(getattr(channel, "id", 0) or 0),
+                int(getattr(posted, "id", 0) or 0),
+                posted,
+            )
         return posted
 
+    def _message_handle_for(self, channel: Any, message_id: int) -> Any | None:
+        channel_id = int(getattr(channel, "id", 0) or 0)
+        handle = self._message_handles.get(channel_id, message_id)
+        if handle is None:
+            handle = _partial_message(channel, message_id)
+        return handle
+
+    async def _edit_message_by_id(self, channel: Any, message_id: int, **kwargs: Any) -> Any | None:
+        """Edit a stored message by id; returns the handle, or None if it has to be re-posted.
+
+        Only ``discord.NotFound`` means the message is gone. Any other ``discord.HTTPException``
+        is logged and re-raised so callers keep the stored id and skip the re-post this pass.
+        """
+        channel_id = int(getattr(channel, "id", 0) or 0)
+        handle = self._message_handle_for(channel, message_id)
+        if handle is None:
+            # Channels without partial-message support still need a fetch first.
+            handle = await _runtime_mod()._safe_fetch_message(channel, message_id)
+            if handle is None:
+                return None
+
+        try:
+            await handle.edit(**kwargs)
+        except discord.NotFound:
+            self._message_handles.forget(channel_id, message_id)
+            return None
+        except discord.HTTPException as exc:
+            log.warning(
+                "Editing message_id=%s in channel_id=%s failed (%s); keeping it for the next pass",
+                message_id,
+                channel_id,
+                exc,
+            )
+            raise
+        self._message_handles.remember(channel_id, message_id, handle)
+        return handle
+
+    async def _delete_message_by_id(self, channel: Any, message_id: int) -> bool:
+        channel_id = int(getattr(channel, "id", 0) or 0)
+        handle = self._message_handle_for(channel, message_id)
+        self._message_handles.forget(channel_id, message_id)
+        if handle is None:
+            handle = await _runtime_mod()._safe_fetch_message(channel, message_id)
+            if handle is None:
+                return False
+        return await _runtime_mod()._safe_delete_message(handle)
+
     def _resolve_remote_target_by_name(self, raw_value: str) -> tuple[int | None, str | None]:
         value = (raw_value or "").strip()
         if not value:
@@ -278,18 +332,33 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
                 break
         return choices
 
+    def _invalidate_channel_caches(self, channel_id: int) -> None:
+        self._channel_cache.invalidate(channel_id)
+        self._message_handles.forget_channel(channel_id)
+
     async def _get_text_channel(self, channel_id: int | None):
         if not channel_id:
             return None
         channel = self.get_channel(int(channel_id))
         if isinstance(channel, (discord.TextChannel, discord.Thread)):
             return channel
+
+        cache = self._channel_cache
+        found, cached = cache.lookup(int(channel_id))
+        if found:
+            return cached
         try:
             fetched = await self.fetch_channel(int(channel_id))
+        except (discord.NotFound, discord.Forbidden):
+            cache.store_missing(int(channel_id))
+            return None
         except Exception:
+            # Transient errors are not cached; the next call retries the fetch.
             return None
         if isinstance(fetched, (discord.TextChannel, discord.Thread)):
+            cache.store(int(channel_id), fetched)
             return fetched
+        cache.store_missing(int(channel_id))
         return None
 
     def _guild_display_name(self, guild_id: int) -> str:
@@ -362,21 +431,24 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         kind: str,
         guild_id: int,
         raid_id: int | None,
-        content: str,
+        content: str | Callable[[], str],
     ) -> None:
+        """Mirror a debug report; ``content`` may be a callable so it is only built when mirroring is on.
+
+        A matching cached hash is trusted without fetching the mirrored message.
+        """
         if debug_channel_id <= 0:
             return
-        channel = await self._get_text_channel(debug_channel_id)
-        if channel is None:
-            return
-
+        if callable(content):
+            content = content()
         payload_hash = sha256_text(content)
         cached = self.repo.get_debug_cache(cache_key)
-
         if cached is not None and cached.payload_hash == payload_hash and cached.message_id:
-            existing = await _runtime_mod()._safe_fetch_message(channel, cached.message_id)
-            if existing is not None:
-                return
+            return
+
+        channel = await self._get_text_channel(debug_channel_id)
+        if channel is None:
+            return
 
         topic = "Debug"
         if "raidlist" in cache_key:
@@ -392,19 +464,20 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         )
 
         if cached is not None and cached.message_id:
-            existing = await _runtime_mod()._safe_fetch_message(channel, cached.message_id)
+            try:
+                existing = await self._edit_message_by_id(channel, cached.message_id, embed=embed)
+            except discord.HTTPException:
+                return
             if existing is not None:
-                edited = await _runtime_mod()._safe_edit_message(existing, embed=embed)
-                if edited:
-                    self.repo.upsert_debug_cache(
-                        cache_key=cache_key,
-                        kind=kind,
-                        guild_id=guild_id,
-                        raid_id=raid_id,
-                        message_id=existing.id,
-                        payload_hash=payload_hash,
-                    )
-                    return
+                self.repo.upsert_debug_cache(
+                    cache_key=cache_key,
+                    kind=kind,
+                    guild_id=guild_id,
+                    raid_id=raid_id,
+                    message_id=existing.id,
+                    payload_hash=payload_hash,
+                )
+                return
 
         posted = await self._send_channel_message(channel, embed=embed)
         if posted is None:
@@ -453,27 +526,49 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         if not user_ids:
             return "—"
 
-        guild = self._safe_get_guild(guild_id)
-        labels: list[str] = []
-        for user_id in sorted(user_ids):
-            label: str | None = None
-            if guild is not None:
-                member = guild.get_member(int(user_id))
-                if member is not None:
-                    label = _member_name(member)
-            if not label:
-                row = self.repo.user_levels.get((int(guild_id), int(user_id)))
-                if row is not None:
-                    label = (row.username or "").strip() or None
-            labels.append(label or f"User {user_id}")
-
-        unique_labels = sorted(set(labels), key=lambda value: value.casefold())
+        names = self._member_names
+        render_key = (frozenset(int(user_id) for user_id in user_ids), int(limit))
+        cached = names.rendered(guild_id, render_key)
+        if cached is not None:
+            return cached
+
+        guild: Any = None
+        guild_loaded = False
+        fully_resolved = True
+        sort_keys: dict[str, str] = {}
+        for user_id in render_key[0]:
+            entry = names.label(guild_id, user_id)
+            if entry is None:
+                if not guild_loaded:
+                    guild = self._safe_get_guild(guild_id)
+                    guild_loaded = True
+                label: str | None = None
+                if guild is not None:
+                    member = guild.get_member(user_id)
+                    if member is not None:
+                        label = _member_name(member)
+                if not label:
+                    row = self.repo.user_levels.get((int(guild_id), user_id))
+                    if row is not None:
+                        label = (row.username or "").strip() or None
+                if label and names.set_name(guild_id, user_id, label):
+                    entry = names.label(guild_id, user_id)
+            if entry is None:
+                fully_resolved = False
+                fallback = f"User {user_id}"
+                entry = (fallback, fallback.casefold())
+            sort_keys[entry[0]] = entry[1]
+
+        unique_labels = sorted(sort_keys, key=lambda label: (sort_keys[label], label))
         lines = [f"• {label}" for label in unique_labels]
         text = "\n".join(lines[:limit])
         if len(lines) > limit:
             text += f"\n... +{len(lines) - limit} weitere"
         if len(text) > 1024:
             text = text[:1021] + "..."
+        # Placeholder names may resolve later, so only fully named lists are memoised.
+        if fully_resolved:
+            names.remember_rendered(guild_id, render_key, text)
         return text
 
     def _memberlist_slot_embed(self, raid: RaidRecord, *, day_label: str, time_label: str, users: list[int]):
@@ -497,36 +592,67 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         embed.set_footer(text="Automatisch aktualisiert durch DMW Bot")
         return embed
 
-    async def _refresh_planner_message(self, raid_id: int):
+    def _planner_vote_view(self, raid_id: int, days: list[str], times: list[str]) -> PlannerRender:
+        """Return the cached planner render, rebuilding its view only when the options changed."""
         from views.raid_views import RaidVoteView
 
+        cache = self._planner_renders
+        render = cache.get(raid_id)
+        if render is not None and render.days == tuple(days) and render.times == tuple(times):
+            return render
+        for cached_id in [cached_id for cached_id in cache if cached_id != raid_id]:
+            cached_raid = self.repo.get_raid(cached_id)
+            if cached_raid is None or cached_raid.status != "open":
+                cache.pop(cached_id, None)
+        render = PlannerRender(
+            days=tuple(days),
+            times=tuple(times),
+            view=RaidVoteView(cast("RewriteDiscordBot", self), raid_id, days, times),
+        )
+        cache[raid_id] = render
+        return render
+
+    async def _refresh_planner_message(self, raid_id: int):
         raid = self.repo.get_raid(raid_id)
         if raid is None or raid.status != "open":
+            self._planner_renders.pop(raid_id, None)
             return None
+        self._mark_raid_reminders_dirty(raid.id)
+        self._track_raid_expiry(raid)
 
         channel = await self._get_text_channel(raid.channel_id)
         if channel is None:
             return None
 
-        days, times = self.repo.list_raid_options(raid.id)
-        if not days or not times:
-            return None
-
-        embed = self._planner_embed(raid)
-        view = RaidVoteView(cast("RewriteDiscordBot", self), raid.id, days, times)
+        version = self.repo.raid_version(raid.id)
+        names_generation = self._member_names.generation(raid.guild_id)
+        render = self._planner_renders.get(raid.id)
+        if render is None or render.version != version or render.names_generation != names_generation:
+            days, times = self.repo.list_raid_options(raid.id)
+            if not days or not times:
+                return None
+            render = self._planner_vote_view(raid.id, days, times)
+            render.embed = self._planner_embed(raid)
+            render.version = version
+            render.names_generation = names_generation
 
         if raid.message_id:
-            existing = await _runtime_mod()._safe_fetch_message(channel, raid.message_id)
+            try:
+                existing = await self._edit_message_by_id(
+                    channel, raid.message_id, embed=render.embed, view=render.view, content=None
+                )
+            except discord.HTTPException:
+                return None
             if existing is not None:
-                edited = await _runtime_mod()._safe_edit_message(existing, embed=embed, view=view, content=None)
-                if edited:
-                    return existing
+                return existing
 
-        posted = await self._send_channel_message(channel, embed=embed, view=view)
+        posted = await self._send_channel_message(channel, embed=render.embed, view=render.view)
         if posted is None:
             return None
         self.repo.set_raid_message_id(raid.id, posted.id)
-        self.add_view(view, message_id=posted.id)
+        # The embed does not show the message id, so the render stays current.
+        render.version = self.repo.raid_version(raid.id)
+        self.add_view(render.view, message_id=posted.id)
         return posted
 
     async def _close_planner_message(
@@ -543,16 +669,16 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         channel = await self._get_text_channel(channel_id)
         if channel is None:
             return
-        message = await _runtime_mod()._safe_fetch_message(channel, message_id)
-        if message is None:
-            return
 
         title = f"Raid geschlossen: {reason}"
         description = f"Guild `{self._guild_display_name(guild_id)}`"
         if attendance_rows is not None:
             description += f"\nAttendance Rows: `{attendance_rows}`"
         embed = discord.Embed(title=title, description=description, color=discord.Color.red())
-        await _runtime_mod()._safe_edit_message(message, embed=embed, view=None, content=None)
+        try:
+            await self._edit_message_by_id(channel, message_id, embed=embed, view=None, content=None)
+        except discord.HTTPException:
+            pass
 
     async def _delete_slot_message(self, row: RaidPostedSlotRecord) -> bool:
         if row.channel_id is None or row.message_id is None:
@@ -560,12 +686,15 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         channel = await self._get_text_channel(row.channel_id)
         if channel is None:
             return False
-        message = await _runtime_mod()._safe_fetch_message(channel, row.message_id)
-        if message is None:
-            return False
-        return await _runtime_mod()._safe_delete_message(message)
+        return await self._delete_message_by_id(channel, row.message_id)
 
-    def _indexed_bot_message_ids_for_channel(self, guild_id: int, channel_id: int) -> set[int]:
+    def _indexed_bot_message_ids_for_channel(
+        self,
+        guild_id: int,
+        channel_id: int,
+        *,
+        bot_user_id: int | None = None,
+    ) -> set[int]:
         message_ids: set[int] = set()
         for raid in self.repo.list_open_raids(guild_id):
             if raid.channel_id == channel_id and raid.message_id:
@@ -580,8 +709,13 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             message_ids.add(int(settings.raidlist_message_id))
 
         for row in self.repo.list_debug_cache(kind=BOT_MESSAGE_KIND, guild_id=guild_id, raid_id=channel_id):
-            if row.message_id:
-                message_ids.add(int(row.message_id))
+            if not row.message_id:
+                continue
+            if bot_user_id is not None and row.cache_key != self._bot_message_cache_key(
+                guild_id, channel_id, bot_user_id, row.message_id
+            ):
+                continue
+            message_ids.add(int(row.message_id))
         return message_ids
 
     def _clear_bot_message_index_for_id(self, *, guild_id: int, channel_id: int, message_id: int) -> None:
@@ -591,9 +725,11 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             self.repo.delete_debug_cache(row.cache_key)
 
     def _clear_known_message_refs_for_id(self, *, guild_id: int, channel_id: int, message_id: int) -> None:
+        self._message_handles.forget(channel_id, message_id)
         for raid in self.repo.list_open_raids(guild_id):
             if raid.channel_id == channel_id and int(raid.message_id or 0) == int(message_id):
                 raid.message_id = None
+                self.repo.bump_raid_version(raid.id)
 
         for row in self.repo.raid_posted_slots.values():
             if row.channel_id == channel_id and int(row.message_id or 0) == int(message_id):
@@ -607,6 +743,44 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         ):
             settings.raidlist_message_id = None
 
+    async def _delete_message_ids(self, channel: Any, message_ids: list[int]) -> int:
+        """Delete messages by id without fetching them.
+
+        Messages younger than 14 days go through the bulk-delete endpoint in chunks of 100,
+        older ones are deleted one by one via partial messages. The bulk endpoint silently
+        skips ids that no longer exist, so the result counts requested deletions, not
+        confirmed ones.
+        """
+        ids = sorted({int(message_id) for message_id in message_ids if int(message_id or 0) > 0}, reverse=True)
+        if not ids:
+            return 0
+
+        channel_id = int(getattr(channel, "id", 0) or 0)
+        bulk_delete = getattr(channel, "delete_messages", None)
+        now_utc = datetime.now(UTC)
+        bulk_ids = [message_id for message_id in ids if _is_bulk_deletable(message_id, now=now_utc)] if callable(bulk_delete) else []
+        bulk_id_set = set(bulk_ids)
+        single_ids = [message_id for message_id in ids if message_id not in bulk_id_set]
+
+        requested = 0
+        handles = self._message_handles
+        for start in range(0, len(bulk_ids), BULK_DELETE_BATCH_SIZE):
+            chunk = bulk_ids[start : start + BULK_DELETE_BATCH_SIZE]
+            try:
+                await bulk_delete([discord.Object(id=message_id) for message_id in chunk])
+            except Exception:
+                log.debug("Bulk delete failed for channel_id=%s; deleting one by one", channel_id, exc_info=True)
+                single_ids.extend(chunk)
+                continue
+            requested += len(chunk)
+            for message_id in chunk:
+                handles.forget(channel_id, message_id)
+
+        for message_id in single_ids:
+            if await self._delete_message_by_id(channel, message_id):
+                requested += 1
+        return requested
+
     async def _delete_indexed_bot_messages_in_channel(self, channel: Any, *, history_limit: int = 5000) -> int:
         guild = getattr(channel, "guild", None)
         guild_id = int(getattr(guild, "id", 0) or 0)
@@ -619,10 +793,19 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             return 0
 
         limit = max(1, min(5000, int(history_limit)))
-        indexed_ids = self._indexed_bot_message_ids_for_channel(guild_id, channel_id)
+        indexed_ids = self._indexed_bot_message_ids_for_channel(guild_id, channel_id, bot_user_id=bot_user_id)
         if not indexed_ids:
             return 0
 
+        if callable(getattr(channel, "delete_messages", None)):
+            # Index only holds our own messages, so the author check (and its fetch) is not needed.
+            target_ids = sorted(indexed_ids, reverse=True)[:limit]
+            deleted = await self._delete_message_ids(channel, target_ids)
+            for message_id in target_ids:
+                self._clear_bot_message_index_for_id(guild_id=guild_id, channel_id=channel_id, message_id=message_id)
+                self._clear_known_message_refs_for_id(guild_id=guild_id, channel_id=channel_id, message_id=message_id)
+            return deleted
+
         deleted = 0
         for message_id in sorted(indexed_ids, reverse=True)[:limit]:
             try:
@@ -676,24 +859,46 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
 
         guild_id = int(getattr(getattr(channel, "guild", None), "id", 0) or 0)
         channel_id = int(getattr(channel, "id", 0) or 0)
+        supports_bulk = callable(getattr(channel, "delete_messages", None))
+        pending_ids: list[int] = []
+
+        def _clear_refs(message_id: int) -> None:
+            if guild_id > 0 and channel_id > 0 and message_id > 0:
+                self._clear_bot_message_index_for_id(
+                    guild_id=guild_id,
+                    channel_id=channel_id,
+                    message_id=message_id,
+                )
+                self._clear_known_message_refs_for_id(
+                    guild_id=guild_id,
+                    channel_id=channel_id,
+                    message_id=message_id,
+                )
+
+        async def _flush_pending() -> int:
+            if not pending_ids:
+                return 0
+            batch = list(pending_ids)
+            pending_ids.clear()
+            count = await self._delete_message_ids(channel, batch)
+            for message_id in batch:
+                _clear_refs(message_id)
+            return count
+
         try:
             async for message in history(limit=remaining):
                 if getattr(getattr(message, "author", None), "id", None) != bot_user_id:
                     continue
                 message_id = int(getattr(message, "id", 0) or 0)
+                if supports_bulk and message_id > 0:
+                    pending_ids.append(message_id)
+                    if len(pending_ids) >= BULK_DELETE_BATCH_SIZE:
+                        deleted += await _flush_pending()
+                    continue
                 if await _runtime_mod()._safe_delete_message(message):
                     deleted += 1
-                if guild_id > 0 and channel_id > 0 and message_id > 0:
-                    self._clear_bot_message_index_for_id(
-                        guild_id=guild_id,
-                        channel_id=channel_id,
-                        message_id=message_id,
-                    )
-                    self._clear_known_message_refs_for_id(
-                        guild_id=guild_id,
-                        channel_id=channel_id,
-                        message_id=message_id,
-                    )
+                _clear_refs(message_id)
+            deleted += await _flush_pending()
         except Exception:
             log.exception(
                 "Failed to sweep bot-authored messages in channel_id=%s",
@@ -701,20 +906,87 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             )
         return min(limit, deleted)
 
+    def _purge_semaphore(self, guild_id: int) -> asyncio.Semaphore:
+        semaphore = self._purge_semaphores.get(int(guild_id))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(PURGE_CHANNEL_CONCURRENCY)
+            self._purge_semaphores[int(guild_id)] = semaphore
+        return semaphore
+
+    async def _purge_bot_messages_in_channels(
+        self,
+        guild_id: int,
+        channels: list[Any],
+        *,
+        history_limit: int,
+        scan_history: bool,
+        on_progress: Callable[[int, int, int], Awaitable[None]] | None = None,
+    ) -> tuple[int, int]:
+        # Delete endpoints are bucketed per channel, so sweeps can overlap; the per-guild
+        # semaphore keeps concurrent /purgebot runs from stacking up on the global limit.
+        semaphore = self._purge_semaphore(guild_id)
+        total_deleted = 0
+        touched_channels = 0
+        finished = 0
+
+        async def _sweep(channel: Any) -> None:
+            nonlocal total_deleted, touched_channels, finished
+            deleted_here = 0
+            async with semaphore:
+                try:
+                    deleted_here = await self._delete_bot_messages_in_channel(
+                        channel,
+                        history_limit=history_limit,
+                        scan_history=scan_history,
+                    )
+                except Exception:
+                    log.exception(
+                        "purgebot failed for channel_id=%s guild_id=%s",
+                        getattr(channel, "id", None),
+                        guild_id,
+                    )
+            finished += 1
+            if deleted_here > 0:
+                total_deleted += deleted_here
+                touched_channels += 1
+            if on_progress is not None:
+                await on_progress(finished, len(channels), total_deleted)
+
+        await asyncio.gather(*(_sweep(channel) for channel in channels))
+        return total_deleted, touched_channels
+
     async def _rebuild_memberlists_for_guild(self, guild_id: int, *, participants_channel: Any) -> MemberlistRebuildStats:
         raids = list(self.repo.list_open_raids(guild_id))
         cleared_slot_rows = 0
         deleted_slot_messages = 0
+        participants_channel_id = int(getattr(participants_channel, "id", 0) or 0)
+        batch_in_participants = callable(getattr(participants_channel, "delete_messages", None))
+        batched_message_ids: list[int] = []
 
         for raid in raids:
             await self._cleanup_slot_temp_roles_for_raid(raid)
             slot_rows = list(self.repo.list_posted_slots(raid.id).values())
             for row in slot_rows:
-                if await self._delete_slot_message(row):
+                if (
+                    batch_in_participants
+                    and row.message_id is not None
+                    and int(row.channel_id or 0) == participants_channel_id
+                ):
+                    batched_message_ids.append(int(row.message_id))
+                elif await self._delete_slot_message(row):
                     deleted_slot_messages += 1
                 self.repo.delete_posted_slot(row.id)
                 cleared_slot_rows += 1
 
+        if batched_message_ids:
+            deleted_slot_messages += await self._delete_message_ids(participants_channel, batched_message_ids)
+            for message_id in batched_message_ids:
+                self._clear_bot_message_index_for_id(
+                    guild_id=guild_id,
+                    channel_id=participants_channel_id,
+                    message_id=message_id,
+                )
+
         deleted_legacy_messages = await self._delete_bot_messages_in_channel(participants_channel, history_limit=5000)
 
         created = 0
@@ -801,33 +1073,16 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         return role
 
     async def _sync_slot_role_members(self, raid: RaidRecord, *, role: Any, user_ids: list[int]) -> None:
-        guild = self._safe_get_guild(raid.guild_id)
-        if guild is None or role is None:
+        if role is None:
             return
-        desired_ids = {int(user_id) for user_id in user_ids if int(user_id) > 0}
-        current_ids = {int(getattr(member, "id", 0) or 0) for member in list(getattr(role, "members", []) or [])}
-        current_ids.discard(0)
-
-        add_ids = sorted(desired_ids - current_ids)
-        remove_ids = sorted(current_ids - desired_ids)
-
-        for member_id in add_ids:
-            member = guild.get_member(member_id)
-            if member is None or getattr(member, "bot", False):
-                continue
-            try:
-                await member.add_roles(role, reason="DMW Raid slot vote")
-            except Exception:
-                continue
+        await self._sync_slot_roles(raid, [(role, user_ids)])
 
-        for member_id in remove_ids:
-            member = guild.get_member(member_id)
-            if member is None:
-                continue
-            try:
-                await member.remove_roles(role, reason="DMW Raid slot vote removed")
-            except Exception:
-                continue
+    async def _sync_slot_roles(self, raid: RaidRecord, targets: list[tuple[Any, list[int]]]) -> None:
+        # All slot roles of a raid in one pass, so a member gaining/losing several slots costs one edit.
+        guild = self._safe_get_guild(raid.guild_id)
+        if guild is None or not targets:
+            return
+        await self._role_sync.sync(guild, targets, reason="DMW Raid slot vote")
 
     async def _resolve_role_by_id(self, guild: Any, role_id: int | None):
         normalized_id = int(role_id or 0)
@@ -854,19 +1109,17 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         return None
 
     async def _cleanup_role_members_and_delete(self, role: Any, *, reason: str) -> None:
-        for member in list(getattr(role, "members", []) or []):
+        await self._cleanup_roles_members_and_delete([role], reason=reason)
+
+    async def _cleanup_roles_members_and_delete(self, roles: list[Any], *, reason: str) -> None:
+        await self._role_sync.strip(roles, reason=reason)
+        for role in roles:
             try:
-                remove_roles = getattr(member, "remove_roles", None)
-                if callable(remove_roles):
-                    await self._await_if_needed(remove_roles(role, reason=reason))
+                delete_role = getattr(role, "delete", None)
+                if callable(delete_role):
+                    await self._await_if_needed(delete_role(reason=reason))
             except Exception:
-                continue
-        try:
-            delete_role = getattr(role, "delete", None)
-            if callable(delete_role):
-                await self._await_if_needed(delete_role(reason=reason))
-        except Exception:
-            pass
+                pass
 
     async def _cleanup_slot_temp_role(self, raid: RaidRecord, *, day_label: str, time_label: str) -> None:
         cache_key = self._slot_temp_role_cache_key(raid.id, day_label, time_label)
@@ -892,13 +1145,14 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
                 self.repo.delete_debug_cache(row.cache_key)
             return
         known_role_ids: set[int] = set()
+        roles_to_delete: list[Any] = []
         for row in rows:
             role_id = int(row.message_id or 0)
             if role_id > 0:
                 known_role_ids.add(role_id)
             role = await self._resolve_role_by_id(guild, role_id)
             if role is not None:
-                await self._cleanup_role_members_and_delete(role, reason="DMW Raid finished")
+                roles_to_delete.append(role)
             self.repo.delete_debug_cache(row.cache_key)
 
         # Fallback: if cache rows are missing, still remove slot roles that match this raid's role prefix.
@@ -911,7 +1165,10 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
                     continue
                 if not role_name.startswith(prefix):
                     continue
-                await self._cleanup_role_members_and_delete(role, reason="DMW Raid finished")
+                roles_to_delete.append(role)
+
+        if roles_to_delete:
+            await self._cleanup_roles_members_and_delete(roles_to_delete, reason="DMW Raid finished")
 
     def _clear_raid_reminder_cache(self, raid: RaidRecord) -> None:
         rows = list(self.repo.list_debug_cache(kind=RAID_REMINDER_KIND, guild_id=raid.guild_id, raid_id=raid.id))
@@ -947,7 +1204,13 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         raid_id: int,
         *,
         recreate_existing: bool = False,
+        changed_only: bool = False,
     ) -> tuple[int, int, int]:
+        """Create, edit and delete the raid's slot messages.
+
+        With ``changed_only`` only slots named in the repository's pending slot deltas (plus
+        qualified slots without a message) are re-rendered; stale slots are always removed.
+        """
         raid = self.repo.get_raid(raid_id)
         if raid is None or raid.status != "open":
             return (0, 0, 0)
@@ -974,18 +1237,13 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
                 planner_id,
             )
 
-        days, times = self.repo.list_raid_options(raid.id)
-        day_users, time_users = self.repo.vote_user_sets(raid.id)
+        slot_deltas = self.repo.take_slot_deltas(raid.id)
         threshold = memberlist_threshold(raid.min_players)
-        qualified_slots, _ = compute_qualified_slot_users(
-            days=days,
-            times=times,
-            day_users=day_users,
-            time_users=time_users,
-            threshold=threshold,
-        )
+        qualified_slots, _ = self.repo.qualified_slot_users(raid.id, threshold=threshold)
         # Debug: log when no qualified slots exist to help diagnose missing participant lists
         if not qualified_slots:
+            days, times = self.repo.list_raid_options(raid.id)
+            day_users, time_users = self.repo.vote_user_sets(raid.id)
             log.info(
                 "No qualified memberlist slots for raid_id=%s guild_id=%s days=%s times=%s day_votes=%s time_votes=%s threshold=%s",
                 raid.id,
@@ -999,15 +1257,21 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         
 
         existing_rows = self.repo.list_posted_slots(raid.id)
-        active_keys: set[tuple[str, str]] = set()
+        active_keys = set(qualified_slots)
         created = 0
         updated = 0
         deleted = 0
-        debug_lines: list[str] = []
         roles_enabled = True
+        role_targets: list[tuple[Any, list[int]]] = []
+
+        failed_slots: list[tuple[tuple[str, str], list[int]]] = []
+        slots_to_sync = list(qualified_slots.items())
+        if changed_only and slot_deltas is not None and not recreate_existing:
+            touched = {(delta.day, delta.time) for delta in slot_deltas}
+            touched.update(key for key in qualified_slots if key not in existing_rows)
+            slots_to_sync = [(key, users) for key, users in slots_to_sync if key in touched]
 
-        for (day_label, time_label), users in qualified_slots.items():
-            active_keys.add((day_label, time_label))
+        for (day_label, time_label), users in slots_to_sync:
             embed = self._memberlist_slot_embed(
                 raid,
                 day_label=day_label,
@@ -1019,41 +1283,40 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             if roles_enabled:
                 slot_role = await self._ensure_slot_temp_role(raid, day_label=day_label, time_label=time_label)
                 if slot_role is not None:
-                    await self._sync_slot_role_members(raid, role=slot_role, user_ids=users)
+                    role_targets.append((slot_role, users))
                     # Role wird nicht mehr bei der Memberliste gepingt, sondern nur beim Raid Reminder
-            debug_lines.append(f"- {day_label} {time_label}: {', '.join(f'<@{u}>' for u in users)}")
             row = existing_rows.get((day_label, time_label))
-            old_msg_for_recreate = None
+            old_channel_for_recreate = None
+            old_message_id_for_recreate: int | None = None
 
-            edited = False
             if row is not None and row.message_id is not None and not recreate_existing:
                 existing_channel = await self._get_text_channel(row.channel_id or target_channel.id)
                 if existing_channel is not None:
-                    old_msg = await _runtime_mod()._safe_fetch_message(existing_channel, row.message_id)
-                    if old_msg is not None:
-                        edited = await _runtime_mod()._safe_edit_message(
-                            old_msg,
+                    try:
+                        old_msg = await self._edit_message_by_id(
+                            existing_channel,
+                            row.message_id,
                             content=content,
                             embed=embed,
                             allowed_mentions=discord.AllowedMentions(users=True, roles=True),
                         )
-                        if edited:
-                            self.repo.upsert_posted_slot(
-                                raid_id=raid.id,
-                                day_label=day_label,
-                                time_label=time_label,
-                                channel_id=existing_channel.id,
-                                message_id=old_msg.id,
-                            )
-                            updated += 1
+                    except discord.HTTPException:
+                        failed_slots.append(((day_label, time_label), users))
+                        continue
+                    if old_msg is not None:
+                        self.repo.upsert_posted_slot(
+                            raid_id=raid.id,
+                            day_label=day_label,
+                            time_label=time_label,
+                            channel_id=existing_channel.id,
+                            message_id=old_msg.id,
+                        )
+                        updated += 1
+                        continue
 
             if row is not None and row.message_id is not None and recreate_existing:
-                existing_channel = await self._get_text_channel(row.channel_id or participants_channel.id)
-                if existing_channel is not None:
-                    old_msg_for_recreate = await _runtime_mod()._safe_fetch_message(existing_channel, row.message_id)
-
-            if edited:
-                continue
+                old_channel_for_recreate = await self._get_text_channel(row.channel_id or target_channel.id)
+                old_message_id_for_recreate = int(row.message_id)
 
             new_msg = await self._send_channel_message(
                 target_channel,
@@ -1062,6 +1325,7 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
                 allowed_mentions=discord.AllowedMentions(users=True, roles=True),
             )
             if new_msg is None:
+                failed_slots.append(((day_label, time_label), users))
                 continue
             self.repo.upsert_posted_slot(
                 raid_id=raid.id,
@@ -1075,8 +1339,25 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             else:
                 updated += 1
 
-            if old_msg_for_recreate is not None and getattr(old_msg_for_recreate, "id", None) != getattr(new_msg, "id", None):
-                await _runtime_mod()._safe_delete_message(old_msg_for_recreate)
+            if (
+                old_channel_for_recreate is not None
+                and old_message_id_for_recreate is not None
+                and old_message_id_for_recreate != getattr(new_msg, "id", None)
+            ):
+                await self._delete_message_by_id(old_channel_for_recreate, old_message_id_for_recreate)
+
+        if failed_slots:
+            # Keep the pending change of slots that did not reach Discord so the next pass retries them.
+            delta_by_key = {(delta.day, delta.time): delta for delta in slot_deltas or []}
+            self.repo.restore_slot_deltas(
+                raid.id,
+                [
+                    delta_by_key.get(key) or SlotDelta(day=key[0], time=key[1], change="changed", users=list(users))
+                    for key, users in failed_slots
+                ],
+            )
+
+        await self._sync_slot_roles(raid, role_targets)
 
         for key, row in list(existing_rows.items()):
             if key in active_keys:
@@ -1086,17 +1367,22 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             self.repo.delete_posted_slot(row.id)
             deleted += 1
 
-        debug_body = self._format_debug_report(
-            topic="Memberlist Debug",
-            guild_id=raid.guild_id,
-            summary=[
-                f"Raid: {raid.display_id}",
-                f"Dungeon: {raid.dungeon}",
-                f"Qualified Slots: {len(debug_lines)}",
-            ],
-            lines=debug_lines,
-            empty_text="- Keine qualifizierten Slots.",
-        )
+        def debug_body() -> str:
+            return self._format_debug_report(
+                topic="Memberlist Debug",
+                guild_id=raid.guild_id,
+                summary=[
+                    f"Raid: {raid.display_id}",
+                    f"Dungeon: {raid.dungeon}",
+                    f"Qualified Slots: {len(qualified_slots)}",
+                ],
+                lines=[
+                    f"- {day_label} {time_label}: {', '.join(f'<@{u}>' for u in users)}"
+                    for (day_label, time_label), users in qualified_slots.items()
+                ],
+                empty_text="- Keine qualifizierten Slots.",
+            )
+
         await self._mirror_debug_payload(
             debug_channel_id=int(self.config.memberlist_debug_channel_id),
             cache_key=f"memberlist:{raid.guild_id}:{raid.id}",
@@ -1114,6 +1400,94 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             return "`(noch kein Link)`"
         return f"https://discord.com/channels/{int(guild_id)}/{int(channel_id)}/{int(message_id)}"
 
+    def _render_raidlist_field(
+        self,
+        raid: RaidRecord,
+        *,
+        guild_id: int,
+        lang: str,
+        now_utc: datetime,
+    ) -> RaidlistFieldRender:
+        """Render one raid's raidlist field; valid until its next upcoming slot starts."""
+        days, times = self.repo.list_raid_options(raid.id)
+        day_users, time_users = self.repo.vote_user_sets(raid.id)
+        qualified_slots, _ = self.repo.qualified_slot_users(raid.id, threshold=memberlist_threshold(raid.min_players))
+        complete_voters = len(set().union(*day_users.values()).intersection(set().union(*time_users.values())))
+
+        timezone_name = DEFAULT_TIMEZONE_NAME
+
+        slot_times = self.repo.slot_times(raid.id)
+        slot_starts: list[tuple[datetime, str, str]] = []
+        for day_label, time_label in qualified_slots:
+            start_at = slot_times.start_utc(day_label, time_label)
+            if start_at is None:
+                continue
+            slot_starts.append((start_at, day_label, time_label))
+        slot_starts.sort(key=lambda item: item[0])
+
+        next_slot_text = "—"
+        next_slot_start: datetime | None = None
+        next_day = next_time = ""
+        valid_until: float | None = None
+        if slot_starts:
+            upcoming = [entry for entry in slot_starts if entry[0] >= now_utc]
+            chosen = upcoming[0] if upcoming else slot_starts[0]
+            next_slot_start, next_day, next_time = chosen
+            if upcoming:
+                valid_until = next_slot_start.timestamp()
+            unix_ts = int(next_slot_start.timestamp())
+            next_slot_text = f"\n**{next_day} {next_time}** • <t:{unix_ts}:f> (<t:{unix_ts}:R>)"
+
+        jump_url = self._raid_jump_url(guild_id, raid.channel_id, raid.message_id)
+        required_label = memberlist_target_label(raid.min_players)
+
+        field_name, field_value = render_raidlist_field(
+            lang,
+            display_id=raid.display_id,
+            dungeon=raid.dungeon,
+            players=required_label,
+            qualified_count=len(qualified_slots),
+            complete_votes=complete_voters,
+            timezone_name=timezone_name,
+            next_slot_text=next_slot_text,
+            jump_url=jump_url,
+        )
+
+        if len(field_name) > 256:
+            field_name = f"{field_name[:253]}..."
+        if len(field_value) > 1024:
+            field_value = f"{field_value[:1021]}..."
+
+        payload_fragment = "|".join(
+            [
+                f"raid={raid.id}",
+                f"display={raid.display_id}",
+                f"dungeon={raid.dungeon}",
+                f"creator={raid.creator_id}",
+                f"min={raid.min_players}",
+                f"tz={timezone_name}",
+                f"days={','.join(sorted(days))}",
+                f"times={','.join(sorted(times))}",
+                f"qualified={','.join(sorted(f'{d}@{t}' for d, t in qualified_slots))}",
+                f"msg={int(raid.message_id or 0)}",
+            ]
+        )
+        return RaidlistFieldRender(
+            guild_id=guild_id,
+            field_name=field_name,
+            field_value=field_value,
+            debug_line=(
+                f"- Raid {raid.display_id} ({raid.dungeon}) tz={timezone_name} "
+                f"slots={len(qualified_slots)} next={next_slot_text}"
+            ),
+            payload_fragment=payload_fragment,
+            qualified_count=len(qualified_slots),
+            next_slot_start=next_slot_start,
+            next_day=next_day,
+            next_time=next_time,
+            valid_until=valid_until,
+        )
+
     def _build_raidlist_embed(
         self,
         *,
@@ -1150,88 +1524,51 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             inline=False,
         )
 
+        field_cache = self._raidlist_fields
+        rendered_ids: set[int] = set()
+        now_ts = now_utc.timestamp()
         for raid in raids[:25]:
-            days, times = self.repo.list_raid_options(raid.id)
-            day_users, time_users = self.repo.vote_user_sets(raid.id)
-            threshold = memberlist_threshold(raid.min_players)
-            qualified_slots, _ = compute_qualified_slot_users(
-                days=days,
-                times=times,
-                day_users=day_users,
-                time_users=time_users,
-                threshold=threshold,
-            )
-            complete_voters = len(set().union(*day_users.values()).intersection(set().union(*time_users.values())))
-
-            timezone_name = DEFAULT_TIMEZONE_NAME
-
-            slot_starts: list[tuple[datetime, str, str]] = []
-            for day_label, time_label in qualified_slots:
-                start_at = self._parse_slot_start_at_utc(
-                    day_label,
-                    time_label,
-                    timezone_name=timezone_name,
-                )
-                if start_at is None:
-                    continue
-                slot_starts.append((start_at, day_label, time_label))
-            slot_starts.sort(key=lambda item: item[0])
-
-            next_slot_text = "—"
-            next_slot_start: datetime | None = None
-            if slot_starts:
-                upcoming = [entry for entry in slot_starts if entry[0] >= now_utc]
-                chosen = upcoming[0] if upcoming else slot_starts[0]
-                next_slot_start, next_day, next_time = chosen
-                unix_ts = int(next_slot_start.timestamp())
-                next_slot_text = f"\n**{next_day} {next_time}** • <t:{unix_ts}:f> (<t:{unix_ts}:R>)"
-
-                if global_next_start is None or (
+            cache_key = (self.repo.raid_version(raid.id), lang)
+            cached = field_cache.get(raid.id)
+            if (
+                cached is not None
+                and cached[0] == cache_key
+                and (cached[1].valid_until is None or now_ts < cached[1].valid_until)
+            ):
+                render = cached[1]
+            else:
+                render = self._render_raidlist_field(raid, guild_id=guild_id, lang=lang, now_utc=now_utc)
+                field_cache[raid.id] = (cache_key, render)
+            rendered_ids.add(raid.id)
+
+            next_slot_start = render.next_slot_start
+            if next_slot_start is not None and (
+                global_next_start is None
+                or (
                     next_slot_start >= now_utc
                     and (global_next_start < now_utc or next_slot_start < global_next_start)
-                ):
-                    global_next_start = next_slot_start
-                    global_next_label = get_string(lang, "raidlist_next_raid", display_id=raid.display_id, day=next_day, time=next_time)
-
-            total_qualified_slots += len(qualified_slots)
-            jump_url = self._raid_jump_url(guild_id, raid.channel_id, raid.message_id)
-            required_label = memberlist_target_label(raid.min_players)
-            
-            field_name = get_string(lang, "raidlist_raid_field", display_id=raid.display_id, dungeon=raid.dungeon)
-            field_value = (
-                get_string(lang, "raidlist_minimum", players=required_label) + "\n"
-                + get_string(lang, "raidlist_qualified_slots", count=len(qualified_slots)) + "\n"
-                + get_string(lang, "raidlist_votes", count=complete_voters) + "\n"
-                + get_string(lang, "raidlist_timezone", tz=timezone_name) + "\n"
-                + get_string(lang, "raidlist_next_slot") + f": {next_slot_text}\n"
-                + f"[{get_string(lang, 'raidlist_view_raid')}]({jump_url})"
-            )
-            
-            if len(field_name) > 256:
-                field_name = f"{field_name[:253]}..."
-            if len(field_value) > 1024:
-                field_value = f"{field_value[:1021]}..."
-            embed.add_field(name=field_name, value=field_value, inline=False)
-
-            debug_lines.append(
-                f"- Raid {raid.display_id} ({raid.dungeon}) tz={timezone_name} slots={len(qualified_slots)} next={next_slot_text}"
-            )
-            payload_parts.append(
-                "|".join(
-                    [
-                        f"raid={raid.id}",
-                        f"display={raid.display_id}",
-                        f"dungeon={raid.dungeon}",
-                        f"creator={raid.creator_id}",
-                        f"min={raid.min_players}",
-                        f"tz={timezone_name}",
-                        f"days={','.join(sorted(days))}",
-                        f"times={','.join(sorted(times))}",
-                        f"qualified={','.join(sorted(f'{d}@{t}' for d, t in qualified_slots))}",
-                        f"msg={int(raid.message_id or 0)}",
-                    ]
                 )
-            )
+            ):
+                global_next_start = next_slot_start
+                global_next_label = get_string(
+                    lang,
+                    "raidlist_next_raid",
+                    display_id=raid.display_id,
+                    day=render.next_day,
+                    time=render.next_time,
+                )
+
+            total_qualified_slots += render.qualified_count
+            embed.add_field(name=render.field_name, value=render.field_value, inline=False)
+            debug_lines.append(render.debug_line)
+            payload_parts.append(render.payload_fragment)
+
+        for raid_id in [
+            raid_id
+            for raid_id, (_, render) in field_cache.items()
+            if render.guild_id == guild_id and raid_id not in rendered_ids
+        ]:
+            field_cache.pop(raid_id, None)
 
         # Statistics Section
         summary_parts = [
@@ -1253,6 +1590,15 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         payload_hash = sha256_text("\n".join(payload_parts))
         return embed, payload_hash, debug_lines
 
+    def _raidlist_version_vector(self, *, guild_name: str, raids: list[RaidRecord], language: str) -> tuple[Any, ...]:
+        """Everything the raidlist render depends on, cheap to compare without rendering."""
+        return (
+            guild_name,
+            language,
+            len(raids),
+            tuple((raid.id, self.repo.raid_version(raid.id)) for raid in raids[:25]),
+        )
+
     async def _refresh_raidlist_for_guild(self, guild_id: int, *, force: bool = False) -> bool:
         settings = self.repo.ensure_settings(guild_id)
         if not settings.raidlist_channel_id:
@@ -1262,13 +1608,34 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         guild_name = guild.name if guild is not None else (settings.guild_name or self._guild_display_name(guild_id))
         raids = self.repo.list_open_raids(guild_id)
         language = settings.language if hasattr(settings, 'language') else "de"
+        render_state = self._raidlist_render_state
+        vector = self._raidlist_version_vector(guild_name=guild_name, raids=raids, language=language)
+        previous = render_state.get(guild_id)
+        if (
+            not force
+            and previous is not None
+            and previous[0] == vector
+            and (previous[1] is None or time.time() < previous[1])
+            and self._raidlist_hash_by_guild.get(guild_id) == previous[2]
+        ):
+            await self._mirror_debug_payload(
+                debug_channel_id=int(self.config.raidlist_debug_channel_id),
+                cache_key=f"raidlist:{guild_id}:0",
+                kind="raidlist",
+                guild_id=guild_id,
+                raid_id=None,
+                content=previous[3],
+            )
+            return False
+
         embed, payload_hash, debug_lines = self._build_raidlist_embed(
             guild_id=guild_id,
             guild_name=guild_name,
             raids=raids,
             language=language,
         )
-        debug_payload = self._format_debug_report(
+        debug_payload = partial(
+            self._format_debug_report,
             topic="Raidlist Debug",
             guild_id=guild_id,
             summary=[
@@ -1279,6 +1646,13 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             lines=debug_lines,
             empty_text="- Keine Raidlist-Daten.",
         )
+        field_cache = self._raidlist_fields
+        expiries = [
+            cached[1].valid_until
+            for cached in (field_cache.get(raid.id) for raid in raids[:25])
+            if cached is not None and cached[1].valid_until is not None
+        ]
+        render_state[guild_id] = (vector, min(expiries, default=None), payload_hash, debug_payload)
 
         if not force and self._raidlist_hash_by_guild.get(guild_id) == payload_hash:
             await self._mirror_debug_payload(
@@ -1296,19 +1670,23 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
             return False
 
         if settings.raidlist_message_id:
-            message = await _runtime_mod()._safe_fetch_message(channel, settings.raidlist_message_id)
+            try:
+                message = await self._edit_message_by_id(
+                    channel, settings.raidlist_message_id, content=None, embed=embed
+                )
+            except discord.HTTPException:
+                return False
             if message is not None:
-                if await _runtime_mod()._safe_edit_message(message, content=None, embed=embed):
-                    self._raidlist_hash_by_guild[guild_id] = payload_hash
-                    await self._mirror_debug_payload(
-                        debug_channel_id=int(self.config.raidlist_debug_channel_id),
-                        cache_key=f"raidlist:{guild_id}:0",
-                        kind="raidlist",
-                        guild_id=guild_id,
-                        raid_id=None,
-                        content=debug_payload,
-                    )
-                    return True
+                self._raidlist_hash_by_guild[guild_id] = payload_hash
+                await self._mirror_debug_payload(
+                    debug_channel_id=int(self.config.raidlist_debug_channel_id),
+                    cache_key=f"raidlist:{guild_id}:0",
+                    kind="raidlist",
+                    guild_id=guild_id,
+                    raid_id=None,
+                    content=debug_payload,
+                )
+                return True
 
         posted = await self._send_channel_message(channel, embed=embed)
         if posted is None:
@@ -1334,6 +1712,7 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
     async def _refresh_raidlist_for_guild_persisted(self, guild_id: int) -> None:
         async with self._state_lock:
             await self._refresh_raidlist_for_guild(guild_id)
+            await self._refresh_raid_calendar_for_guild(guild_id)
             persisted = await self._persist(dirty_tables={"settings", "debug_cache"})
         if not persisted:
             log.warning("Debounced raidlist refresh persisted failed for guild %s", guild_id)
@@ -1344,14 +1723,57 @@ class RuntimeRaidOpsMixin(RuntimeMixinBase):
         for guild_id in sorted(guild_ids):
             await self._refresh_raidlist_for_guild(guild_id, force=force)
 
+    async def _run_raid_ui_update(self, key: Any) -> None:
+        kind, raid_id = key
+        if kind == "planner":
+            await self._refresh_planner_message(int(raid_id))
+            dirty_tables = {"raids"}
+        elif kind == "memberlist":
+            await self._sync_memberlist_messages_for_raid(int(raid_id), changed_only=True)
+            dirty_tables = {"raid_posted_slots", "debug_cache"}
+        else:
+            log.warning("Unknown raid UI update key=%s", key)
+            return
+        async with self._state_lock:
+            persisted = await self._persist(dirty_tables=dirty_tables)
+        if not persisted:
+            log.warning("Debounced %s refresh persist failed for raid_id=%s", kind, raid_id)
+
     async def _sync_vote_ui_after_change(self, raid_id: int) -> None:
         raid = self.repo.get_raid(raid_id)
         if raid is None or raid.status != "open":
             return
-        await self._refresh_planner_message(raid.id)
-        await self._sync_memberlist_messages_for_raid(raid.id)
+        # Vote bursts on one raid collapse into one planner/memberlist render per debounce window.
+        self.raid_ui_updater.mark_dirty(("planner", raid.id))
+        self.raid_ui_updater.mark_dirty(("memberlist", raid.id))
+        self._mark_raid_reminders_dirty(raid.id)
         await self._schedule_raidlist_refresh(raid.guild_id)
 
+    def _enqueue_vote_ui_sync(self, raid_id: int, *, interaction: Any = None, voted_at: float | None = None) -> None:
+        """Queue planner/memberlist/raidlist sync + persist after a vote that was already acked."""
+        self._vote_ui_waiters.setdefault(int(raid_id), []).append(
+            (interaction, voted_at if voted_at is not None else time.monotonic())
+        )
+        self._vote_ui_pipeline.submit(("vote_ui", int(raid_id)), lambda: self._settle_vote_ui(int(raid_id)))
+
+    async def _settle_vote_ui(self, raid_id: int) -> None:
+        waiters = self._vote_ui_waiters.pop(int(raid_id), [])
+        try:
+            await self._sync_vote_ui_after_change(raid_id)
+        except Exception:
+            log.exception("Vote UI sync failed for raid_id=%s", raid_id)
+
+        async with self._state_lock:
+            persisted = await self._persist(dirty_tables={"raid_votes", "raid_posted_slots", "raids", "debug_cache"})
+
+        await self.raid_ui_updater.wait_idle(("planner", int(raid_id)))
+        await self.raid_ui_updater.wait_idle(("memberlist", int(raid_id)))
+        settled_at = time.monotonic()
+        for interaction, voted_at in waiters:
+            self._metrics.observe("vote_ui_settle", settled_at - voted_at)
+            if not persisted and interaction is not None:
+                await _safe_followup(interaction, "Stimme gesetzt, aber DB-Speicherung fehlgeschlagen.", ephemeral=True)
+
     async def _finish_raid_interaction(self, interaction, *, raid_id: int, deferred: bool) -> None:
         async with self._state_lock:
             raid = self.repo.get_raid(raid_id)
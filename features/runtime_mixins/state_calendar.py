@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from dataclasses import asdict
 from datetime import UTC, date, datetime, timedelta
 import inspect
@@ -215,6 +216,8 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
             payload_hash=payload_hash,
         )
         self._guild_feature_settings[normalized_guild_id] = normalized
+        for raid in self.repo.list_open_raids(normalized_guild_id):
+            self._mark_raid_reminders_dirty(raid.id)
         return normalized
 
     @staticmethod
@@ -249,6 +252,7 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
             self.repo.delete_debug_cache(message_key)
             self._raid_calendar_hash_by_guild.pop(normalized_guild_id, None)
             self._raid_calendar_month_key_by_guild.pop(normalized_guild_id, None)
+            self._raid_calendar_renders.pop(normalized_guild_id, None)
             return None
 
         payload_hash = sha256_text(f"channel={normalized_channel_id}")
@@ -289,21 +293,15 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
         month_end: date,
     ) -> list[CalendarEntry]:
         entries: list[CalendarEntry] = []
-        for raid in self.repo.list_open_raids(guild_id):
-            day_labels, _time_labels = self.repo.list_raid_options(raid.id)
-            seen_dates: set[date] = set()
-            for day_label in day_labels:
-                parsed_date = _parse_raid_date_from_label(day_label)
-                if parsed_date is None:
-                    continue
-                if parsed_date < month_start or parsed_date > month_end:
+        by_date = self.repo.raid_ids_by_date(guild_id, start=month_start, end=month_end)
+        for entry_date, raid_ids in by_date.items():
+            for raid_id in raid_ids:
+                raid = self.repo.get_raid(raid_id)
+                if raid is None:
                     continue
-                if parsed_date in seen_dates:
-                    continue
-                seen_dates.add(parsed_date)
                 entries.append(
                     CalendarEntry(
-                        entry_date=parsed_date,
+                        entry_date=entry_date,
                         label=f"#{raid.display_id} {raid.dungeon}",
                         source="raid",
                     )
@@ -417,6 +415,31 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
         payload_hash = sha256_text("\n".join(payload_parts))
         return embed, payload_hash, debug_lines
 
+    def _render_raid_calendar(self, *, guild_id: int, guild_name: str, month_start: date) -> tuple[Any, str, list[str]]:
+        """Calendar embed for one month, reused while the guild's raid dates are unchanged."""
+        normalized_month = _month_start(month_start)
+        today_local = datetime.now(_zoneinfo_for_name(DEFAULT_TIMEZONE_NAME)).date()
+        key = (_month_key(normalized_month), self.repo.calendar_version(guild_id), today_local, guild_name)
+        renders = self._raid_calendar_renders.setdefault(int(guild_id), OrderedDict())
+        cached = renders.get(key)
+        if cached is not None:
+            renders.move_to_end(key)
+            return cached
+        rendered = self._build_raid_calendar_embed(
+            guild_id=guild_id,
+            guild_name=guild_name,
+            month_start=normalized_month,
+        )
+        renders[key] = rendered
+        while len(renders) > RAID_CALENDAR_RENDER_CACHE_MONTHS:
+            renders.popitem(last=False)
+        return rendered
+
+    def _raid_calendar_view(self, guild_id: int) -> Any:
+        from views.raid_views import RaidCalendarView
+
+        return RaidCalendarView(cast("RewriteDiscordBot", self), guild_id=int(guild_id))
+
     async def _refresh_raid_calendar_for_guild(
         self,
         guild_id: int,
@@ -428,24 +451,57 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
         if channel_id is None:
             return False
 
-        # Raid Calendar Feature deaktiviert
-        return False
+        normalized_guild_id = int(guild_id)
+        target_month = self._resolve_raid_calendar_month_start(normalized_guild_id, month_start)
+        month_key = _month_key(target_month)
+        settings = self.repo.ensure_settings(normalized_guild_id)
+        guild = self.get_guild(normalized_guild_id)
+        guild_name = guild.name if guild is not None else (
+            settings.guild_name or self._guild_display_name(normalized_guild_id)
+        )
+        embed, payload_hash, _debug_lines = self._render_raid_calendar(
+            guild_id=normalized_guild_id,
+            guild_name=guild_name,
+            month_start=target_month,
+        )
+        state_row = self._get_raid_calendar_state_row(normalized_guild_id)
+        if (
+            not force
+            and state_row is not None
+            and int(state_row.message_id or 0) > 0
+            and self._raid_calendar_hash_by_guild.get(normalized_guild_id) == payload_hash
+            and self._raid_calendar_month_key_by_guild.get(normalized_guild_id) == month_key
+        ):
+            return False
+
+        channel = await self._get_text_channel(channel_id)
+        if channel is None:
+            return False
+        view = self._raid_calendar_view(normalized_guild_id)
+
         if state_row is not None and int(state_row.message_id or 0) > 0:
-            existing = await _safe_fetch_message(channel, int(state_row.message_id))
+            try:
+                existing = await self._edit_message_by_id(
+                    channel,
+                    int(state_row.message_id),
+                    content=None,
+                    embed=embed,
+                    view=view,
+                )
+            except discord.HTTPException:
+                return False
             if existing is not None:
-                edited = await _safe_edit_message(existing, content=None, embed=embed, view=view)
-                if edited:
-                    self.repo.upsert_debug_cache(
-                        cache_key=self._raid_calendar_message_cache_key(guild_id),
-                        kind=RAID_CALENDAR_MESSAGE_KIND,
-                        guild_id=int(guild_id),
-                        raid_id=month_key,
-                        message_id=int(existing.id),
-                        payload_hash=payload_hash,
-                    )
-                    self._raid_calendar_hash_by_guild[int(guild_id)] = payload_hash
-                    self._raid_calendar_month_key_by_guild[int(guild_id)] = month_key
-                    return True
+                self.repo.upsert_debug_cache(
+                    cache_key=self._raid_calendar_message_cache_key(guild_id),
+                    kind=RAID_CALENDAR_MESSAGE_KIND,
+                    guild_id=int(guild_id),
+                    raid_id=month_key,
+                    message_id=int(existing.id),
+                    payload_hash=payload_hash,
+                )
+                self._raid_calendar_hash_by_guild[int(guild_id)] = payload_hash
+                self._raid_calendar_month_key_by_guild[int(guild_id)] = month_key
+                return True
 
         posted = await self._send_channel_message(channel, embed=embed, view=view)
         if posted is None:
@@ -556,6 +612,17 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
         await self._refresh_raid_calendar_for_guild(guild_id, force=True, month_start=target_month)
         return target_month
 
+    async def _navigate_raid_calendar(self, interaction: Any, *, guild_id: int, delta_months: int) -> None:
+        await self._defer(interaction, ephemeral=True)
+        async with self._state_lock:
+            if delta_months == 0:
+                target_month = self._current_calendar_month_start()
+                await self._refresh_raid_calendar_for_guild(guild_id, force=True, month_start=target_month)
+            else:
+                target_month = await self._shift_raid_calendar_month(guild_id, delta_months=delta_months)
+            await self._persist(dirty_tables={"debug_cache"})
+        await _safe_followup(interaction, f"Kalender: {_month_label_de(target_month)}", ephemeral=True)
+
     async def _force_raid_calendar_refresh(self, guild_id: int) -> None:
         await self._refresh_raid_calendar_for_guild(guild_id, force=True)
 
@@ -600,8 +667,12 @@ class RuntimeStateCalendarMixin(RuntimeMixinBase):
             await self._refresh_raid_calendar_for_guild(guild_id, force=force)
 
     def _restore_persistent_raid_calendar_views(self) -> None:
-        # Raid Calendar Feature deaktiviert
-        pass
+        for row in self.repo.list_debug_cache(kind=RAID_CALENDAR_MESSAGE_KIND):
+            guild_id = int(row.guild_id or 0)
+            message_id = int(row.message_id or 0)
+            if guild_id <= 0 or message_id <= 0 or self._get_raid_calendar_channel_id(guild_id) is None:
+                continue
+            self.add_view(self._raid_calendar_view(guild_id), message_id=message_id)
 
     async def _refresh_application_owner_ids(self) -> None:
         if self._application_owner_ids:
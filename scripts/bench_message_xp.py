@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bot.runtime import GuildFeatureSettings, RewriteDiscordBot  # noqa: E402
+from db.repository import InMemoryRepository  # noqa: E402
+from services.leveling_service import LevelingService  # noqa: E402
+
+
+def _build_bot(*, precheck: bool) -> RewriteDiscordBot:
+    bot = object.__new__(RewriteDiscordBot)
+    bot.log_channel = None
+    bot._slash_command_names = {"status"}
+    bot._state_lock = asyncio.Lock()
+    bot._level_state_dirty = False
+    bot.repo = InMemoryRepository()
+    bot.leveling_service = LevelingService()
+    settings = GuildFeatureSettings(
+        leveling_enabled=True,
+        levelup_messages_enabled=False,
+        nanomon_reply_enabled=False,
+        approved_reply_enabled=False,
+        message_xp_interval_seconds=15,
+        levelup_message_cooldown_seconds=20,
+    )
+    bot._get_guild_feature_settings = lambda _guild_id: settings
+    if not precheck:
+        # Disable the lock-free cooldown pre-check; update_message_xp still enforces the cooldown.
+        bot.leveling_service.message_xp_on_cooldown = lambda **_kwargs: False
+    return bot
+
+
+def _message(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        author=SimpleNamespace(bot=False, id=user_id, mention=f"<@{user_id}>", display_name=f"User{user_id}"),
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=10),
+        content="flood message",
+    )
+
+
+async def _lock_holder(bot: RewriteDiscordBot, stop: asyncio.Event, hold_seconds: float, every_seconds: float) -> None:
+    """Simulates persistence/background work periodically holding the state lock."""
+    while not stop.is_set():
+        await asyncio.sleep(every_seconds)
+        async with bot._state_lock:
+            await asyncio.sleep(hold_seconds)
+
+
+async def _run_flood(*, precheck: bool, rate: int, seconds: float, users: int, hold_ms: float, every_ms: float) -> dict:
+    bot = _build_bot(precheck=precheck)
+    messages = [_message(1000 + (index % users)) for index in range(int(rate * seconds))]
+    stop = asyncio.Event()
+    holder = asyncio.create_task(_lock_holder(bot, stop, hold_ms / 1000, every_ms / 1000))
+    latencies: list[float] = []
+
+    async def _handle(message) -> None:
+        started = time.perf_counter()
+        await RewriteDiscordBot.on_message(bot, message)
+        latencies.append(time.perf_counter() - started)
+
+    handlers: list[asyncio.Task[None]] = []
+    interval = 1.0 / rate
+    started_at = time.perf_counter()
+    for index, message in enumerate(messages):
+        delay = started_at + index * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        handlers.append(asyncio.create_task(_handle(message)))
+    await asyncio.gather(*handlers)
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    holder.cancel()
+    await asyncio.gather(holder, return_exceptions=True)
+
+    latencies.sort()
+    return {
+        "messages": len(messages),
+        "handled_per_second": len(messages) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+async def _run_throughput(*, precheck: bool, count: int, users: int) -> float:
+    bot = _build_bot(precheck=precheck)
+    messages = [_message(1000 + (index % users)) for index in range(count)]
+    started = time.perf_counter()
+    for message in messages:
+        await RewriteDiscordBot.on_message(bot, message)
+    return count / (time.perf_counter() - started)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    for precheck in (False, True):
+        label = "lock-free pre-check" if precheck else "lock on every message"
+        throughput = await _run_throughput(precheck=precheck, count=args.count, users=args.users)
+        flood = await _run_flood(
+            precheck=precheck,
+            rate=args.rate,
+            seconds=args.seconds,
+            users=args.users,
+            hold_ms=args.hold_ms,
+            every_ms=args.every_ms,
+        )
+        print(f"[{label}]")
+        print(f"  sequential throughput: {throughput:,.0f} msg/s")
+        print(
+            f"  {args.rate} msg/s flood: handled {flood['handled_per_second']:,.0f} msg/s, "
+            f"p50 {flood['p50_ms']:.2f} ms, p95 {flood['p95_ms']:.2f} ms, max {flood['max_ms']:.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark on_message XP handling under a chat flood.")
+    parser.add_argument("--rate", type=int, default=500, help="Messages per second in the flood.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Flood duration.")
+    parser.add_argument("--users", type=int, default=50, help="Distinct chatting users.")
+    parser.add_argument("--count", type=int, default=20_000, help="Messages for the sequential throughput run.")
+    parser.add_argument("--hold-ms", type=float, default=50.0, help="How long background work holds the state lock.")
+    parser.add_argument("--every-ms", type=float, default=250.0, help="Pause between background lock holds.")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
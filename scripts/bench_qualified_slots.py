@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db.repository import InMemoryRepository  # noqa: E402
+from utils.slots import compute_qualified_slot_users  # noqa: E402
+
+
+# (name, days, times, voters, vote probability per option, min players)
+SHAPES = [
+    ("small", 3, 3, 8, 0.6, 1),
+    ("weekly", 7, 6, 40, 0.4, 5),
+    ("busy", 14, 10, 120, 0.35, 8),
+    ("max", 25, 25, 250, 0.3, 10),
+    ("max-sparse", 25, 25, 250, 0.05, 1),
+]
+
+
+def _set_intersection(*, days, times, day_users, time_users, threshold):
+    """The previous implementation, kept here as the baseline."""
+    qualified = {}
+    all_users = set()
+    for day in days:
+        for time_label in times:
+            users = sorted(day_users.get(day, set()).intersection(time_users.get(time_label, set())))
+            if len(users) < threshold:
+                continue
+            qualified[(day, time_label)] = users
+            all_users.update(users)
+    return qualified, all_users
+
+
+def _shape_votes(rng: random.Random, days: int, times: int, voters: int, probability: float):
+    day_labels = [f"2026-03-{index + 1:02d}" for index in range(days)]
+    time_labels = [f"{18 + index // 4:02d}:{(index % 4) * 15:02d}" for index in range(times)]
+    user_ids = rng.sample(range(10**17, 10**18), voters)
+    day_users = {label: {user for user in user_ids if rng.random() < probability} for label in day_labels}
+    time_users = {label: {user for user in user_ids if rng.random() < probability} for label in time_labels}
+    return day_labels, time_labels, day_users, time_users
+
+
+def _time_per_call(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def _cached_repo(days, times, day_users, time_users, threshold):
+    repo = InMemoryRepository()
+    raid = repo.create_raid(guild_id=1, planner_channel_id=1, creator_id=1, dungeon="Bench", min_players=threshold)
+    repo.add_raid_options(raid.id, days=days, times=times)
+    for label, users in day_users.items():
+        for user_id in users:
+            repo.toggle_vote(raid_id=raid.id, kind="day", option_label=label, user_id=user_id)
+    for label, users in time_users.items():
+        for user_id in users:
+            repo.toggle_vote(raid_id=raid.id, kind="time", option_label=label, user_id=user_id)
+    return repo, raid.id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark qualified-slot computation over realistic raid shapes.")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per shape and implementation.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for vote generation.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'shape':<11} {'slots':>6} {'sets (us)':>10} {'bitset (us)':>12} {'speedup':>8} {'cached (us)':>12}")
+    for name, days, times, voters, probability, threshold in SHAPES:
+        day_labels, time_labels, day_users, time_users = _shape_votes(rng, days, times, voters, probability)
+        kwargs = dict(days=day_labels, times=time_labels, day_users=day_users, time_users=time_users, threshold=threshold)
+        assert compute_qualified_slot_users(**kwargs) == _set_intersection(**kwargs)
+
+        baseline = _time_per_call(lambda: _set_intersection(**kwargs), args.iterations)
+        bitset = _time_per_call(lambda: compute_qualified_slot_users(**kwargs), args.iterations)
+        repo, raid_id = _cached_repo(day_labels, time_labels, day_users, time_users, threshold)
+        repo.qualified_slot_users(raid_id, threshold=threshold)
+        cached = _time_per_call(lambda: repo.qualified_slot_users(raid_id, threshold=threshold), args.iterations)
+        print(
+            f"{name:<11} {days * times:>6} {baseline * 1e6:>10.1f} {bitset * 1e6:>12.1f} "
+            f"{baseline / bitset:>7.1f}x {cached * 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+import logging
 import math
 
 from db.repository import InMemoryRepository
+from utils.cooldowns import ExpiringKeyMap
+from utils.due_queue import DueQueue
 from utils.leveling import calculate_level_from_xp
 
 
@@ -12,6 +15,11 @@ VOICE_XP_AWARD_INTERVAL = timedelta(hours=1)
 MESSAGE_XP_AWARD_INTERVAL = timedelta(seconds=30)
 LEVELUP_MESSAGE_COOLDOWN = timedelta(seconds=30)
 DEFAULT_MESSAGE_XP_GAIN = 5
+# Voice sessions whose anchor has not advanced for this long are treated as abandoned.
+VOICE_SESSION_IDLE_TTL = timedelta(hours=6)
+LEVELING_STATE_MAX_ENTRIES = 100_000
+
+log = logging.getLogger("dmw.leveling")
 
 
 @dataclass(slots=True)
@@ -23,10 +31,47 @@ class LevelUpdateResult:
 
 
 class LevelingService:
-    def __init__(self) -> None:
-        self._last_voice_award: dict[tuple[int, int], datetime] = {}
-        self._last_message_award: dict[tuple[int, int], datetime] = {}
-        self._last_levelup_announcement: dict[tuple[int, int], tuple[int, datetime]] = {}
+    def __init__(self, *, max_entries: int = LEVELING_STATE_MAX_ENTRIES) -> None:
+        # Each map drops entries once their interval has passed and holds at most ``max_entries``.
+        self._last_voice_award: ExpiringKeyMap[tuple[int, int], datetime] = ExpiringKeyMap(max_entries=max_entries)
+        # Next hourly award boundary per open voice session.
+        self._voice_award_due: DueQueue[tuple[int, int]] = DueQueue()
+        self._last_message_award: ExpiringKeyMap[tuple[int, int], datetime] = ExpiringKeyMap(max_entries=max_entries)
+        self._last_levelup_announcement: ExpiringKeyMap[tuple[int, int], tuple[int, datetime]] = ExpiringKeyMap(
+            max_entries=max_entries
+        )
+
+    def state_sizes(self, now: datetime | None = None) -> dict[str, int]:
+        """Prune expired entries and report how many remain per map."""
+        now_ts = self._normalize_ts(now).timestamp()
+        maps = {
+            "message_cooldowns": self._last_message_award,
+            "levelup_announcements": self._last_levelup_announcement,
+            "voice_sessions": self._last_voice_award,
+        }
+        sizes: dict[str, int] = {}
+        for name, entries in maps.items():
+            entries.prune(now_ts)
+            sizes[name] = len(entries)
+        sizes["voice_due"] = len(self._voice_award_due)
+        sizes["voice_sessions_evicted"] = self._last_voice_award.evicted
+        return sizes
+
+    def _set_voice_anchor(self, key: tuple[int, int], anchor: datetime) -> None:
+        evicted_before = self._last_voice_award.evicted
+        self._last_voice_award.set(
+            key,
+            anchor,
+            expires_at=(anchor + VOICE_SESSION_IDLE_TTL).timestamp(),
+            now=anchor.timestamp(),
+        )
+        evicted = self._last_voice_award.evicted - evicted_before
+        if evicted > 0:
+            log.warning(
+                "Voice session cap reached; evicted %s live session anchor(s) (total %s)",
+                evicted,
+                self._last_voice_award.evicted,
+            )
 
     @staticmethod
     def _normalize_xp_gain(value: int) -> int:
@@ -70,6 +115,20 @@ class LevelingService:
             return 0
         return parsed if parsed > 0 else 0
 
+    def message_xp_on_cooldown(
+        self,
+        *,
+        guild_id: int,
+        user_id: int,
+        now: datetime | None = None,
+        min_award_interval: timedelta = MESSAGE_XP_AWARD_INTERVAL,
+    ) -> bool:
+        """Whether ``update_message_xp`` would skip this user; reads no repository state."""
+        timestamp = self._normalize_ts(now)
+        safe_interval = self._normalize_interval(min_award_interval, MESSAGE_XP_AWARD_INTERVAL)
+        last_award = self._last_message_award.get((guild_id, user_id), timestamp.timestamp())
+        return last_award is not None and (timestamp - last_award) < safe_interval
+
     def update_message_xp(
         self,
         repo: InMemoryRepository,
@@ -90,8 +149,9 @@ class LevelingService:
         row.username = username
 
         key = (guild_id, user_id)
-        last_award = self._last_message_award.get(key)
-        if last_award is not None and (timestamp - last_award) < safe_interval:
+        if self.message_xp_on_cooldown(
+            guild_id=guild_id, user_id=user_id, now=timestamp, min_award_interval=safe_interval
+        ):
             return LevelUpdateResult(
                 previous_level=max(0, int(row.level)),
                 current_level=max(0, int(row.level)),
@@ -115,7 +175,12 @@ class LevelingService:
         next_xp = self._normalize_total_xp(current_xp + gained_xp_int)
         row.xp = next_xp
         row.level = calculate_level_from_xp(next_xp)
-        self._last_message_award[key] = timestamp
+        self._last_message_award.set(
+            key,
+            timestamp,
+            expires_at=(timestamp + safe_interval).timestamp(),
+            now=timestamp.timestamp(),
+        )
         return LevelUpdateResult(
             previous_level=previous_level,
             current_level=max(0, int(row.level)),
@@ -145,7 +210,8 @@ class LevelingService:
         timestamp = self._normalize_ts(now)
         safe_interval = self._normalize_interval(min_announce_interval, LEVELUP_MESSAGE_COOLDOWN)
         key = (guild_id, user_id)
-        previous = self._last_levelup_announcement.get(key)
+        # Levels only grow, so once the cooldown has lapsed the stored level no longer matters.
+        previous = self._last_levelup_announcement.get(key, timestamp.timestamp())
         if previous is not None:
             previous_level, previous_at = previous
             if normalized_level <= previous_level:
@@ -153,10 +219,15 @@ class LevelingService:
             if (timestamp - previous_at) < safe_interval:
                 return False
 
-        self._last_levelup_announcement[key] = (normalized_level, timestamp)
+        self._last_levelup_announcement.set(
+            key,
+            (normalized_level, timestamp),
+            expires_at=(timestamp + safe_interval).timestamp(),
+            now=timestamp.timestamp(),
+        )
         return True
 
-    def award_voice_xp_once(
+    def accrue_voice_xp(
         self,
         repo: InMemoryRepository,
         *,
@@ -164,32 +235,45 @@ class LevelingService:
         guild_id: int,
         user_id: int,
         username: str | None,
-    ) -> bool:
-        if self._normalize_positive_id(guild_id) == 0 or self._normalize_positive_id(user_id) == 0:
-            return False
+        award: bool = True,
+    ) -> int:
+        """Credit one XP per full hour since the session anchor and schedule the next boundary.
 
-        timestamp = self._normalize_ts(now)
+        With ``award=False`` (leveling disabled) the elapsed hours are consumed without XP.
+        """
         key = (guild_id, user_id)
-        last_award = self._last_voice_award.get(key)
-        if last_award is None:
-            self._last_voice_award[key] = timestamp
-            return False
-        if timestamp - last_award < VOICE_XP_AWARD_INTERVAL:
-            return False
+        timestamp = self._normalize_ts(now)
+        anchor = self._last_voice_award.get(key, timestamp.timestamp())
+        if anchor is None:
+            self._last_voice_award.pop(key)
+            return 0
+        hours = max(0, int((timestamp - anchor) / VOICE_XP_AWARD_INTERVAL))
+        if hours > 0:
+            anchor = anchor + VOICE_XP_AWARD_INTERVAL * hours
+            self._set_voice_anchor(key, anchor)
+        self._voice_award_due.schedule(key, (anchor + VOICE_XP_AWARD_INTERVAL).timestamp())
+        if hours <= 0 or not award:
+            return 0
 
         row = repo.get_or_create_user_level(guild_id, user_id, username)
         row.username = username
-        current_xp = self._normalize_total_xp(row.xp)
-        next_xp = self._normalize_total_xp(current_xp + 1)
+        next_xp = self._normalize_total_xp(self._normalize_total_xp(row.xp) + hours)
         row.xp = next_xp
         row.level = calculate_level_from_xp(next_xp)
-        self._last_voice_award[key] = timestamp
-        return True
+        return hours
+
+    def due_voice_sessions(self, now: datetime) -> list[tuple[int, int]]:
+        return self._voice_award_due.pop_due(self._normalize_ts(now).timestamp())
+
+    def has_voice_session(self, guild_id: int, user_id: int) -> bool:
+        return (guild_id, user_id) in self._last_voice_award
 
     def on_voice_disconnect(self, guild_id: int, user_id: int) -> None:
         key = (guild_id, user_id)
-        self._last_voice_award.pop(key, None)
-        self._last_message_award.pop(key, None)
+        self._last_voice_award.pop(key)
+        self._voice_award_due.discard(key)
 
     def on_voice_connect(self, guild_id: int, user_id: int, now: datetime) -> None:
-        self._last_voice_award[(guild_id, user_id)] = self._normalize_ts(now)
+        timestamp = self._normalize_ts(now)
+        self._set_voice_anchor((guild_id, user_id), timestamp)
+        self._voice_award_due.schedule((guild_id, user_id), (timestamp + VOICE_XP_AWARD_INTERVAL).timestamp())
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 
 from db.repository import InMemoryRepository, RaidRecord
 from services.template_service import get_auto_template_defaults, upsert_auto_template
-from utils.slots import compute_qualified_slot_users, memberlist_target_label, memberlist_threshold
+from utils.slots import memberlist_target_label, memberlist_threshold
 from utils.text import normalize_list, short_list
 
 
@@ -173,16 +173,7 @@ def sync_memberlist_slots(
     if raid is None or raid.status != "open":
         return MemberlistSyncResult(created=0, updated=0, deleted=0, active_slots=[])
 
-    days, times = repo.list_raid_options(raid_id)
-    day_users, time_users = repo.vote_user_sets(raid_id)
-    threshold = memberlist_threshold(raid.min_players)
-    qualified_slots, _ = compute_qualified_slot_users(
-        days=days,
-        times=times,
-        day_users=day_users,
-        time_users=time_users,
-        threshold=threshold,
-    )
+    qualified_slots, _ = repo.qualified_slot_users(raid_id, threshold=memberlist_threshold(raid.min_players))
 
     existing = repo.list_posted_slots(raid_id)
     active_keys = set()
@@ -232,16 +223,7 @@ def finish_raid(repo: InMemoryRepository, *, raid_id: int, actor_user_id: int) -
     if actor_user_id != raid.creator_id:
         return FinishRaidResult(success=False, reason="only_creator", attendance_rows=0)
 
-    days, times = repo.list_raid_options(raid_id)
-    day_users, time_users = repo.vote_user_sets(raid_id)
-    threshold = memberlist_threshold(raid.min_players)
-    _, users = compute_qualified_slot_users(
-        days=days,
-        times=times,
-        day_users=day_users,
-        time_users=time_users,
-        threshold=threshold,
-    )
+    _, users = repo.qualified_slot_users(raid_id, threshold=memberlist_threshold(raid.min_players))
 
     attendance_rows = repo.create_attendance_snapshot(
         guild_id=raid.guild_id,
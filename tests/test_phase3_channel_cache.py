@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from bot.discord_api import discord
+from bot.runtime import RewriteDiscordBot
+from discord.channel_cache import ChannelResolutionCache
+from discord.message_handles import MessageHandleCache
+
+
+def _make_bot(fetch_results: dict[int, object]) -> tuple[RewriteDiscordBot, list[int]]:
+    bot = object.__new__(RewriteDiscordBot)
+    bot._message_handles = MessageHandleCache()
+    bot._channel_cache = ChannelResolutionCache()
+    fetch_calls: list[int] = []
+
+    async def _fake_fetch_channel(channel_id: int):
+        fetch_calls.append(channel_id)
+        result = fetch_results[channel_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    bot.get_channel = lambda _channel_id: None
+    bot.fetch_channel = _fake_fetch_channel
+    return bot, fetch_calls
+
+
+@pytest.mark.asyncio
+async def test_get_text_channel_caches_rest_fallback_until_invalidated():
+    channel = object.__new__(discord.TextChannel)
+    channel.id = 55
+    bot, fetch_calls = _make_bot({55: channel})
+
+    first = await RewriteDiscordBot._get_text_channel(bot, 55)
+    second = await RewriteDiscordBot._get_text_channel(bot, 55)
+
+    assert first is channel
+    assert second is channel
+    assert fetch_calls == [55]
+    stats = bot._channel_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+    await RewriteDiscordBot.on_guild_channel_delete(bot, SimpleNamespace(id=55))
+    await RewriteDiscordBot._get_text_channel(bot, 55)
+    assert fetch_calls == [55, 55]
+
+
+@pytest.mark.asyncio
+async def test_get_text_channel_caches_inaccessible_channels_but_not_transient_errors():
+    forbidden = discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "Missing Access")
+    bot, fetch_calls = _make_bot({66: forbidden, 77: RuntimeError("gateway hiccup")})
+
+    assert await RewriteDiscordBot._get_text_channel(bot, 66) is None
+    assert await RewriteDiscordBot._get_text_channel(bot, 66) is None
+    assert await RewriteDiscordBot._get_text_channel(bot, 77) is None
+    assert await RewriteDiscordBot._get_text_channel(bot, 77) is None
+
+    assert fetch_calls == [66, 77, 77]
+    assert bot._channel_cache.stats()["negative_hits"] == 1
+
+
+def test_channel_resolution_cache_entries_expire():
+    now = [100.0]
+    cache = ChannelResolutionCache(ttl_seconds=10, negative_ttl_seconds=2, clock=lambda: now[0])
+    cache.store(1, "channel")
+    cache.store_missing(2)
+
+    assert cache.lookup(1) == (True, "channel")
+    assert cache.lookup(2) == (True, None)
+    now[0] += 5
+    assert cache.lookup(1) == (True, "channel")
+    assert cache.lookup(2) == (False, None)
+    now[0] += 10
+    assert cache.lookup(1) == (False, None)
@@ -11,6 +11,7 @@ from bot.runtime import (
     _extract_slash_command_name,
     _round_xp_for_display,
 )
+from services.leveling_service import LevelingService
 
 
 @pytest.mark.parametrize(
@@ -60,6 +61,7 @@ async def test_on_message_skips_xp_for_registered_command():
         return SimpleNamespace(previous_level=0, current_level=0, xp=0, xp_awarded=False)
 
     bot.leveling_service = SimpleNamespace(
+        message_xp_on_cooldown=lambda **_kwargs: False,
         update_message_xp=_update_message_xp,
         should_announce_levelup=lambda **_kwargs: False,
     )
@@ -110,6 +112,7 @@ async def test_on_message_awards_xp_for_normal_text():
         return SimpleNamespace(previous_level=0, current_level=0, xp=10, xp_awarded=True)
 
     bot.leveling_service = SimpleNamespace(
+        message_xp_on_cooldown=lambda **_kwargs: False,
         update_message_xp=_update_message_xp,
         should_announce_levelup=lambda **_kwargs: False,
     )
@@ -161,6 +164,7 @@ async def test_on_message_levelup_message_uses_rounded_xp_display():
         return SimpleNamespace(previous_level=1, current_level=2, xp=12.5, xp_awarded=True)
 
     bot.leveling_service = SimpleNamespace(
+        message_xp_on_cooldown=lambda **_kwargs: False,
         update_message_xp=_update_message_xp,
         should_announce_levelup=lambda **_kwargs: True,
     )
@@ -194,3 +198,37 @@ async def test_on_message_levelup_message_uses_rounded_xp_display():
 
     assert called["xp"] == 1
     assert "(XP: 13)" in sent["content"]
+
+
+@pytest.mark.asyncio
+async def test_on_message_cooldown_hit_skips_state_lock(repo):
+    bot = object.__new__(RewriteDiscordBot)
+    bot.log_channel = None
+    bot._slash_command_names = {"status", "raidplan"}
+    bot._state_lock = asyncio.Lock()
+    bot._level_state_dirty = False
+    bot.repo = repo
+    bot.leveling_service = LevelingService()
+    bot._get_guild_feature_settings = lambda _guild_id: GuildFeatureSettings(
+        leveling_enabled=True,
+        levelup_messages_enabled=False,
+        nanomon_reply_enabled=False,
+        approved_reply_enabled=False,
+        message_xp_interval_seconds=15,
+        levelup_message_cooldown_seconds=20,
+    )
+    message = SimpleNamespace(
+        author=SimpleNamespace(bot=False, id=42, mention="<@42>", display_name="User42"),
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=10),
+        content="normal chat text",
+    )
+
+    await RewriteDiscordBot.on_message(bot, message)
+    awarded_xp = repo.user_levels[(1, 42)].xp
+    assert awarded_xp > 0
+
+    async with bot._state_lock:
+        await asyncio.wait_for(RewriteDiscordBot.on_message(bot, message), timeout=0.5)
+
+    assert repo.user_levels[(1, 42)].xp == awarded_xp
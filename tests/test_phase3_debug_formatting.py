@@ -30,6 +30,8 @@ def test_format_debug_report_uses_guild_name_from_settings(repo):
 async def test_refresh_raidlist_debug_payload_uses_runtime_guild_name(repo):
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._raidlist_fields = {}
+    bot._raidlist_render_state = {}
     bot._raidlist_hash_by_guild = {}
     bot.get_guild = lambda _guild_id: SimpleNamespace(name="Alpha Guild")
     bot.config = SimpleNamespace(raidlist_debug_channel_id=999)
@@ -49,7 +51,8 @@ async def test_refresh_raidlist_debug_payload_uses_runtime_guild_name(repo):
         return SimpleNamespace(id=555)
 
     async def _fake_mirror_debug_payload(**kwargs):
-        captured["content"] = str(kwargs.get("content", ""))
+        content = kwargs.get("content", "")
+        captured["content"] = str(content() if callable(content) else content)
 
     bot._get_text_channel = _fake_get_text_channel
     bot._send_channel_message = _fake_send_channel_message
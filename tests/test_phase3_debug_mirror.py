@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
+import pytest
+
+from bot.runtime import RewriteDiscordBot
 from utils.hashing import sha256_text
 
 
@@ -95,3 +100,38 @@ def test_upsert_debug_cache_reindexes_when_scope_changes(repo):
     assert len(new_scope) == 1
     assert int(new_scope[0].guild_id) == 2
     assert int(new_scope[0].raid_id or 0) == 22
+
+
+@pytest.mark.asyncio
+async def test_mirror_debug_payload_builds_lazily_and_trusts_cached_hash(repo):
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    resolved: list[int] = []
+    edited: list[int] = []
+
+    async def _get_text_channel(channel_id):
+        resolved.append(channel_id)
+        return SimpleNamespace(id=channel_id)
+
+    async def _edit_message_by_id(_channel, message_id, **_kwargs):
+        edited.append(message_id)
+        return SimpleNamespace(id=message_id)
+
+    def _never_built() -> str:
+        raise AssertionError("debug payload built while mirroring is off")
+
+    bot._get_text_channel = _get_text_channel
+    bot._edit_message_by_id = _edit_message_by_id
+    mirror_kwargs = dict(cache_key="raidlist:1:0", kind="raidlist", guild_id=1, raid_id=None)
+
+    await RewriteDiscordBot._mirror_debug_payload(bot, debug_channel_id=0, content=_never_built, **mirror_kwargs)
+    assert resolved == []
+
+    repo.upsert_debug_cache(message_id=77, payload_hash=sha256_text("same"), **mirror_kwargs)
+    await RewriteDiscordBot._mirror_debug_payload(bot, debug_channel_id=999, content=lambda: "same", **mirror_kwargs)
+    assert resolved == []
+
+    await RewriteDiscordBot._mirror_debug_payload(bot, debug_channel_id=999, content="changed", **mirror_kwargs)
+    assert resolved == [999]
+    assert edited == [77]
+    assert repo.get_debug_cache("raidlist:1:0").payload_hash == sha256_text("changed")
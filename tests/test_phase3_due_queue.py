@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from utils.due_queue import DueQueue
+
+
+def test_due_queue_pops_in_due_order_and_supersedes_reschedules():
+    queue: DueQueue[int] = DueQueue()
+    queue.schedule(1, 50.0)
+    queue.schedule(2, 10.0)
+    queue.schedule(3, 30.0)
+    queue.schedule(1, 5.0)
+    queue.discard(3)
+
+    assert len(queue) == 2
+    assert queue.next_due() == 5.0
+    assert queue.pop_due(20.0) == [1, 2]
+    assert queue.pop_due(100.0) == []
+    assert queue.next_due() is None
+
+
+def test_due_queue_schedule_earliest_keeps_sooner_entry():
+    queue: DueQueue[str] = DueQueue()
+    queue.schedule_earliest("raid", 10.0)
+    queue.schedule_earliest("raid", 20.0)
+    assert queue.due_at("raid") == 10.0
+    queue.schedule_earliest("raid", 1.0)
+    assert queue.due_at("raid") == 1.0
+    assert queue.pop_due(1.0) == ["raid"]
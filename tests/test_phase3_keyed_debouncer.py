@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from discord.task_registry import KeyedDebouncer
+
+
+@pytest.mark.asyncio
+async def test_keyed_debouncer_collapses_bursts_per_key():
+    calls: list[object] = []
+
+    async def _update(key):
+        calls.append(key)
+
+    debouncer = KeyedDebouncer(_update, debounce_seconds=0.02, max_wait_seconds=1.0)
+    for _ in range(5):
+        debouncer.mark_dirty(("planner", 1))
+    debouncer.mark_dirty(("planner", 2))
+
+    await debouncer.wait_idle(("planner", 1))
+    await debouncer.wait_idle(("planner", 2))
+
+    assert sorted(calls) == [("planner", 1), ("planner", 2)]
+    assert debouncer.pending_keys() == []
+
+
+@pytest.mark.asyncio
+async def test_keyed_debouncer_max_wait_bounds_continuous_marks():
+    calls: list[float] = []
+    loop = asyncio.get_running_loop()
+
+    async def _update(_key):
+        calls.append(loop.time())
+
+    debouncer = KeyedDebouncer(_update, debounce_seconds=0.05, max_wait_seconds=0.08)
+    started = loop.time()
+    while loop.time() - started < 0.15:
+        debouncer.mark_dirty("raid")
+        await asyncio.sleep(0.01)
+
+    assert calls, "max wait should force an update while marks keep arriving"
+    assert calls[0] - started < 0.12
+    await debouncer.shutdown(flush=True, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_keyed_debouncer_shutdown_flushes_pending_keys():
+    calls: list[str] = []
+
+    async def _update(key):
+        calls.append(key)
+
+    debouncer = KeyedDebouncer(_update, debounce_seconds=10.0, max_wait_seconds=30.0)
+    debouncer.mark_dirty("memberlist")
+    await asyncio.sleep(0)
+
+    await debouncer.shutdown(flush=True, timeout=1)
+
+    assert calls == ["memberlist"]
+    assert not debouncer.is_pending("memberlist")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from services.leveling_service import LevelingService
+from utils.cooldowns import ExpiringKeyMap
 from utils.leveling import calculate_level_from_xp, xp_needed_for_level
 from utils.text import contains_approved_keyword, contains_nanomon_keyword
 
@@ -97,3 +98,80 @@ def test_keyword_helpers_word_boundary():
     assert contains_nanomon_keyword("xnanomonx") is False
     assert contains_approved_keyword("approved") is True
     assert contains_approved_keyword("preapproved") is False
+
+
+def test_voice_xp_accrues_per_full_hour_from_session_start(repo):
+    service = LevelingService()
+    start = datetime(2026, 2, 13, 20, 0, 0, tzinfo=UTC)
+    service.on_voice_connect(1, 42, start)
+
+    assert service.due_voice_sessions(datetime(2026, 2, 13, 20, 59, 0, tzinfo=UTC)) == []
+    assert service.due_voice_sessions(datetime(2026, 2, 13, 21, 0, 0, tzinfo=UTC)) == [(1, 42)]
+
+    awarded = service.accrue_voice_xp(
+        repo,
+        now=datetime(2026, 2, 13, 22, 30, 0, tzinfo=UTC),
+        guild_id=1,
+        user_id=42,
+        username="User42",
+    )
+    assert awarded == 2
+    assert repo.get_or_create_user_level(1, 42, "User42").xp == 2
+    assert service.due_voice_sessions(datetime(2026, 2, 13, 22, 59, 0, tzinfo=UTC)) == []
+    assert service.due_voice_sessions(datetime(2026, 2, 13, 23, 0, 0, tzinfo=UTC)) == [(1, 42)]
+
+    skipped = service.accrue_voice_xp(
+        repo,
+        now=datetime(2026, 2, 13, 23, 0, 0, tzinfo=UTC),
+        guild_id=1,
+        user_id=42,
+        username="User42",
+        award=False,
+    )
+    assert skipped == 0
+    assert repo.get_or_create_user_level(1, 42, "User42").xp == 2
+
+    service.on_voice_disconnect(1, 42)
+    assert service.has_voice_session(1, 42) is False
+    assert service.due_voice_sessions(datetime(2026, 2, 14, 12, 0, 0, tzinfo=UTC)) == []
+
+
+def test_leveling_state_expires_after_interval_and_respects_cap(repo):
+    service = LevelingService(max_entries=3)
+    start = datetime(2026, 2, 13, 21, 0, 0, tzinfo=UTC)
+    for user_id in range(1, 6):
+        service.update_message_xp(repo, guild_id=1, user_id=user_id, username=None, now=start)
+
+    assert service.state_sizes(start)["message_cooldowns"] == 3
+
+    later = start + timedelta(minutes=5)
+    assert service.state_sizes(later)["message_cooldowns"] == 0
+    result = service.update_message_xp(repo, guild_id=1, user_id=5, username=None, now=later)
+    assert result.xp_awarded is True
+
+
+def test_voice_disconnect_keeps_message_cooldown(repo):
+    service = LevelingService()
+    now = datetime(2026, 2, 13, 21, 0, 0, tzinfo=UTC)
+    service.update_message_xp(repo, guild_id=1, user_id=42, username=None, now=now)
+    service.on_voice_connect(1, 42, now)
+    service.on_voice_disconnect(1, 42)
+
+    result = service.update_message_xp(repo, guild_id=1, user_id=42, username=None, now=now + timedelta(seconds=5))
+
+    assert result.xp_awarded is False
+
+
+def test_expiring_key_map_heap_stays_bounded_under_rewrites():
+    entries = ExpiringKeyMap(max_entries=2)
+    for value in range(10_000):
+        entries.set("k", value, expires_at=1000.0, now=0.0)
+
+    assert len(entries) == 1
+    assert len(entries._bucket_heap) == 1
+
+    entries.set("a", 1, expires_at=2000.0, now=0.0)
+    entries.set("b", 2, expires_at=3000.0, now=0.0)
+    assert len(entries) == 2
+    assert entries.evicted == 1
+    assert "k" not in entries
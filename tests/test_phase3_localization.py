@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from utils.localization import STRINGS, get_string, render_raidlist_field, validate_catalog
+
+
+def test_shipped_catalog_validates_and_mismatches_are_reported():
+    assert validate_catalog() == []
+
+    broken = {
+        "de": {"greet": "Hallo {name}", "bye": "Tschuess"},
+        "en": {"greet": "Hello {user}", "extra": "{"},
+    }
+    problems = validate_catalog(broken)
+
+    assert "en.bye: missing" in problems
+    assert any(problem.startswith("en.greet: placeholders ['user']") for problem in problems)
+    assert any(problem.startswith("en.extra: invalid template") for problem in problems)
+
+
+def test_get_string_fallbacks_and_bulk_raidlist_field_render():
+    assert get_string("fr", "raidlist_title") == STRINGS["de"]["raidlist_title"]
+    assert get_string("en", "does_not_exist") == "[does_not_exist]"
+    assert get_string("en", "raidlist_view_raid", unused=1) == STRINGS["en"]["raidlist_view_raid"]
+
+    name, value = render_raidlist_field(
+        "en",
+        display_id=7,
+        dungeon="Nanos",
+        players="3",
+        qualified_count=2,
+        complete_votes=5,
+        timezone_name="Europe/Berlin",
+        next_slot_text="—",
+        jump_url="https://example.invalid",
+    )
+
+    assert name == get_string("en", "raidlist_raid_field", display_id=7, dungeon="Nanos")
+    assert value == (
+        get_string("en", "raidlist_minimum", players="3") + "\n"
+        + get_string("en", "raidlist_qualified_slots", count=2) + "\n"
+        + get_string("en", "raidlist_votes", count=5) + "\n"
+        + get_string("en", "raidlist_timezone", tz="Europe/Berlin") + "\n"
+        + get_string("en", "raidlist_next_slot") + ": —\n"
+        + f"[{get_string('en', 'raidlist_view_raid')}](https://example.invalid)"
+    )
@@ -5,7 +5,10 @@ from types import SimpleNamespace
 import pytest
 
 import bot.runtime as runtime_mod
+from bot.discord_api import discord
 from bot.runtime import RewriteDiscordBot
+from discord.member_names import MemberNameCache
+from discord.message_handles import MessageHandleCache
 from services.raid_service import create_raid_from_modal, toggle_vote
 
 
@@ -73,6 +76,8 @@ async def test_sync_memberlists_recreate_replaces_old_message(repo, monkeypatch)
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
     bot.config = SimpleNamespace(memberlist_debug_channel_id=0)
+    bot._message_handles = MessageHandleCache()
+    bot._member_names = MemberNameCache()
 
     participants_channel = SimpleNamespace(id=22)
     old_msg = SimpleNamespace(id=501)
@@ -133,3 +138,137 @@ async def test_sync_memberlists_recreate_replaces_old_message(repo, monkeypatch)
     assert deleted_ids == [501]
     slot_row = repo.list_posted_slots(raid.id)[("Mon", "20:00")]
     assert slot_row.message_id == 777
+
+
+@pytest.mark.asyncio
+async def test_changed_only_memberlist_sync_touches_only_delta_slots(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="Mon, Tue, Wed",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    ).raid
+    for day in ("Mon", "Tue", "Wed"):
+        toggle_vote(repo, raid_id=raid.id, kind="day", option_label=day, user_id=200)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label="20:00", user_id=200)
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot.config = SimpleNamespace(memberlist_debug_channel_id=0)
+    bot._message_handles = MessageHandleCache()
+    bot._member_names = MemberNameCache()
+    bot._safe_get_guild = lambda _guild_id: None
+    sent: list[object] = []
+    edited: list[int] = []
+
+    async def _fake_get_text_channel(_channel_id):
+        return SimpleNamespace(id=22)
+
+    async def _fake_ensure_slot_temp_role(_raid, *, day_label, time_label):
+        return None
+
+    async def _fake_send_channel_message(_channel, **kwargs):
+        sent.append(kwargs.get("embed"))
+        return SimpleNamespace(id=9000 + len(sent))
+
+    async def _fake_edit_message_by_id(_channel, message_id, **_kwargs):
+        edited.append(int(message_id))
+        return SimpleNamespace(id=message_id)
+
+    async def _fake_mirror_debug_payload(**_kwargs):
+        return None
+
+    bot._get_text_channel = _fake_get_text_channel
+    bot._ensure_slot_temp_role = _fake_ensure_slot_temp_role
+    bot._send_channel_message = _fake_send_channel_message
+    bot._edit_message_by_id = _fake_edit_message_by_id
+    bot._mirror_debug_payload = _fake_mirror_debug_payload
+
+    assert await RewriteDiscordBot._sync_memberlist_messages_for_raid(bot, raid.id, changed_only=True) == (3, 0, 0)
+
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label="Tue", user_id=201)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label="20:00", user_id=201)
+    assert await RewriteDiscordBot._sync_memberlist_messages_for_raid(bot, raid.id, changed_only=True) == (0, 1, 0)
+    tue_message_id = repo.list_posted_slots(raid.id)[("Tue", "20:00")].message_id
+    assert edited == [tue_message_id]
+
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label="Wed", user_id=200)
+    assert await RewriteDiscordBot._sync_memberlist_messages_for_raid(bot, raid.id, changed_only=True) == (0, 0, 1)
+    assert edited == [tue_message_id]
+
+
+@pytest.mark.asyncio
+async def test_changed_only_memberlist_sync_retries_slots_that_failed_to_update(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="Mon, Tue",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    ).raid
+    for day in ("Mon", "Tue"):
+        toggle_vote(repo, raid_id=raid.id, kind="day", option_label=day, user_id=200)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label="20:00", user_id=200)
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot.config = SimpleNamespace(memberlist_debug_channel_id=0)
+    bot._message_handles = MessageHandleCache()
+    bot._member_names = MemberNameCache()
+    bot._safe_get_guild = lambda _guild_id: None
+    discord_down = {"value": False}
+    sent: list[object] = []
+    edited: list[int] = []
+
+    async def _fake_get_text_channel(_channel_id):
+        return SimpleNamespace(id=22)
+
+    async def _fake_ensure_slot_temp_role(_raid, *, day_label, time_label):
+        return None
+
+    async def _fake_send_channel_message(_channel, **kwargs):
+        if discord_down["value"]:
+            return None
+        sent.append(kwargs.get("embed"))
+        return SimpleNamespace(id=9000 + len(sent))
+
+    async def _fake_edit_message_by_id(_channel, message_id, **_kwargs):
+        if discord_down["value"]:
+            raise discord.DiscordServerError(SimpleNamespace(status=503, reason="Service Unavailable"), "")
+        edited.append(int(message_id))
+        return SimpleNamespace(id=message_id)
+
+    async def _fake_mirror_debug_payload(**_kwargs):
+        return None
+
+    bot._get_text_channel = _fake_get_text_channel
+    bot._ensure_slot_temp_role = _fake_ensure_slot_temp_role
+    bot._send_channel_message = _fake_send_channel_message
+    bot._edit_message_by_id = _fake_edit_message_by_id
+    bot._mirror_debug_payload = _fake_mirror_debug_payload
+
+    assert await RewriteDiscordBot._sync_memberlist_messages_for_raid(bot, raid.id, changed_only=True) == (2, 0, 0)
+    tue_message_id = repo.list_posted_slots(raid.id)[("Tue", "20:00")].message_id
+
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label="Tue", user_id=201)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label="20:00", user_id=201)
+    discord_down["value"] = True
+    assert await RewriteDiscordBot._sync_memberlist_messages_for_raid(bot, raid.id, changed_only=True) == (0, 0, 0)
+    assert repo.list_posted_slots(raid.id)[("Tue", "20:00")].message_id == tue_message_id
+
+    discord_down["value"] = False
+    assert await RewriteDiscordBot._sync_memberlist_messages_for_raid(bot, raid.id, changed_only=True) == (0, 1, 0)
+    assert edited == [tue_message_id]
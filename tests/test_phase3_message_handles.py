@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from bot.discord_api import discord
+from bot.runtime import RewriteDiscordBot
+from discord.message_handles import MessageHandleCache
+from services.raid_service import create_raid_from_modal
+
+
+class _PartialChannel:
+    def __init__(
+        self,
+        channel_id: int,
+        *,
+        missing_ids: set[int] | None = None,
+        failing_ids: set[int] | None = None,
+    ) -> None:
+        self.id = channel_id
+        self.missing_ids = set(missing_ids or set())
+        self.failing_ids = set(failing_ids or set())
+        self.fetch_calls = 0
+        self.edits: list[int] = []
+        self.sent: list[SimpleNamespace] = []
+
+    def get_partial_message(self, message_id: int):
+        channel = self
+
+        async def _edit(**_kwargs):
+            if message_id in channel.missing_ids:
+                raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+            if message_id in channel.failing_ids:
+                raise discord.DiscordServerError(SimpleNamespace(status=503, reason="Service Unavailable"), "")
+            channel.edits.append(message_id)
+
+        return SimpleNamespace(id=message_id, edit=_edit)
+
+    async def fetch_message(self, message_id: int):
+        self.fetch_calls += 1
+        raise AssertionError("fetch_message should not be needed")
+
+    async def send(self, **_kwargs):
+        posted = SimpleNamespace(id=9000 + len(self.sent), channel=self, guild=None, author=None)
+        self.sent.append(posted)
+        return posted
+
+
+def _make_bot(repo, channel) -> RewriteDiscordBot:
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._message_handles = MessageHandleCache()
+    bot._raidlist_fields = {}
+    bot._raidlist_render_state = {}
+    bot._raidlist_hash_by_guild = {}
+    bot.config = SimpleNamespace(raidlist_debug_channel_id=0)
+    bot.get_guild = lambda _guild_id: SimpleNamespace(name="Guild")
+
+    async def _fake_get_text_channel(_channel_id):
+        return channel
+
+    bot._get_text_channel = _fake_get_text_channel
+    return bot
+
+
+def _seed_raid(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="2026-02-13 (Fr)",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    )
+
+
+@pytest.mark.asyncio
+async def test_raidlist_refresh_edits_stored_message_without_fetch(repo):
+    _seed_raid(repo)
+    repo.ensure_settings(1).raidlist_message_id = 4242
+    channel = _PartialChannel(33)
+    bot = _make_bot(repo, channel)
+
+    changed = await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1, force=True)
+
+    assert changed is True
+    assert channel.edits == [4242]
+    assert channel.fetch_calls == 0
+    assert channel.sent == []
+    assert (33, 4242) in bot._message_handles
+
+
+@pytest.mark.asyncio
+async def test_raidlist_refresh_reposts_when_stored_message_is_gone(repo):
+    _seed_raid(repo)
+    repo.ensure_settings(1).raidlist_message_id = 4242
+    channel = _PartialChannel(33, missing_ids={4242})
+    bot = _make_bot(repo, channel)
+
+    changed = await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1, force=True)
+
+    assert changed is True
+    assert channel.fetch_calls == 0
+    assert len(channel.sent) == 1
+    assert repo.ensure_settings(1).raidlist_message_id == channel.sent[0].id
+    assert (33, 4242) not in bot._message_handles
+    assert (33, channel.sent[0].id) in bot._message_handles
+
+
+@pytest.mark.asyncio
+async def test_raidlist_refresh_keeps_stored_message_on_transient_edit_error(repo):
+    _seed_raid(repo)
+    repo.ensure_settings(1).raidlist_message_id = 4242
+    channel = _PartialChannel(33, failing_ids={4242})
+    bot = _make_bot(repo, channel)
+
+    changed = await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1, force=True)
+
+    assert changed is False
+    assert channel.sent == []
+    assert repo.ensure_settings(1).raidlist_message_id == 4242
+    assert 1 not in bot._raidlist_hash_by_guild
+
+    channel.failing_ids.clear()
+    assert await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1) is True
+    assert channel.edits == [4242]
+    assert channel.sent == []
+
+
+def test_message_handle_cache_is_bounded_lru():
+    cache = MessageHandleCache(max_entries=2)
+    cache.remember(1, 10, "a")
+    cache.remember(1, 11, "b")
+    assert cache.get(1, 10) == "a"
+    cache.remember(2, 12, "c")
+
+    assert cache.get(1, 11) is None
+    assert cache.get(1, 10) == "a"
+    cache.forget_channel(1)
+    assert len(cache) == 1
+    cache.forget_message(12)
+    assert len(cache) == 0
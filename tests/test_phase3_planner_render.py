@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from bot.runtime import RewriteDiscordBot
+from discord.member_names import MemberNameCache
+from services.raid_service import create_raid_from_modal, toggle_vote
+
+
+@pytest.mark.asyncio
+async def test_planner_render_is_reused_until_votes_or_options_change(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="2026-02-13 (Fr)",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    ).raid
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._planner_renders = {}
+    bot._member_names = MemberNameCache()
+    bot._safe_get_guild = lambda _guild_id: None
+    renders: list[int] = []
+    edits: list[tuple[object, object]] = []
+    original_embed = RewriteDiscordBot._planner_embed
+
+    def _counting_embed(raid_row):
+        renders.append(raid_row.id)
+        return original_embed(bot, raid_row)
+
+    async def _fake_get_text_channel(_channel_id):
+        return SimpleNamespace(id=11)
+
+    async def _fake_edit_message_by_id(_channel, message_id, **kwargs):
+        edits.append((kwargs["embed"], kwargs["view"]))
+        return SimpleNamespace(id=message_id)
+
+    bot._planner_embed = _counting_embed
+    bot._mark_raid_reminders_dirty = lambda _raid_id: None
+    bot._track_raid_expiry = lambda _raid: None
+    bot._get_text_channel = _fake_get_text_channel
+    bot._edit_message_by_id = _fake_edit_message_by_id
+
+    await RewriteDiscordBot._refresh_planner_message(bot, raid.id)
+    await RewriteDiscordBot._refresh_planner_message(bot, raid.id)
+    assert renders == [raid.id]
+    assert edits[0][0] is edits[1][0]
+    first_view = edits[0][1]
+
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label="2026-02-13 (Fr)", user_id=200)
+    await RewriteDiscordBot._refresh_planner_message(bot, raid.id)
+    assert renders == [raid.id, raid.id]
+    assert edits[-1][1] is first_view
+
+    repo.add_raid_options(raid.id, days=[], times=["21:00"])
+    await RewriteDiscordBot._refresh_planner_message(bot, raid.id)
+    assert edits[-1][1] is not first_view
+
+
+@pytest.mark.asyncio
+async def test_planner_render_picks_up_member_rename(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="2026-02-13 (Fr)",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    ).raid
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label="2026-02-13 (Fr)", user_id=200)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label="20:00", user_id=200)
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._planner_renders = {}
+    bot._member_names = MemberNameCache()
+    bot._safe_get_guild = lambda _guild_id: None
+    embeds: list[object] = []
+
+    async def _fake_get_text_channel(_channel_id):
+        return SimpleNamespace(id=11)
+
+    async def _fake_edit_message_by_id(_channel, message_id, **kwargs):
+        embeds.append(kwargs["embed"])
+        return SimpleNamespace(id=message_id)
+
+    bot._mark_raid_reminders_dirty = lambda _raid_id: None
+    bot._track_raid_expiry = lambda _raid: None
+    bot._get_text_channel = _fake_get_text_channel
+    bot._edit_message_by_id = _fake_edit_message_by_id
+
+    bot._upsert_member_username(guild_id=1, user_id=200, username="Alpha")
+    await RewriteDiscordBot._refresh_planner_message(bot, raid.id)
+    assert any("Alpha" in field.value for field in embeds[-1].fields)
+
+    bot._upsert_member_username(guild_id=1, user_id=200, username="Beta")
+    await RewriteDiscordBot._refresh_planner_message(bot, raid.id)
+    assert embeds[-1] is not embeds[0]
+    assert any("Beta" in field.value for field in embeds[-1].fields)
+    assert not any("Alpha" in field.value for field in embeds[-1].fields)
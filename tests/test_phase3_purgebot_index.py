@@ -6,12 +6,15 @@ import pytest
 
 import bot.runtime as runtime_mod
 from bot.runtime import BOT_MESSAGE_KIND, BOT_MESSAGE_CACHE_PREFIX, RewriteDiscordBot
+from discord.message_handles import MessageHandleCache
 from utils.hashing import sha256_text
 
 
 def _make_bot(repo, *, bot_user_id: int = 99) -> RewriteDiscordBot:
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._purge_semaphores = {}
+    bot._message_handles = MessageHandleCache()
     bot._connection = SimpleNamespace(user=SimpleNamespace(id=bot_user_id))
     return bot
 
@@ -134,3 +137,109 @@ async def test_delete_bot_messages_handles_history_failures(repo, monkeypatch):
     )
 
     assert deleted == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_bot_messages_bulk_deletes_recent_ids_without_fetch(repo, monkeypatch):
+    from datetime import UTC, datetime, timedelta
+
+    from bot.discord_api import discord
+
+    bot = _make_bot(repo, bot_user_id=99)
+    now = datetime.now(UTC)
+    recent_ids = [discord.utils.time_snowflake(now - timedelta(minutes=offset)) for offset in range(1, 151)]
+    old_id = discord.utils.time_snowflake(now - timedelta(days=20))
+    foreign_id = discord.utils.time_snowflake(now - timedelta(minutes=500))
+    for message_id in [*recent_ids, old_id]:
+        repo.upsert_debug_cache(
+            cache_key=f"{BOT_MESSAGE_CACHE_PREFIX}:1:77:99:{message_id}",
+            kind=BOT_MESSAGE_KIND,
+            guild_id=1,
+            raid_id=77,
+            message_id=message_id,
+            payload_hash=sha256_text(f"99:{message_id}"),
+        )
+    repo.upsert_debug_cache(
+        cache_key=f"{BOT_MESSAGE_CACHE_PREFIX}:1:77:42:{foreign_id}",
+        kind=BOT_MESSAGE_KIND,
+        guild_id=1,
+        raid_id=77,
+        message_id=foreign_id,
+        payload_hash=sha256_text(f"42:{foreign_id}"),
+    )
+
+    bulk_batches: list[list[int]] = []
+    single_deletes: list[int] = []
+
+    class _BulkChannel:
+        id = 77
+        guild = SimpleNamespace(id=1)
+
+        async def delete_messages(self, messages):
+            bulk_batches.append([int(message.id) for message in messages])
+
+        def get_partial_message(self, message_id: int):
+            async def _delete():
+                single_deletes.append(message_id)
+
+            return SimpleNamespace(id=message_id, delete=_delete)
+
+    async def _unexpected_fetch(_channel, _message_id):
+        raise AssertionError("indexed bulk delete must not fetch")
+
+    monkeypatch.setattr(runtime_mod, "_safe_fetch_message", _unexpected_fetch)
+
+    deleted = await RewriteDiscordBot._delete_bot_messages_in_channel(
+        bot,
+        _BulkChannel(),
+        history_limit=500,
+        scan_history=False,
+    )
+
+    assert deleted == 151
+    assert [len(batch) for batch in bulk_batches] == [100, 50]
+    assert sorted(sum(bulk_batches, [])) == sorted(recent_ids)
+    assert single_deletes == [old_id]
+    remaining = repo.list_debug_cache(kind=BOT_MESSAGE_KIND, guild_id=1, raid_id=77)
+    assert [int(row.message_id) for row in remaining] == [foreign_id]
+
+
+@pytest.mark.asyncio
+async def test_purge_channels_runs_bounded_concurrent_sweeps(repo):
+    import asyncio
+
+    bot = _make_bot(repo, bot_user_id=99)
+    active = 0
+    peak = 0
+    progress: list[tuple[int, int, int]] = []
+
+    async def _fake_delete_bot_messages_in_channel(channel, *, history_limit: int, scan_history: bool):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if channel.id == 3:
+            raise RuntimeError("boom")
+        return 2 if channel.id % 2 == 0 else 0
+
+    async def _on_progress(finished: int, total: int, deleted: int) -> None:
+        progress.append((finished, total, deleted))
+
+    bot._delete_bot_messages_in_channel = _fake_delete_bot_messages_in_channel
+    channels = [SimpleNamespace(id=channel_id) for channel_id in range(1, 11)]
+
+    total_deleted, touched = await RewriteDiscordBot._purge_bot_messages_in_channels(
+        bot,
+        1,
+        channels,
+        history_limit=150,
+        scan_history=False,
+        on_progress=_on_progress,
+    )
+
+    assert total_deleted == 10
+    assert touched == 5
+    assert 1 < peak <= runtime_mod.PURGE_CHANNEL_CONCURRENCY
+    assert len(progress) == 10
+    assert progress[-1] == (10, 10, 10)
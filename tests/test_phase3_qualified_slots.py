@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+
+from utils.slots import SlotVoteBitsets, compute_qualified_slot_users
+
+
+def _reference(*, days, times, day_users, time_users, threshold):
+    qualified = {}
+    all_users = set()
+    for day in days:
+        for time_label in times:
+            users = sorted(day_users.get(day, set()).intersection(time_users.get(time_label, set())))
+            if len(users) < threshold:
+                continue
+            qualified[(day, time_label)] = users
+            all_users.update(users)
+    return qualified, all_users
+
+
+def test_bitset_engine_matches_set_intersection_on_random_raids():
+    rng = random.Random(7)
+    for _ in range(200):
+        days = [f"D{index}" for index in range(rng.randint(1, 8))]
+        times = [f"T{index}" for index in range(rng.randint(1, 8))]
+        voters = rng.sample(range(1, 10_000), rng.randint(0, 40))
+        day_users = {day: {user for user in voters if rng.random() < 0.4} for day in days}
+        time_users = {time_label: {user for user in voters if rng.random() < 0.4} for time_label in times}
+        threshold = rng.randint(1, 5)
+        kwargs = dict(days=days, times=times, day_users=day_users, time_users=time_users, threshold=threshold)
+
+        assert compute_qualified_slot_users(**kwargs) == _reference(**kwargs)
+
+
+def test_bitset_decode_returns_sorted_user_ids():
+    bitsets = SlotVoteBitsets(day_users={"Fr": {30, 10, 20}}, time_users={"20:00": {20, 30}})
+
+    assert bitsets.decode(bitsets.day_masks["Fr"] & bitsets.time_masks["20:00"]) == [20, 30]
+
+
+def test_repository_qualified_slots_are_cached_per_raid_version(repo):
+    raid = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=10, dungeon="Nanos", min_players=1)
+    repo.add_raid_options(raid.id, days=["Fr"], times=["20:00"])
+    repo.toggle_vote(raid_id=raid.id, kind="day", option_label="Fr", user_id=5)
+    repo.toggle_vote(raid_id=raid.id, kind="time", option_label="20:00", user_id=5)
+
+    first, users = repo.qualified_slot_users(raid.id, threshold=1)
+    first[("Sa", "21:00")] = [99]
+    again, _ = repo.qualified_slot_users(raid.id, threshold=1)
+
+    assert again == {("Fr", "20:00"): [5]}
+    assert users == {5}
+
+    repo.toggle_vote(raid_id=raid.id, kind="time", option_label="20:00", user_id=5)
+    assert repo.qualified_slot_users(raid.id, threshold=1) == ({}, set())
+
+
+def test_incremental_index_tracks_full_recomputation_and_reports_deltas(repo):
+    rng = random.Random(11)
+    raid = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=10, dungeon="Nanos", min_players=2)
+    days = ["Fr", "Sa", "So"]
+    times = ["19:00", "20:00", "21:00"]
+    repo.add_raid_options(raid.id, days=days, times=times)
+    repo.qualified_slot_users(raid.id, threshold=2)
+    assert repo.take_slot_deltas(raid.id) == []
+
+    for _ in range(300):
+        kind = rng.choice(["day", "time"])
+        label = rng.choice(days if kind == "day" else times)
+        repo.toggle_vote(raid_id=raid.id, kind=kind, option_label=label, user_id=rng.randint(1, 6))
+        incremental = repo.qualified_slot_users(raid.id, threshold=2)
+        day_users, time_users = repo.vote_user_sets(raid.id)
+        assert incremental == compute_qualified_slot_users(
+            days=days, times=times, day_users=day_users, time_users=time_users, threshold=2
+        )
+    repo.take_slot_deltas(raid.id)
+
+    for user_id in (101, 102):
+        repo.toggle_vote(raid_id=raid.id, kind="time", option_label="21:00", user_id=user_id)
+    repo.toggle_vote(raid_id=raid.id, kind="day", option_label="So", user_id=101)
+    repo.toggle_vote(raid_id=raid.id, kind="day", option_label="So", user_id=102)
+
+    deltas = repo.take_slot_deltas(raid.id)
+    assert [(delta.day, delta.time) for delta in deltas] == [("So", "21:00")]
+    assert deltas[0].change in {"qualified", "changed"}
+    assert {101, 102} <= set(deltas[0].users)
+    assert repo.take_slot_deltas(raid.id) == []
+
+
+def test_slot_deltas_fall_back_to_full_sync_when_index_is_stale(repo):
+    raid = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=10, dungeon="Nanos", min_players=1)
+    repo.add_raid_options(raid.id, days=["Fr"], times=["20:00"])
+
+    repo.toggle_vote(raid_id=raid.id, kind="day", option_label="Fr", user_id=5)
+
+    assert repo.take_slot_deltas(raid.id) is None
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from bot.runtime import RewriteDiscordBot
+
+
+def test_calendar_date_index_follows_raid_options_and_deletes(repo):
+    first = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=7, dungeon="Nanos", min_players=1)
+    second = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=7, dungeon="Skull", min_players=1)
+    repo.add_raid_options(first.id, days=["2026-03-02 (Mo)", "Bald"], times=["20:00"])
+    version = repo.calendar_version(1)
+    repo.add_raid_options(second.id, days=["2026-03-02 (Mo)", "2026-04-01 (Mi)"], times=["20:00"])
+
+    assert repo.calendar_version(1) > version
+    march = repo.raid_ids_by_date(1, start=date(2026, 3, 1), end=date(2026, 3, 31))
+    assert march == {date(2026, 3, 2): [first.id, second.id]}
+
+    version = repo.calendar_version(1)
+    repo.delete_raid_cascade(first.id)
+
+    assert repo.calendar_version(1) > version
+    assert repo.raid_ids_by_date(1, start=date(2026, 3, 1), end=date(2026, 4, 30)) == {
+        date(2026, 3, 2): [second.id],
+        date(2026, 4, 1): [second.id],
+    }
+
+
+@pytest.mark.asyncio
+async def test_calendar_refresh_reuses_month_renders_until_raid_dates_change(repo):
+    raid = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=7, dungeon="Nanos", min_players=1)
+    repo.add_raid_options(raid.id, days=["2026-03-02 (Mo)"], times=["20:00"])
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._raid_calendar_renders = {}
+    bot._raid_calendar_hash_by_guild = {}
+    bot._raid_calendar_month_key_by_guild = {}
+    bot.get_guild = lambda _guild_id: SimpleNamespace(name="Alpha Guild")
+    builds: list[date] = []
+    sent: list[int] = []
+    edited: list[int] = []
+    build = bot._build_raid_calendar_embed
+
+    def _counting_build(**kwargs):
+        builds.append(kwargs["month_start"])
+        return build(**kwargs)
+
+    async def _get_text_channel(channel_id):
+        return SimpleNamespace(id=channel_id)
+
+    async def _send_channel_message(_channel, **_kwargs):
+        sent.append(900)
+        return SimpleNamespace(id=900)
+
+    async def _edit_message_by_id(_channel, message_id, **_kwargs):
+        edited.append(message_id)
+        return SimpleNamespace(id=message_id)
+
+    bot._build_raid_calendar_embed = _counting_build
+    bot._get_text_channel = _get_text_channel
+    bot._send_channel_message = _send_channel_message
+    bot._edit_message_by_id = _edit_message_by_id
+    bot._set_raid_calendar_channel_id(1, 55)
+
+    march = date(2026, 3, 1)
+    assert await bot._refresh_raid_calendar_for_guild(1, month_start=march) is True
+    assert await bot._refresh_raid_calendar_for_guild(1) is False
+    assert sent == [900]
+    assert builds == [march]
+
+    assert await bot._shift_raid_calendar_month(1, delta_months=1) == date(2026, 4, 1)
+    assert await bot._shift_raid_calendar_month(1, delta_months=-1) == march
+    assert builds == [march, date(2026, 4, 1)]
+    assert edited == [900, 900]
+
+    repo.add_raid_options(raid.id, days=["2026-03-09 (Mo)"], times=[])
+    assert await bot._refresh_raid_calendar_for_guild(1) is True
+    assert builds[-1] == march
+    assert len(builds) == 3
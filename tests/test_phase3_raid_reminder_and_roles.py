@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from types import SimpleNamespace
+from zoneinfo import ZoneInfo
 
 import pytest
 
 from bot.runtime import GuildFeatureSettings, RewriteDiscordBot
+from discord.member_names import MemberNameCache
 from services.raid_service import create_raid_from_modal, toggle_vote
+from utils.slot_times import slot_start_utc
 
 
 def _enabled_feature_settings() -> GuildFeatureSettings:
@@ -21,20 +24,33 @@ def _enabled_feature_settings() -> GuildFeatureSettings:
     )
 
 
-def test_parse_slot_start_at_utc_parses_iso_date_and_time():
-    parsed = RewriteDiscordBot._parse_slot_start_at_utc("2026-02-13 (Fr)", "20:15")
+def test_slot_start_utc_parses_iso_date_and_time():
+    parsed = slot_start_utc("2026-02-13 (Fr)", "20:15")
     assert parsed == datetime(2026, 2, 13, 19, 15, tzinfo=UTC)
 
 
-def test_parse_slot_start_at_utc_respects_timezone():
-    parsed = RewriteDiscordBot._parse_slot_start_at_utc(
-        "2026-02-13 (Fr)",
-        "20:15",
-        timezone_name="Europe/Berlin",
-    )
+def test_slot_start_utc_respects_timezone():
+    parsed = slot_start_utc("2026-02-13 (Fr)", "20:15", ZoneInfo("Europe/Berlin"))
     assert parsed == datetime(2026, 2, 13, 19, 15, tzinfo=UTC)
 
 
+def test_repository_slot_times_follow_raid_options(repo):
+    raid = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=7, dungeon="Nanos", min_players=1)
+    repo.add_raid_options(raid.id, days=["2026-02-13 (Fr)", "Bald"], times=["20:15"])
+
+    table = repo.slot_times(raid.id)
+    assert repo.slot_times(raid.id) is table
+    assert table.day_dates == {"2026-02-13 (Fr)": datetime(2026, 2, 13).date(), "Bald": None}
+    assert table.start_utc("2026-02-13 (Fr)", "20:15") == datetime(2026, 2, 13, 19, 15, tzinfo=UTC)
+    assert table.start_utc("Bald", "20:15") is None
+
+    repo.add_raid_options(raid.id, days=[], times=["21:00"])
+    assert repo.slot_times(raid.id).start_utc("2026-02-13 (Fr)", "21:00") == datetime(2026, 2, 13, 20, 0, tzinfo=UTC)
+
+    repo.delete_raid_cascade(raid.id)
+    assert raid.id not in repo._slot_times
+
+
 @pytest.mark.asyncio
 async def test_run_raid_reminders_once_sends_only_once_per_slot(repo):
     repo.configure_channels(
@@ -189,6 +205,7 @@ async def test_sync_memberlists_uses_unique_slot_roles_per_slot(repo):
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
     bot.config = SimpleNamespace(memberlist_debug_channel_id=0)
+    bot._member_names = MemberNameCache()
     participants_channel = SimpleNamespace(id=22)
     ensured_slots: list[tuple[str, str]] = []
     sent_payloads: list[str] = []
@@ -228,3 +245,101 @@ async def test_sync_memberlists_uses_unique_slot_roles_per_slot(repo):
     assert all(f"<@&{day_one}-{time_label}>" not in (payload or "") for payload in sent_payloads)
     assert all(f"<@&{day_two}-{time_label}>" not in (payload or "") for payload in sent_payloads)
     assert all(embed is not None for embed in sent_embeds)
+
+
+def test_next_reminder_wake_targets_window_openings(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    day_label = "2026-02-13 (Fr)"
+    time_label = "20:00"
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input=day_label,
+        times_input=time_label,
+        min_players_input="1",
+        message_id=5154,
+    ).raid
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label=day_label, user_id=200)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label=time_label, user_id=200)
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._get_guild_feature_settings = lambda _guild_id: _enabled_feature_settings()
+    start_ts = datetime(2026, 2, 13, 19, 0, tzinfo=UTC).timestamp()
+
+    before = RewriteDiscordBot._next_reminder_wake(
+        bot, raid, now_utc=datetime(2026, 2, 13, 18, 0, tzinfo=UTC), attempted=True
+    )
+    assert before == start_ts - 10 * 60 + 1.0
+
+    inside = datetime(2026, 2, 13, 18, 55, tzinfo=UTC)
+    assert RewriteDiscordBot._next_reminder_wake(bot, raid, now_utc=inside, attempted=False) == inside.timestamp()
+
+    repo.upsert_debug_cache(
+        cache_key=RewriteDiscordBot._raid_reminder_cache_key(raid.id, day_label, time_label),
+        kind="raid_reminder",
+        guild_id=1,
+        raid_id=raid.id,
+        message_id=1,
+        payload_hash="hash",
+    )
+    assert RewriteDiscordBot._next_reminder_wake(bot, raid, now_utc=inside, attempted=True) == start_ts + 1.0
+    after = datetime(2026, 2, 13, 19, 5, tzinfo=UTC)
+    assert RewriteDiscordBot._next_reminder_wake(bot, raid, now_utc=after, attempted=True) is None
+
+
+@pytest.mark.asyncio
+async def test_run_raid_reminders_once_can_target_specific_raids(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    day_label = "2026-02-13 (Fr)"
+    time_label = "20:00"
+    raids = []
+    for message_id in (5155, 5156):
+        raid = create_raid_from_modal(
+            repo,
+            guild_id=1,
+            guild_name="Guild",
+            planner_channel_id=11,
+            creator_id=100,
+            dungeon_name="Nanos",
+            days_input=day_label,
+            times_input=time_label,
+            min_players_input="1",
+            message_id=message_id,
+        ).raid
+        toggle_vote(repo, raid_id=raid.id, kind="day", option_label=day_label, user_id=200)
+        toggle_vote(repo, raid_id=raid.id, kind="time", option_label=time_label, user_id=200)
+        raids.append(raid)
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._get_guild_feature_settings = lambda _guild_id: _enabled_feature_settings()
+    sent_messages: list[str] = []
+
+    async def _fake_get_text_channel(_channel_id):
+        return SimpleNamespace(id=22)
+
+    async def _fake_ensure_slot_temp_role(_raid, *, day_label: str, time_label: str):
+        return SimpleNamespace(mention="<@&1>", members=[])
+
+    async def _fake_sync_slot_role_members(_raid, *, role, user_ids):
+        return None
+
+    async def _fake_send_channel_message(_channel, **kwargs):
+        sent_messages.append(str(kwargs.get("content", "")))
+        return SimpleNamespace(id=7200 + len(sent_messages))
+
+    bot._get_text_channel = _fake_get_text_channel
+    bot._ensure_slot_temp_role = _fake_ensure_slot_temp_role
+    bot._sync_slot_role_members = _fake_sync_slot_role_members
+    bot._send_channel_message = _fake_send_channel_message
+
+    now = datetime(2026, 2, 13, 18, 52, tzinfo=UTC)
+    sent = await RewriteDiscordBot._run_raid_reminders_once(bot, now_utc=now, raid_ids=[raids[1].id])
+
+    assert sent == 1
+    assert f"Raid `{raids[1].display_id}`" in sent_messages[0]
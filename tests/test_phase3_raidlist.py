@@ -56,6 +56,49 @@ async def test_raidlist_updater_debounces_and_forces():
     assert calls == [1, 1]
 
 
+@pytest.mark.asyncio
+async def test_raidlist_updater_max_wait_bounds_steady_marks():
+    calls: list[int] = []
+
+    async def update(guild_id: int) -> None:
+        calls.append(guild_id)
+
+    updater = DebouncedGuildUpdater(update, debounce_seconds=0.05, cooldown_seconds=0.0, max_wait_seconds=0.08)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    while loop.time() - started < 0.15:
+        await updater.mark_dirty(1)
+        assert 1 in updater.pending_guilds()
+        await asyncio.sleep(0.01)
+
+    assert calls, "steady marks must not postpone the refresh past max_wait"
+    assert len(calls) <= 3
+    assert set(updater.stats()["pending"]) <= {1}
+    await updater.cancel_all()
+    stats = updater.stats()
+    assert stats["pending"] == {}
+    assert stats["runs"]["count"] == float(len(calls))
+
+
+@pytest.mark.asyncio
+async def test_raidlist_updater_caps_concurrent_runs():
+    active = 0
+    peak = 0
+
+    async def update(_guild_id: int) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    updater = DebouncedGuildUpdater(update, debounce_seconds=0.0, cooldown_seconds=0.0, max_concurrency=2)
+    await asyncio.gather(*(updater.force_update(guild_id) for guild_id in range(6)))
+
+    assert peak == 2
+    assert updater.run_durations.count == 6
+
+
 @pytest.mark.asyncio
 async def test_debounced_raidlist_refresh_persists_state():
     bot = object.__new__(RewriteDiscordBot)
@@ -71,12 +114,17 @@ async def test_debounced_raidlist_refresh_persists_state():
         assert dirty_tables == {"settings", "debug_cache"}
         return True
 
+    async def fake_calendar_refresh(guild_id: int, *, force: bool = False, month_start=None):
+        calls.append(("calendar", guild_id, force))
+        return False
+
     bot._refresh_raidlist_for_guild = fake_refresh
+    bot._refresh_raid_calendar_for_guild = fake_calendar_refresh
     bot._persist = fake_persist
 
     await RewriteDiscordBot._refresh_raidlist_for_guild_persisted(bot, 77)
 
-    assert calls == [("refresh", 77, False), ("persist",)]
+    assert calls == [("refresh", 77, False), ("calendar", 77, False), ("persist",)]
 
 
 @pytest.mark.asyncio
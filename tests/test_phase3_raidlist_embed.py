@@ -32,6 +32,7 @@ def test_build_raidlist_embed_contains_structured_raid_data(repo):
 
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._raidlist_fields = {}
 
     embed, payload_hash, debug_lines = RewriteDiscordBot._build_raidlist_embed(
         bot,
@@ -75,6 +76,8 @@ async def test_refresh_raidlist_for_guild_posts_embed(repo):
 
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._raidlist_fields = {}
+    bot._raidlist_render_state = {}
     bot._raidlist_hash_by_guild = {}
     bot.config = SimpleNamespace(raidlist_debug_channel_id=0)
     bot.get_guild = lambda _guild_id: SimpleNamespace(name="Guild")
@@ -101,3 +104,109 @@ async def test_refresh_raidlist_for_guild_posts_embed(repo):
     assert sent_kwargs.get("embed") is not None
     assert sent_kwargs.get("content") is None
     assert repo.ensure_settings(1).raidlist_message_id == 888
+
+
+def test_build_raidlist_embed_rerenders_only_changed_raids(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raids = [
+        create_raid_from_modal(
+            repo,
+            guild_id=1,
+            guild_name="Guild",
+            planner_channel_id=11,
+            creator_id=100 + index,
+            dungeon_name="Nanos",
+            days_input="2026-02-13 (Fr)",
+            times_input="20:00",
+            min_players_input="1",
+            message_id=5151 + index,
+        ).raid
+        for index in range(3)
+    ]
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._raidlist_fields = {}
+    rendered: list[int] = []
+    original_render = RewriteDiscordBot._render_raidlist_field
+
+    def _counting_render(raid, **kwargs):
+        rendered.append(raid.id)
+        return original_render(bot, raid, **kwargs)
+
+    bot._render_raidlist_field = _counting_render
+
+    def _build():
+        return RewriteDiscordBot._build_raidlist_embed(bot, guild_id=1, guild_name="Guild", raids=repo.list_open_raids(1))
+
+    _, first_hash, _ = _build()
+    assert rendered == [raid.id for raid in raids]
+
+    rendered.clear()
+    _, same_hash, _ = _build()
+    assert rendered == []
+    assert same_hash == first_hash
+
+    toggle_vote(repo, raid_id=raids[1].id, kind="day", option_label="2026-02-13 (Fr)", user_id=200)
+    toggle_vote(repo, raid_id=raids[1].id, kind="time", option_label="20:00", user_id=200)
+    _, changed_hash, _ = _build()
+    assert rendered == [raids[1].id]
+    assert changed_hash != first_hash
+
+
+@pytest.mark.asyncio
+async def test_refresh_raidlist_skips_render_when_version_vector_unchanged(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="2026-02-13 (Fr)",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    ).raid
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._raidlist_fields = {}
+    bot._raidlist_render_state = {}
+    bot._raidlist_hash_by_guild = {}
+    bot.config = SimpleNamespace(raidlist_debug_channel_id=0)
+    bot.get_guild = lambda _guild_id: SimpleNamespace(name="Guild")
+    builds: list[int] = []
+    original_build = RewriteDiscordBot._build_raidlist_embed
+
+    def _counting_build(**kwargs):
+        builds.append(kwargs["guild_id"])
+        return original_build(bot, **kwargs)
+
+    async def _fake_get_text_channel(_channel_id):
+        return SimpleNamespace(id=33)
+
+    async def _fake_send_channel_message(_channel, **_kwargs):
+        return SimpleNamespace(id=888)
+
+    async def _fake_edit_message_by_id(_channel, _message_id, **_kwargs):
+        return SimpleNamespace(id=888)
+
+    async def _fake_mirror_debug_payload(**_kwargs):
+        return None
+
+    bot._build_raidlist_embed = _counting_build
+    bot._get_text_channel = _fake_get_text_channel
+    bot._send_channel_message = _fake_send_channel_message
+    bot._edit_message_by_id = _fake_edit_message_by_id
+    bot._mirror_debug_payload = _fake_mirror_debug_payload
+
+    assert await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1) is True
+    assert await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1) is False
+    assert builds == [1]
+
+    toggle_vote(repo, raid_id=raid.id, kind="day", option_label="2026-02-13 (Fr)", user_id=200)
+    toggle_vote(repo, raid_id=raid.id, kind="time", option_label="20:00", user_id=200)
+    assert await RewriteDiscordBot._refresh_raidlist_for_guild(bot, 1) is True
+    assert builds == [1, 1]
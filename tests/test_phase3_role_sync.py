@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from discord.role_sync import RoleSyncEngine
+
+
+class _Member:
+    def __init__(self, member_id: int, roles: list, *, bot: bool = False) -> None:
+        self.id = member_id
+        self.bot = bot
+        self.roles = list(roles)
+        self.calls: list[tuple[str, tuple[int, ...]]] = []
+
+    async def add_roles(self, *roles, reason=None):
+        self.calls.append(("add", tuple(role.id for role in roles)))
+
+    async def remove_roles(self, *roles, reason=None):
+        self.calls.append(("remove", tuple(role.id for role in roles)))
+
+    async def edit(self, *, roles, reason=None):
+        self.calls.append(("edit", tuple(role.id for role in roles)))
+
+
+def _role(role_id: int, members: list | None = None, *, default: bool = False):
+    return SimpleNamespace(id=role_id, members=list(members or []), is_default=lambda: default)
+
+
+@pytest.mark.asyncio
+async def test_role_sync_uses_one_edit_per_member_for_multiple_slot_changes():
+    everyone = _role(1, default=True)
+    keep = _role(5)
+    slot_a = _role(10)
+    slot_b = _role(11)
+    slot_c = _role(12)
+
+    multi = _Member(100, [everyone, keep, slot_c])
+    single = _Member(200, [everyone])
+    unchanged = _Member(300, [everyone, slot_a])
+    bot_member = _Member(400, [everyone], bot=True)
+    slot_a.members = [unchanged]
+    slot_c.members = [multi]
+    members = {m.id: m for m in (multi, single, unchanged, bot_member)}
+    guild = SimpleNamespace(get_member=lambda member_id: members.get(member_id))
+
+    result = await RoleSyncEngine().sync(
+        guild,
+        [(slot_a, [100, 300, 400]), (slot_b, [100, 200]), (slot_c, [])],
+        reason="test",
+    )
+
+    assert multi.calls == [("edit", (5, 10, 11))]
+    assert single.calls == [("add", (11,))]
+    assert unchanged.calls == []
+    assert bot_member.calls == []
+    assert result.members_changed == 2
+    assert result.api_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_role_strip_groups_roles_per_member():
+    everyone = _role(1, default=True)
+    slot_a = _role(10)
+    slot_b = _role(11)
+    both = _Member(100, [everyone, slot_a, slot_b])
+    one = _Member(200, [everyone, slot_b])
+    slot_a.members = [both]
+    slot_b.members = [both, one]
+
+    result = await RoleSyncEngine(max_concurrency=1).strip([slot_a, slot_b], reason="cleanup")
+
+    assert both.calls == [("edit", ())]
+    assert one.calls == [("remove", (11,))]
+    assert result.failed == 0
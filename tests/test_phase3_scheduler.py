@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from discord.scheduler import PeriodicScheduler
+from discord.task_registry import SingletonTaskRegistry
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_jobs_at_fixed_cadence_and_skips_overruns():
+    registry = SingletonTaskRegistry()
+    scheduler = PeriodicScheduler(registry=registry, jitter_ratio=0.0)
+    fast_runs = 0
+    slow_runs = 0
+
+    async def fast_job():
+        nonlocal fast_runs
+        fast_runs += 1
+
+    async def slow_job():
+        nonlocal slow_runs
+        slow_runs += 1
+        await asyncio.sleep(0.1)
+
+    scheduler.add_job("fast", fast_job, interval_seconds=0.02, initial_delay=0)
+    scheduler.add_job("slow", slow_job, interval_seconds=0.02, initial_delay=0)
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.13)
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+
+    status = scheduler.status()
+    assert fast_runs >= 4
+    assert slow_runs <= 2
+    assert status["slow"]["skipped"] >= 2
+    assert registry.status()["slow"]["overruns"] >= 1
+    assert status["slow"]["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_spread_job_cycles_keys_one_per_fire():
+    scheduler = PeriodicScheduler(jitter_ratio=0.0)
+    seen: list[int] = []
+
+    async def per_guild(guild_id: int):
+        seen.append(guild_id)
+
+    scheduler.add_spread_job("username_sync", per_guild, lambda: [1, 2, 3], interval_seconds=0.09, initial_delay=0)
+    runner = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.075)
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+
+    assert seen[:3] == [1, 2, 3]
+    assert len(seen) <= 4
+
+
+def test_jitter_offsets_first_fire_within_ratio():
+    now = [100.0]
+    scheduler = PeriodicScheduler(jitter_ratio=0.1, clock=lambda: now[0], rng=lambda low, high: high)
+
+    scheduler.add_job("backup", lambda: asyncio.sleep(0), interval_seconds=300, initial_delay=0)
+
+    assert scheduler._heap[0][0] == pytest.approx(130.0)
+    assert scheduler.status()["backup"]["next_in"] == 0.0
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from bot.runtime import RewriteDiscordBot
+
+
+@pytest.mark.asyncio
+async def test_cleanup_stale_raids_visits_only_expired_and_refreshes_each_guild_once(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    old_raids = [
+        repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=10, dungeon="Nanos", min_players=1)
+        for _ in range(2)
+    ]
+    for raid in old_raids:
+        raid.created_at = datetime(2020, 1, 1)
+    fresh = repo.create_raid(guild_id=1, planner_channel_id=11, creator_id=11, dungeon="Skull", min_players=1)
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._stale_raid_expiry = None
+    closed: list[int | None] = []
+    refreshed: list[tuple[int, bool]] = []
+    persisted: list[bool] = []
+    active = 0
+    peak = 0
+
+    async def _fake_close_planner_message(*, guild_id, channel_id, message_id, reason):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        closed.append(message_id)
+
+    async def _fake_cleanup_temp_role(_raid):
+        return None
+
+    async def _fake_refresh_raidlist(guild_id: int, *, force: bool = False):
+        refreshed.append((guild_id, force))
+        return True
+
+    async def _fake_persist(*, dirty_tables=None):
+        persisted.append(True)
+        return True
+
+    bot._close_planner_message = _fake_close_planner_message
+    bot._cleanup_temp_role = _fake_cleanup_temp_role
+    bot._refresh_raidlist_for_guild = _fake_refresh_raidlist
+    bot._persist = _fake_persist
+
+    removed = await RewriteDiscordBot._cleanup_stale_raids_once(bot)
+
+    assert removed == 2
+    assert peak == 2
+    assert refreshed == [(1, True)]
+    assert persisted == [True]
+    assert [raid.id for raid in repo.list_open_raids()] == [fresh.id]
+    assert fresh.id in bot._stale_raid_expiry_queue()
+
+    assert await RewriteDiscordBot._cleanup_stale_raids_once(bot) == 0
+    assert refreshed == [(1, True)]
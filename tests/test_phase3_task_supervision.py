@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from discord.task_registry import SingletonTaskRegistry
+
+
+@pytest.mark.asyncio
+async def test_supervised_worker_restarts_after_crash_with_backoff():
+    registry = SingletonTaskRegistry(restart_base_delay=0.01, restart_max_delay=0.02)
+    runs = 0
+    finished = asyncio.Event()
+
+    async def flaky_worker():
+        nonlocal runs
+        runs += 1
+        if runs < 3:
+            raise RuntimeError(f"boom {runs}")
+        finished.set()
+        await asyncio.sleep(60)
+
+    task = registry.start_once("flaky", flaky_worker, supervise=True)
+    await asyncio.wait_for(finished.wait(), timeout=1)
+
+    status = registry.status()["flaky"]
+    assert runs == 3
+    assert registry.get("flaky") is task
+    assert status["state"] == "running"
+    assert status["restarts"] == 2
+    assert status["last_error"] == "RuntimeError: boom 2"
+    assert [registry.restart_delay(n) for n in (1, 2, 3)] == [0.01, 0.02, 0.02]
+
+    await registry.cancel_all()
+    assert registry.status()["flaky"]["state"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_unsupervised_worker_crash_is_reported():
+    registry = SingletonTaskRegistry()
+
+    async def broken_worker():
+        raise ValueError("nope")
+
+    task = registry.start_once("broken", broken_worker)
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert registry.status()["broken"]["state"] == "crashed"
+
+
+def test_track_iteration_records_durations_and_overruns():
+    registry = SingletonTaskRegistry()
+
+    with registry.track_iteration("voice_xp_worker", interval_seconds=60):
+        pass
+    with registry.track_iteration("voice_xp_worker", interval_seconds=-1):
+        pass
+
+    status = registry.status()["voice_xp_worker"]
+    assert status["state"] == "idle"
+    assert status["durations"]["count"] == 2.0
+    assert status["overruns"] == 1
+    assert status["last_run_at"] is not None
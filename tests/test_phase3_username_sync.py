@@ -6,6 +6,7 @@ from types import SimpleNamespace
 import pytest
 
 from bot.runtime import RewriteDiscordBot
+from discord.member_names import MemberNameCache
 
 
 async def _empty_fetch_members(*, limit=None):
@@ -27,6 +28,7 @@ async def _single_fetch_member(*, limit=None):
 async def test_sync_guild_usernames_inserts_member_names(repo):
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._member_names = MemberNameCache()
     bot._state_lock = asyncio.Lock()
     bot._username_sync_next_run_by_guild = {}
     bot._level_state_dirty = False
@@ -54,6 +56,7 @@ async def test_sync_guild_usernames_inserts_member_names(repo):
 async def test_sync_guild_usernames_updates_changed_name(repo):
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._member_names = MemberNameCache()
     bot._state_lock = asyncio.Lock()
     bot._username_sync_next_run_by_guild = {}
     bot._level_state_dirty = False
@@ -112,6 +115,7 @@ async def test_collect_guild_usernames_fetches_missing_members_when_intent_enabl
 def test_plain_user_list_uses_db_username_fallback(repo):
     bot = object.__new__(RewriteDiscordBot)
     bot.repo = repo
+    bot._member_names = MemberNameCache()
     bot.get_guild = lambda _guild_id: None
 
     row = repo.get_or_create_user_level(1, 2001, "PersistedName")
@@ -121,3 +125,37 @@ def test_plain_user_list_uses_db_username_fallback(repo):
 
     assert "PersistedName" in rendered
     assert "User 2001" not in rendered
+
+
+@pytest.mark.asyncio
+async def test_plain_user_list_is_memoised_and_refreshed_by_member_update(repo):
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._member_names = MemberNameCache()
+    bot._state_lock = asyncio.Lock()
+    bot._level_state_dirty = False
+    lookups: list[int] = []
+    members = {
+        2001: SimpleNamespace(id=2001, bot=False, display_name="bravo", global_name=None, name="bravo"),
+        2002: SimpleNamespace(id=2002, bot=False, display_name="Alpha", global_name=None, name="alpha"),
+    }
+
+    def _get_member(user_id):
+        lookups.append(user_id)
+        return members.get(user_id)
+
+    guild = SimpleNamespace(id=1, get_member=_get_member)
+    bot._safe_get_guild = lambda _guild_id: guild
+
+    first = RewriteDiscordBot._plain_user_list_for_embed(bot, 1, {2001, 2002})
+    second = RewriteDiscordBot._plain_user_list_for_embed(bot, 1, {2002, 2001})
+
+    assert first == "• Alpha\n• bravo"
+    assert second == first
+    assert sorted(lookups) == [2001, 2002]
+
+    renamed = SimpleNamespace(id=2001, bot=False, display_name="Aaron", global_name=None, name="aaron", guild=guild)
+    await RewriteDiscordBot.on_member_update(bot, members[2001], renamed)
+
+    assert RewriteDiscordBot._plain_user_list_for_embed(bot, 1, {2001, 2002}) == "• Aaron\n• Alpha"
+    assert sorted(lookups) == [2001, 2002]
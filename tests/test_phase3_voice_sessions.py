@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from bot.runtime import RewriteDiscordBot
+from services.leveling_service import LevelingService
+
+
+def _bot(repo, guild) -> RewriteDiscordBot:
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot._state_lock = asyncio.Lock()
+    bot._level_state_dirty = False
+    bot.leveling_service = LevelingService()
+    bot._get_guild_feature_settings = lambda _guild_id: SimpleNamespace(leveling_enabled=True)
+    bot._safe_get_guild = lambda _guild_id: guild
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_voice_disconnect_credits_full_hours_of_the_session(repo):
+    guild = SimpleNamespace(id=1, get_member=lambda _user_id: None)
+    bot = _bot(repo, guild)
+    member = SimpleNamespace(id=42, bot=False, guild=guild, display_name="User42")
+    bot.leveling_service.on_voice_connect(1, 42, datetime.now(UTC) - timedelta(hours=2, minutes=5))
+
+    await RewriteDiscordBot.on_voice_state_update(
+        bot,
+        member,
+        SimpleNamespace(channel=SimpleNamespace(id=5)),
+        SimpleNamespace(channel=None),
+    )
+
+    assert repo.get_or_create_user_level(1, 42, "User42").xp == 2
+    assert bot._level_state_dirty is True
+    assert bot.leveling_service.has_voice_session(1, 42) is False
+
+
+@pytest.mark.asyncio
+async def test_voice_xp_job_only_touches_due_sessions_and_drops_missed_leaves(repo):
+    in_voice = SimpleNamespace(id=42, bot=False, display_name="User42", voice=SimpleNamespace(channel=object()))
+    left = SimpleNamespace(id=43, bot=False, display_name="User43", voice=None)
+    members = {42: in_voice, 43: left}
+    guild = SimpleNamespace(id=1, get_member=members.get)
+    bot = _bot(repo, guild)
+    started = datetime.now(UTC) - timedelta(hours=1, minutes=1)
+    bot.leveling_service.on_voice_connect(1, 42, started)
+    bot.leveling_service.on_voice_connect(1, 43, started)
+    bot.leveling_service.on_voice_connect(1, 44, datetime.now(UTC))
+
+    await RewriteDiscordBot._voice_xp_job(bot)
+
+    assert repo.get_or_create_user_level(1, 42, "User42").xp == 1
+    assert repo.get_or_create_user_level(1, 43, "User43").xp == 0
+    assert bot.leveling_service.has_voice_session(1, 43) is False
+    assert bot.leveling_service.has_voice_session(1, 44) is True
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from bot.runtime import RewriteDiscordBot
+from discord.task_registry import CoalescingTaskQueue, KeyedDebouncer
+from services.raid_service import create_raid_from_modal
+from utils.metrics import DurationHistogram, DurationMetrics
+from views.raid_views import RaidVoteView
+
+
+class _Followup:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    async def send(self, content=None, *, ephemeral: bool = False, **_kwargs):
+        self.messages.append(str(content))
+
+
+def _interaction(values: list[str], user_id: int = 200):
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=1),
+        data={"values": values},
+        user=SimpleNamespace(id=user_id, display_name=f"User{user_id}"),
+        followup=_Followup(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_vote_is_acked_before_ui_sync_and_persist(repo):
+    repo.configure_channels(1, planner_channel_id=11, participants_channel_id=22, raidlist_channel_id=33)
+    raid = create_raid_from_modal(
+        repo,
+        guild_id=1,
+        guild_name="Guild",
+        planner_channel_id=11,
+        creator_id=100,
+        dungeon_name="Nanos",
+        days_input="Mon",
+        times_input="20:00",
+        min_players_input="1",
+        message_id=5151,
+    ).raid
+
+    bot = object.__new__(RewriteDiscordBot)
+    bot.repo = repo
+    bot.raid_ui_updater = KeyedDebouncer(bot._run_raid_ui_update)
+    bot._vote_ui_pipeline = CoalescingTaskQueue()
+    bot._vote_ui_waiters = {}
+    bot._metrics = DurationMetrics()
+    bot._state_lock = asyncio.Lock()
+    release_sync = asyncio.Event()
+    calls: list[str] = []
+
+    async def _fake_defer(_interaction, *, ephemeral: bool = False):
+        return True
+
+    async def _fake_sync(raid_id: int):
+        calls.append(f"sync:{raid_id}")
+        await release_sync.wait()
+
+    async def _fake_persist(*, dirty_tables=None):
+        calls.append("persist")
+        return False
+
+    bot._defer = _fake_defer
+    bot._sync_vote_ui_after_change = _fake_sync
+    bot._persist = _fake_persist
+
+    view = RaidVoteView(bot, raid.id, ["Mon"], ["20:00"])
+    interaction = _interaction(["Mon"])
+    await view._vote(interaction, kind="day")
+
+    assert interaction.followup.messages == ["Stimme aktualisiert fuer **User200**."]
+    assert repo.vote_user_sets(raid.id)[0]["Mon"] == {200}
+    assert bot._metrics.histogram("vote_ack").count == 1
+
+    await asyncio.sleep(0)
+    assert calls == [f"sync:{raid.id}"]
+    release_sync.set()
+    assert await bot._vote_ui_pipeline.drain(timeout=1)
+
+    assert calls == [f"sync:{raid.id}", "persist"]
+    assert interaction.followup.messages[-1] == "Stimme gesetzt, aber DB-Speicherung fehlgeschlagen."
+    assert bot._metrics.histogram("vote_ui_settle").count == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_queue_collapses_submissions_during_a_run():
+    queue = CoalescingTaskQueue()
+    gate = asyncio.Event()
+    runs: list[int] = []
+
+    async def _job(tag: int):
+        runs.append(tag)
+        await gate.wait()
+
+    queue.submit("raid", lambda: _job(1))
+    await asyncio.sleep(0)
+    for tag in (2, 3, 4):
+        queue.submit("raid", lambda tag=tag: _job(tag))
+    gate.set()
+    assert await queue.drain(timeout=1)
+
+    assert runs == [1, 4]
+    assert queue.pending_keys() == []
+
+
+def test_duration_histogram_quantiles_use_bucket_bounds():
+    histogram = DurationHistogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == 3.0
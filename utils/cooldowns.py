@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import heapq
+from typing import Generic, Hashable, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ExpiringKeyMap(Generic[K, V]):
+    """Values with a per-entry deadline, grouped into coarse time buckets.
+
+    Expired entries are dropped a whole bucket at a time as the clock passes it, and
+    ``max_entries`` caps memory by evicting the soonest-expiring bucket first. A bucket
+    stays in ``_buckets`` (possibly empty) for as long as its id is on the heap, so every
+    bucket id is pushed at most once. ``evicted`` counts live entries dropped by the cap.
+    """
+
+    def __init__(self, *, bucket_seconds: float = 60.0, max_entries: int = 100_000) -> None:
+        self.bucket_seconds = max(1.0, float(bucket_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._entries: dict[K, tuple[V, float, int]] = {}
+        self._buckets: dict[int, set[K]] = {}
+        self._bucket_heap: list[int] = []
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K, now: float) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= now:
+            return None
+        return entry[0]
+
+    def set(self, key: K, value: V, *, expires_at: float, now: float) -> None:
+        self._remove(key)
+        bucket = int(expires_at // self.bucket_seconds)
+        members = self._buckets.get(bucket)
+        if members is None:
+            members = set()
+            self._buckets[bucket] = members
+            heapq.heappush(self._bucket_heap, bucket)
+        members.add(key)
+        self._entries[key] = (value, float(expires_at), bucket)
+        self.prune(now)
+        while len(self._entries) > self.max_entries:
+            self._evict_one()
+
+    def pop(self, key: K) -> V | None:
+        entry = self._remove(key)
+        return entry[0] if entry is not None else None
+
+    def prune(self, now: float) -> int:
+        removed = 0
+        while self._bucket_heap and (self._bucket_heap[0] + 1) * self.bucket_seconds <= now:
+            bucket = heapq.heappop(self._bucket_heap)
+            for key in self._buckets.pop(bucket, ()):
+                self._entries.pop(key, None)
+                removed += 1
+        return removed
+
+    def _remove(self, key: K) -> tuple[V, float, int] | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            members = self._buckets.get(entry[2])
+            if members is not None:
+                # Empty buckets are left for prune()/_evict_one() so the heap keeps one id per bucket.
+                members.discard(key)
+        return entry
+
+    def _evict_one(self) -> None:
+        while self._bucket_heap:
+            members = self._buckets.get(self._bucket_heap[0])
+            if not members:
+                self._buckets.pop(heapq.heappop(self._bucket_heap), None)
+                continue
+            self._entries.pop(members.pop(), None)
+            self.evicted += 1
+            if not members:
+                self._buckets.pop(heapq.heappop(self._bucket_heap), None)
+            return
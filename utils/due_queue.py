@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import heapq
+from typing import Generic, Hashable, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DueQueue(Generic[K]):
+    """Min-heap of keys by due time; rescheduling a key supersedes its older entry."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, K]] = []
+        self._due: dict[K, tuple[float, int]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._due
+
+    def schedule(self, key: K, due: float) -> None:
+        self._seq += 1
+        self._due[key] = (float(due), self._seq)
+        heapq.heappush(self._heap, (float(due), self._seq, key))
+
+    def schedule_earliest(self, key: K, due: float) -> None:
+        """Schedule ``key`` unless it is already due at or before ``due``."""
+        current = self._due.get(key)
+        if current is None or float(due) < current[0]:
+            self.schedule(key, due)
+
+    def discard(self, key: K) -> None:
+        self._due.pop(key, None)
+
+    def due_at(self, key: K) -> float | None:
+        current = self._due.get(key)
+        return current[0] if current is not None else None
+
+    def _drop_stale(self) -> None:
+        while self._heap:
+            due, seq, key = self._heap[0]
+            if self._due.get(key) == (due, seq):
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> float | None:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> list[K]:
+        keys: list[K] = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return keys
+            _, _, key = heapq.heappop(self._heap)
+            self._due.pop(key, None)
+            keys.append(key)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._due.clear()
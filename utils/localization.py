@@ -1,7 +1,9 @@
 """Localization system für Deutsch/English."""
 from __future__ import annotations
 
-from typing import Literal
+from dataclasses import dataclass
+from string import Formatter
+from typing import Literal, Mapping
 
 Language = Literal["de", "en"]
 
@@ -268,12 +270,105 @@ STRINGS: dict[Language, dict[str, str]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledString:
+    text: str
+    fields: frozenset[str]
+    # True when the text has no braces, so formatting could not change it.
+    static: bool
+    # Parse error of a malformed template; ``fields`` is empty then.
+    error: str | None = None
+
+
+def _compile_string(text: str) -> CompiledString:
+    static = "{" not in text and "}" not in text
+    try:
+        fields = frozenset(field for _literal, field, _spec, _conv in Formatter().parse(text) if field)
+    except ValueError as exc:
+        return CompiledString(text=text, fields=frozenset(), static=static, error=str(exc))
+    return CompiledString(text=text, fields=fields, static=static)
+
+
+def _compile_catalog(strings: Mapping[str, Mapping[str, str]]) -> dict[str, dict[str, CompiledString]]:
+    """Per-language templates with the German fallback already merged in."""
+    fallback = {key: _compile_string(text) for key, text in strings["de"].items()}
+    catalog: dict[str, dict[str, CompiledString]] = {}
+    for language, entries in strings.items():
+        compiled = dict(fallback)
+        compiled.update((key, _compile_string(text)) for key, text in entries.items())
+        catalog[language] = compiled
+    return catalog
+
+
+def validate_catalog(strings: Mapping[str, Mapping[str, str]] = STRINGS, *, reference: str = "de") -> list[str]:
+    """Missing keys, broken templates and placeholder mismatches against the reference language."""
+    problems: list[str] = []
+    compiled = {
+        language: {key: _compile_string(text) for key, text in entries.items()}
+        for language, entries in strings.items()
+    }
+    reference_entries = compiled[reference]
+    for key, entry in reference_entries.items():
+        if entry.error is not None:
+            problems.append(f"{reference}.{key}: invalid template ({entry.error})")
+    for language, entries in compiled.items():
+        for key in reference_entries:
+            if key not in entries:
+                problems.append(f"{language}.{key}: missing")
+        if language == reference:
+            continue
+        for key, entry in entries.items():
+            if entry.error is not None:
+                problems.append(f"{language}.{key}: invalid template ({entry.error})")
+                continue
+            expected = reference_entries.get(key)
+            if expected is None:
+                problems.append(f"{language}.{key}: unknown key")
+            elif expected.error is None and entry.fields != expected.fields:
+                problems.append(
+                    f"{language}.{key}: placeholders {sorted(entry.fields)} "
+                    f"differ from {reference} {sorted(expected.fields)}"
+                )
+    return problems
+
+
+_CATALOG = _compile_catalog(STRINGS)
+
+
 def get_string(language: Language, key: str, **kwargs) -> str:
     """Holt einen String in der gewünschten Sprache mit optionalen Platzhaltern."""
-    text = STRINGS.get(language, {}).get(key, STRINGS["de"].get(key, f"[{key}]"))
-    if kwargs:
-        return text.format(**kwargs)
-    return text
+    compiled = (_CATALOG.get(language) or _CATALOG["de"]).get(key)
+    if compiled is None:
+        return f"[{key}]"
+    if not kwargs or compiled.static:
+        return compiled.text
+    return compiled.text.format(**kwargs)
+
+
+def render_raidlist_field(
+    language: Language,
+    *,
+    display_id: int,
+    dungeon: str,
+    players: str,
+    qualified_count: int,
+    complete_votes: int,
+    timezone_name: str,
+    next_slot_text: str,
+    jump_url: str,
+) -> tuple[str, str]:
+    """Name and value of one raid's raidlist field, rendered against a single catalog lookup."""
+    strings = _CATALOG.get(language) or _CATALOG["de"]
+    name = strings["raidlist_raid_field"].text.format(display_id=display_id, dungeon=dungeon)
+    value = (
+        strings["raidlist_minimum"].text.format(players=players) + "\n"
+        + strings["raidlist_qualified_slots"].text.format(count=qualified_count) + "\n"
+        + strings["raidlist_votes"].text.format(count=complete_votes) + "\n"
+        + strings["raidlist_timezone"].text.format(tz=timezone_name) + "\n"
+        + strings["raidlist_next_slot"].text + f": {next_slot_text}\n"
+        + f"[{strings['raidlist_view_raid'].text}]({jump_url})"
+    )
+    return name, value
 
 
 def get_lang(guild_settings) -> Language:
@@ -282,4 +377,12 @@ def get_lang(guild_settings) -> Language:
     return "de" if lang == "de" else "en"
 
 
-__all__ = ["Language", "STRINGS", "get_string", "get_lang"]
+__all__ = [
+    "CompiledString",
+    "Language",
+    "STRINGS",
+    "get_lang",
+    "get_string",
+    "render_raidlist_field",
+    "validate_catalog",
+]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable
+
+
+DEFAULT_DURATION_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class DurationHistogram:
+    """Fixed-bucket duration histogram (seconds); cheap enough to observe on every event."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_DURATION_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(float(bound) for bound in buckets))
+        # One extra slot for observations above the largest bound.
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        value = max(0.0, float(seconds))
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound containing the q-quantile (the max for the overflow bucket)."""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(min(1.0, max(0.0, q)) * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": float(self.count),
+            "mean": round(self.mean, 4),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 4),
+        }
+
+
+class DurationMetrics:
+    """Named duration histograms, created on first observation."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_DURATION_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._histograms: dict[str, DurationHistogram] = {}
+
+    def histogram(self, name: str) -> DurationHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = DurationHistogram(self._buckets)
+            self._histograms[name] = histogram
+        return histogram
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.histogram(name).observe(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {name: histogram.snapshot() for name, histogram in sorted(self._histograms.items())}
@@ -11,6 +11,11 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from bot.discord_api import app_commands, discord
 from utils.leveling import xp_needed_for_level
+from utils.slot_times import (
+    DEFAULT_TIMEZONE_NAME,
+    parse_raid_date_label as _parse_raid_date_from_label,
+    parse_raid_time_label as _parse_raid_time_label,
+)
 
 log = logging.getLogger("dmw.runtime")
 DEFAULT_PRIVILEGED_USER_ID = 403988960638009347
@@ -18,6 +23,7 @@ NANOMON_IMAGE_URL = "https://wikimon.net/images/thumb/c/cc/Nanomon_New_Century.p
 APPROVED_GIF_URL = "https://c.tenor.com/l8waltLHrxcAAAAC/tenor.gif"
 STALE_RAID_HOURS = 7 * 24
 STALE_RAID_CHECK_SECONDS = 15 * 60
+STALE_RAID_CLEANUP_CONCURRENCY = 4
 VOICE_XP_CHECK_SECONDS = 60
 LEVEL_PERSIST_WORKER_POLL_SECONDS = 5
 LOG_CHANNEL_LOGGER_NAMES = ("dmw.runtime", "dmw.db")
@@ -36,6 +42,15 @@ FEATURE_INTERVAL_MASK = 0xFFFF
 BOT_MESSAGE_KIND = "bot_message"
 BOT_MESSAGE_CACHE_PREFIX = "botmsg"
 BOT_MESSAGE_INDEX_MAX_PER_CHANNEL = 400
+BULK_DELETE_BATCH_SIZE = 100
+PURGE_CHANNEL_CONCURRENCY = 4
+RAIDLIST_MAX_WAIT_SECONDS = 6.0
+RAIDLIST_UPDATE_CONCURRENCY = 2
+RAID_UI_DEBOUNCE_SECONDS = 1.0
+RAID_UI_MAX_WAIT_SECONDS = 4.0
+PURGE_PROGRESS_INTERVAL_SECONDS = 2.0
+# Discord rejects bulk deletes for messages older than 14 days; keep a safety margin.
+BULK_DELETE_MAX_AGE_SECONDS = 14 * 24 * 60 * 60 - 10 * 60
 SLOT_TEMP_ROLE_KIND = "slot_temp_role"
 SLOT_TEMP_ROLE_CACHE_PREFIX = "slotrole"
 RAID_REMINDER_KIND = "raid_reminder"
@@ -49,6 +64,8 @@ AUTO_REMINDER_MIN_FILL_PERCENT = 50  # 50%
 AUTO_REMINDER_KIND = "auto_reminder"
 AUTO_REMINDER_CACHE_PREFIX = "autorem"
 RAID_REMINDER_WORKER_SLEEP_SECONDS = 30
+RAID_REMINDER_MAX_IDLE_SECONDS = 15 * 60
+RAID_REMINDER_WAKE_SLACK_SECONDS = 1.0
 RAID_DATE_LOOKAHEAD_DAYS = 21
 RAID_CALENDAR_CONFIG_CACHE_PREFIX = "raidcal_cfg"
 RAID_CALENDAR_MESSAGE_CACHE_PREFIX = "raidcal_msg"
@@ -56,9 +73,9 @@ RAID_CALENDAR_CONFIG_KIND = "raid_calendar_config"
 RAID_CALENDAR_MESSAGE_KIND = "raid_calendar_message"
 RAID_CALENDAR_GRID_ROWS = 5
 RAID_CALENDAR_GRID_COLUMNS = 7
+RAID_CALENDAR_RENDER_CACHE_MONTHS = 6
 RAID_DATE_CACHE_DAYS_MAX = 25
 INTEGRITY_CLEANUP_SLEEP_SECONDS = 15 * 60
-DEFAULT_TIMEZONE_NAME = "Europe/Berlin"
 USERNAME_SYNC_WORKER_SLEEP_SECONDS = 10 * 60
 USERNAME_SYNC_RESCAN_SECONDS = 12 * 60 * 60
 LOG_FORWARD_QUEUE_MAX_SIZE = 1000
@@ -124,6 +141,32 @@ class GuildFeatureSettings:
     auto_reminder_enabled: bool = False
 
 
+@dataclass(slots=True)
+class RaidlistFieldRender:
+    guild_id: int
+    field_name: str
+    field_value: str
+    debug_line: str
+    payload_fragment: str
+    qualified_count: int
+    next_slot_start: datetime | None
+    next_day: str
+    next_time: str
+    # Epoch seconds at which the chosen upcoming slot starts and the "next slot" changes.
+    valid_until: float | None
+
+
+@dataclass(slots=True)
+class PlannerRender:
+    days: tuple[str, ...]
+    times: tuple[str, ...]
+    view: Any
+    # Raid version and guild name generation the embed was rendered for; -1 until the first render.
+    version: int = -1
+    names_generation: int = -1
+    embed: Any = None
+
+
 @dataclass(slots=True)
 class CalendarEntry:
     entry_date: date
@@ -238,6 +281,18 @@ async def _safe_send_initial(interaction: Any, content: str | None, *, ephemeral
         return await _safe_followup(interaction, content, ephemeral=ephemeral, **kwargs)
 
 
+async def _safe_edit_original_response(interaction: Any, **kwargs: Any) -> bool:
+    edit_fn = getattr(interaction, "edit_original_response", None)
+    if edit_fn is None:
+        return False
+    try:
+        await edit_fn(**kwargs)
+        return True
+    except Exception as exc:
+        _log_safe_wrapper_error("interaction.edit_original_response", exc)
+        return False
+
+
 async def _safe_send_channel_message(channel: Any, **kwargs: Any) -> Any | None:
     send_fn = getattr(channel, "send", None)
     if send_fn is None:
@@ -284,6 +339,26 @@ async def _safe_delete_message(message: Any) -> bool:
         return False
 
 
+def _partial_message(channel: Any, message_id: int) -> Any | None:
+    # Partial messages edit/delete by id without the fetch_message round trip.
+    factory = getattr(channel, "get_partial_message", None)
+    if not callable(factory):
+        return None
+    try:
+        return factory(int(message_id))
+    except Exception as exc:
+        _log_safe_wrapper_error("channel.get_partial_message", exc)
+        return None
+
+
+def _is_bulk_deletable(message_id: int, *, now: datetime) -> bool:
+    try:
+        created_at = discord.utils.snowflake_time(int(message_id))
+    except Exception:
+        return False
+    return (now - created_at).total_seconds() < BULK_DELETE_MAX_AGE_SECONDS
+
+
 def _member_name(member: Any) -> str | None:
     for attr in ("display_name", "global_name", "name"):
         value = getattr(member, attr, None)
@@ -320,39 +395,6 @@ def _format_raid_date_label(value: date) -> str:
     return f"{value.isoformat()} ({_raid_weekday_short(value.weekday())})"
 
 
-def _parse_raid_date_from_label(label: str) -> date | None:
-    text = (label or "").strip()
-    match_iso = re.search(r"(\d{4})-(\d{2})-(\d{2})", text)
-    if match_iso is not None:
-        try:
-            return date(int(match_iso.group(1)), int(match_iso.group(2)), int(match_iso.group(3)))
-        except ValueError:
-            return None
-
-    match_dot = re.search(r"(\d{2})\.(\d{2})\.(\d{4})", text)
-    if match_dot is not None:
-        try:
-            return date(int(match_dot.group(3)), int(match_dot.group(2)), int(match_dot.group(1)))
-        except ValueError:
-            return None
-    return None
-
-
-def _parse_raid_time_label(label: str) -> tuple[int, int] | None:
-    text = (label or "").strip()
-    match = re.search(r"^(\d{1,2})[:.](\d{2})$", text)
-    if match is None:
-        return None
-    try:
-        hour = int(match.group(1))
-        minute = int(match.group(2))
-    except ValueError:
-        return None
-    if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-        return None
-    return (hour, minute)
-
-
 def _month_start(value: date) -> date:
     return date(int(value.year), int(value.month), 1)
 
@@ -517,6 +559,7 @@ def _status_embed(
     self_test_ok: str,
     self_test_err: str,
     language: str = "de",
+    worker_status: dict[str, dict[str, Any]] | None = None,
 ) -> Any:
     """Creates a localized status embed."""
     from utils.localization import get_string
@@ -601,6 +644,19 @@ def _status_embed(
         value=health_value,
         inline=False,
     )
+
+    if worker_status:
+        worker_lines = [
+            f"{'✅' if info.get('state') == 'running' else '⚠️'} `{name}` {info.get('state')} · "
+            f"restarts {info.get('restarts', 0)} · overruns {info.get('overruns', 0)} · "
+            f"p95 {info.get('durations', {}).get('p95', 0.0)}s"
+            for name, info in worker_status.items()
+        ]
+        embed.add_field(
+            name="🧵 Worker",
+            value="\n".join(worker_lines)[:1024],
+            inline=False,
+        )
     
     embed.set_footer(text=get_string(lang, "status_footer"))  # type: ignore
     return embed
@@ -612,6 +668,8 @@ __all__ = [
     "BOT_MESSAGE_CACHE_PREFIX",
     "BOT_MESSAGE_INDEX_MAX_PER_CHANNEL",
     "BOT_MESSAGE_KIND",
+    "BULK_DELETE_BATCH_SIZE",
+    "BULK_DELETE_MAX_AGE_SECONDS",
     "CalendarEntry",
     "DEFAULT_PRIVILEGED_USER_ID",
     "DEFAULT_TIMEZONE_NAME",
@@ -636,24 +694,36 @@ __all__ = [
     "PERSIST_FLUSH_MAX_ATTEMPTS",
     "PERSIST_FLUSH_RETRY_BASE_SECONDS",
     "PRIVILEGED_ONLY_HELP_COMMANDS",
+    "PURGE_CHANNEL_CONCURRENCY",
+    "PURGE_PROGRESS_INTERVAL_SECONDS",
+    "PlannerRender",
     "RAID_CALENDAR_CONFIG_CACHE_PREFIX",
     "RAID_CALENDAR_CONFIG_KIND",
     "RAID_CALENDAR_GRID_COLUMNS",
     "RAID_CALENDAR_GRID_ROWS",
     "RAID_CALENDAR_MESSAGE_CACHE_PREFIX",
     "RAID_CALENDAR_MESSAGE_KIND",
+    "RAID_CALENDAR_RENDER_CACHE_MONTHS",
     "RAID_DATE_CACHE_DAYS_MAX",
     "RAID_DATE_LOOKAHEAD_DAYS",
     "RAID_REMINDER_ADVANCE_SECONDS",
     "RAID_REMINDER_CACHE_PREFIX",
     "RAID_REMINDER_KIND",
+    "RAID_REMINDER_MAX_IDLE_SECONDS",
+    "RAID_REMINDER_WAKE_SLACK_SECONDS",
     "RAID_REMINDER_WORKER_SLEEP_SECONDS",
+    "RAIDLIST_MAX_WAIT_SECONDS",
+    "RAIDLIST_UPDATE_CONCURRENCY",
+    "RAID_UI_DEBOUNCE_SECONDS",
+    "RAID_UI_MAX_WAIT_SECONDS",
     "RAID_START_CACHE_PREFIX",
     "RAID_START_KIND",
     "RAID_START_TOLERANCE_SECONDS",
+    "RaidlistFieldRender",
     "SLOT_TEMP_ROLE_CACHE_PREFIX",
     "SLOT_TEMP_ROLE_KIND",
     "STALE_RAID_CHECK_SECONDS",
+    "STALE_RAID_CLEANUP_CONCURRENCY",
     "STALE_RAID_HOURS",
     "USERNAME_SYNC_RESCAN_SECONDS",
     "USERNAME_SYNC_WORKER_SLEEP_SECONDS",
@@ -665,6 +735,7 @@ __all__ = [
     "_extract_slash_command_name",
     "_format_raid_date_label",
     "_is_admin_or_privileged",
+    "_is_bulk_deletable",
     "_member_name",
     "_month_key",
     "_month_label_de",
@@ -675,11 +746,13 @@ __all__ = [
     "_on_off",
     "_parse_raid_date_from_label",
     "_parse_raid_time_label",
+    "_partial_message",
     "_raid_weekday_short",
     "_render_xp_progress_bar",
     "_round_xp_for_display",
     "_safe_defer",
     "_safe_delete_message",
+    "_safe_edit_original_response",
     "_safe_edit_message",
     "_safe_fetch_message",
     "_safe_followup",
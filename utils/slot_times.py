@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, tzinfo
+from functools import lru_cache
+import re
+from typing import Dict, Iterable, Tuple
+from zoneinfo import ZoneInfo
+
+
+DEFAULT_TIMEZONE_NAME = "Europe/Berlin"
+
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_DOT_DATE_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{4})")
+_TIME_RE = re.compile(r"^(\d{1,2})[:.](\d{2})$")
+
+
+def parse_raid_date_label(label: str) -> date | None:
+    text = (label or "").strip()
+    match_iso = _ISO_DATE_RE.search(text)
+    if match_iso is not None:
+        try:
+            return date(int(match_iso.group(1)), int(match_iso.group(2)), int(match_iso.group(3)))
+        except ValueError:
+            return None
+
+    match_dot = _DOT_DATE_RE.search(text)
+    if match_dot is not None:
+        try:
+            return date(int(match_dot.group(3)), int(match_dot.group(2)), int(match_dot.group(1)))
+        except ValueError:
+            return None
+    return None
+
+
+def parse_raid_time_label(label: str) -> tuple[int, int] | None:
+    text = (label or "").strip()
+    match = _TIME_RE.search(text)
+    if match is None:
+        return None
+    try:
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+    except ValueError:
+        return None
+    if hour < 0 or hour > 23 or minute < 0 or minute > 59:
+        return None
+    return (hour, minute)
+
+
+@lru_cache(maxsize=1)
+def default_slot_timezone() -> ZoneInfo:
+    return ZoneInfo(DEFAULT_TIMEZONE_NAME)
+
+
+def combine_slot_start(
+    parsed_date: date | None,
+    parsed_time: tuple[int, int] | None,
+    timezone: tzinfo | None = None,
+) -> datetime | None:
+    """UTC instant of a local raid date and time, or ``None`` when either part is missing."""
+    if parsed_date is None or parsed_time is None:
+        return None
+    try:
+        local_start = datetime(
+            parsed_date.year,
+            parsed_date.month,
+            parsed_date.day,
+            parsed_time[0],
+            parsed_time[1],
+            tzinfo=timezone or default_slot_timezone(),
+        )
+    except ValueError:
+        return None
+    return local_start.astimezone(UTC)
+
+
+@lru_cache(maxsize=4096)
+def slot_start_utc(day_label: str, time_label: str, timezone: tzinfo | None = None) -> datetime | None:
+    return combine_slot_start(parse_raid_date_label(day_label), parse_raid_time_label(time_label), timezone)
+
+
+@dataclass(slots=True)
+class SlotTimeTable:
+    """Parsed day/time labels of one raid and the UTC start of every day/time pair."""
+
+    day_dates: Dict[str, date | None]
+    starts: Dict[Tuple[str, str], datetime | None]
+
+    @classmethod
+    def build(cls, days: Iterable[str], times: Iterable[str], timezone: tzinfo | None = None) -> SlotTimeTable:
+        day_dates = {day: parse_raid_date_label(day) for day in days}
+        time_parts = {time_label: parse_raid_time_label(time_label) for time_label in times}
+        starts = {
+            (day, time_label): combine_slot_start(parsed_date, parsed_time, timezone)
+            for day, parsed_date in day_dates.items()
+            for time_label, parsed_time in time_parts.items()
+        }
+        return cls(day_dates=day_dates, starts=starts)
+
+    def start_utc(self, day_label: str, time_label: str) -> datetime | None:
+        key = (day_label, time_label)
+        if key in self.starts:
+            return self.starts[key]
+        return slot_start_utc(day_label, time_label)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple
 
 
@@ -11,6 +12,62 @@ def memberlist_target_label(min_players: int) -> str:
     return str(min_players) if min_players > 0 else "1+"
 
 
+class SlotVoteBitsets:
+    """Day/time voters of one raid as integer bitmasks over a dense voter index.
+
+    The masks answer "how many voters share this day and time" with one AND and a
+    popcount; only slots that reach the threshold are decoded back into user ids.
+    """
+
+    __slots__ = ("user_ids", "day_masks", "time_masks")
+
+    def __init__(self, *, day_users: Dict[str, Set[int]], time_users: Dict[str, Set[int]]) -> None:
+        voters: Set[int] = set()
+        for users in day_users.values():
+            voters.update(users)
+        for users in time_users.values():
+            voters.update(users)
+        # Ascending ids, so decoding a mask from the low bit upwards yields sorted ids.
+        self.user_ids: List[int] = sorted(voters)
+        bit_by_user = {user_id: 1 << index for index, user_id in enumerate(self.user_ids)}
+        self.day_masks = {label: sum(map(bit_by_user.__getitem__, users)) for label, users in day_users.items()}
+        self.time_masks = {label: sum(map(bit_by_user.__getitem__, users)) for label, users in time_users.items()}
+
+    def decode(self, mask: int) -> List[int]:
+        user_ids = self.user_ids
+        out: List[int] = []
+        while mask:
+            low = mask & -mask
+            out.append(user_ids[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def qualified(
+        self,
+        *,
+        days: list[str],
+        times: list[str],
+        threshold: int,
+    ) -> tuple[Dict[Tuple[str, str], List[int]], Set[int]]:
+        # Options with fewer voters than the threshold can never qualify, so drop them up front.
+        day_masks = [(day, mask) for day in days if (mask := self.day_masks.get(day, 0)).bit_count() >= threshold]
+        time_masks = [
+            (time_label, mask)
+            for time_label in times
+            if (mask := self.time_masks.get(time_label, 0)).bit_count() >= threshold
+        ]
+        qualified: Dict[Tuple[str, str], List[int]] = {}
+        union = 0
+        for day, day_mask in day_masks:
+            for time_label, time_mask in time_masks:
+                both = day_mask & time_mask
+                if both.bit_count() < threshold:
+                    continue
+                qualified[(day, time_label)] = self.decode(both)
+                union |= both
+        return qualified, set(self.decode(union))
+
+
 def compute_qualified_slot_users(
     *,
     days: list[str],
@@ -19,15 +76,93 @@ def compute_qualified_slot_users(
     time_users: Dict[str, Set[int]],
     threshold: int,
 ) -> tuple[Dict[Tuple[str, str], List[int]], Set[int]]:
-    qualified: Dict[Tuple[str, str], List[int]] = {}
-    all_users: Set[int] = set()
+    return SlotVoteBitsets(day_users=day_users, time_users=time_users).qualified(
+        days=days,
+        times=times,
+        threshold=threshold,
+    )
+
+
+@dataclass(slots=True)
+class SlotDelta:
+    day: str
+    time: str
+    # "qualified", "unqualified" or "changed" (still qualified, different members).
+    change: str
+    users: List[int]
+
+
+class QualifiedSlotIndex:
+    """Qualified slots of one raid, kept current one vote toggle at a time.
+
+    A toggle on a day only touches that day's row (and a time only its column), and only
+    the slots where the voter also picked the other half can change.
+    """
+
+    def __init__(
+        self,
+        *,
+        days: list[str],
+        times: list[str],
+        day_users: Dict[str, Set[int]],
+        time_users: Dict[str, Set[int]],
+        threshold: int,
+    ) -> None:
+        self.days = list(days)
+        self.times = list(times)
+        self.day_users = {label: set(users) for label, users in day_users.items()}
+        self.time_users = {label: set(users) for label, users in time_users.items()}
+        self.threshold = int(threshold)
+        self._snapshot: tuple[Dict[Tuple[str, str], List[int]], Set[int]] | None = None
+        self.qualified, _ = SlotVoteBitsets(day_users=self.day_users, time_users=self.time_users).qualified(
+            days=self.days,
+            times=self.times,
+            threshold=self.threshold,
+        )
+
+    def toggle(self, *, kind: str, label: str, user_id: int, added: bool) -> List[SlotDelta]:
+        is_day = kind == "day"
+        own_users = self.day_users if is_day else self.time_users
+        voters = own_users.setdefault(label, set())
+        if added:
+            voters.add(user_id)
+        else:
+            voters.discard(user_id)
+        if label not in (self.days if is_day else self.times):
+            return []
 
-    for day in days:
-        for time_label in times:
-            users = sorted(day_users.get(day, set()).intersection(time_users.get(time_label, set())))
-            if len(users) < threshold:
+        other_labels = self.times if is_day else self.days
+        other_users = self.time_users if is_day else self.day_users
+        empty: Set[int] = set()
+        deltas: List[SlotDelta] = []
+        for other in other_labels:
+            if user_id not in other_users.get(other, empty):
                 continue
-            qualified[(day, time_label)] = users
-            all_users.update(users)
+            day, time_label = (label, other) if is_day else (other, label)
+            members = sorted(self.day_users.get(day, empty).intersection(self.time_users.get(time_label, empty)))
+            was_qualified = (day, time_label) in self.qualified
+            if len(members) >= self.threshold:
+                self.qualified[(day, time_label)] = members
+                deltas.append(SlotDelta(day, time_label, "changed" if was_qualified else "qualified", members))
+            elif was_qualified:
+                del self.qualified[(day, time_label)]
+                deltas.append(SlotDelta(day, time_label, "unqualified", []))
+        if deltas:
+            self._snapshot = None
+        return deltas
 
-    return qualified, all_users
+    def snapshot(self) -> tuple[Dict[Tuple[str, str], List[int]], Set[int]]:
+        """Qualified slots in day-major option order plus their users, memoised until the next change."""
+        if self._snapshot is None:
+            qualified = self.qualified
+            ordered = {
+                (day, time_label): qualified[(day, time_label)]
+                for day in self.days
+                for time_label in self.times
+                if (day, time_label) in qualified
+            }
+            users: Set[int] = set()
+            for members in ordered.values():
+                users.update(members)
+            self._snapshot = (ordered, users)
+        return self._snapshot
@@ -1,5 +1,6 @@
 from views.raid_views import (
     FinishButton,
+    RaidCalendarView,
     RaidCreateModal,
     RaidVoteView,
     SettingsIntervalsButton,
@@ -11,6 +12,7 @@ from views.raid_views import (
 
 __all__ = [
     "FinishButton",
+    "RaidCalendarView",
     "RaidCreateModal",
     "RaidVoteView",
     "SettingsIntervalsButton",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Any, TYPE_CHECKING
 
 from bot.discord_api import discord
@@ -713,6 +714,7 @@ class RaidVoteView(discord.ui.View):
             await self.bot._reply(interaction, "Nur im Server nutzbar.", ephemeral=True)
             return
 
+        started_at = time.monotonic()
         await self.bot._defer(interaction, ephemeral=True)
         values = [str(value) for value in ((interaction.data or {}).get("values") or [])]
         if not values:
@@ -749,22 +751,37 @@ class RaidVoteView(discord.ui.View):
 
             raid_id_for_refresh = int(raid.id)
 
-        if raid_id_for_refresh is not None:
-            await self.bot._sync_vote_ui_after_change(raid_id_for_refresh)
-
-        async with self.bot._state_lock:
-            persisted = await self.bot._persist(
-                dirty_tables={"raid_votes", "raid_posted_slots", "raids", "debug_cache"}
-            )
-
+        # Vote is committed in memory: ack now, planner/memberlists/raidlist + DB follow in the background.
         voter = _member_name(interaction.user) or str(interaction.user.id)
-        if not persisted:
-            await _safe_followup(interaction, "Stimme gesetzt, aber DB-Speicherung fehlgeschlagen.", ephemeral=True)
-            return
         await _safe_followup(interaction, f"Stimme aktualisiert fuer **{voter}**.", ephemeral=True)
+        self.bot._metrics.observe("vote_ack", time.monotonic() - started_at)
+        if raid_id_for_refresh is not None:
+            self.bot._enqueue_vote_ui_sync(raid_id_for_refresh, interaction=interaction, voted_at=started_at)
 
     async def on_day_select(self, interaction):
         await self._vote(interaction, kind="day")
 
     async def on_time_select(self, interaction):
         await self._vote(interaction, kind="time")
+
+
+class RaidCalendarView(discord.ui.View):
+    def __init__(self, bot: "RewriteDiscordBot", *, guild_id: int):
+        super().__init__(timeout=None)
+        self.bot = bot
+        self.guild_id = int(guild_id)
+
+        for label, action, delta in (("◀", "prev", -1), ("Heute", "today", 0), ("▶", "next", 1)):
+            button = discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label=label,
+                custom_id=f"raidcal:{self.guild_id}:{action}",
+            )
+            button.callback = self._navigate_callback(delta)
+            self.add_item(button)
+
+    def _navigate_callback(self, delta_months: int):
+        async def _callback(interaction):
+            await self.bot._navigate_raid_calendar(interaction, guild_id=self.guild_id, delta_months=delta_months)
+
+        return _callback